@@ -0,0 +1,111 @@
+"""Verificação do tempo de import e da inicialização preguiçosa dos módulos da pipeline.
+
+Cada módulo é importado em um processo novo com `python -X importtime`; a mediana de `--repeat`
+execuções é comparada com o orçamento de IMPORT_BUDGETS_MS. Em seguida as classes são instanciadas
+sem configuração da Azure nem do Banco e nenhum módulo de DEFERRED_MODULES pode ter sido carregado
+(os clientes e drivers só são criados no primeiro uso). Sai com código 1 se algum limite for violado.
+
+Uso:
+    python -m benchmarks.bench_import --repeat 5
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+from typing import Dict, List, Tuple
+
+# O pandas e o Pandera (os schemas são montados na instanciação) continuam no import; o SQLAlchemy
+# e o pyarrow.csv só carregam no primeiro uso.
+IMPORT_BUDGETS_MS = {
+    'src.data_source.csv_data_source': 1050,
+    'src.data_source.lake_loader': 650
+}
+
+DEFERRED_MODULES = ('azure.storage.blob', 'azure.identity', 'aiohttp', 'psycopg2', 'sqlalchemy', 'pyarrow.csv')
+
+CONSTRUCT_SCRIPT = """
+import sys, json
+from src.data_source.csv_data_source import CSVDataSource
+from src.data_source.lake_loader import LakeLoader
+CSVDataSource()
+LakeLoader()
+print(json.dumps([name for name in {modules!r} if name in sys.modules]))
+"""
+
+
+def _clean_env() -> Dict[str, str]:
+    """Ambiente sem as configurações da Azure e do Banco (a instanciação não pode depender delas)."""
+    return {
+        name: value for name, value in os.environ.items()
+        if not name.startswith(('AZURE_', 'DB_', 'STORAGE_BACKEND'))
+    }
+
+
+def import_time(module: str) -> Tuple[float, List[Tuple[str, float]]]:
+    """Importa o módulo em um processo novo e retorna o tempo total (ms) e os imports diretos mais lentos."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, check=True, env=_clean_env()
+    )
+
+    total, children = 0.0, []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if not cumulative.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip())) // 2
+        if name.strip() == module:
+            total = int(cumulative) / 1000
+        elif depth == 1:
+            children.append((name.strip(), int(cumulative) / 1000))
+
+    return total, sorted(children, key=lambda child: child[1], reverse=True)
+
+
+def loaded_deferred_modules() -> List[str]:
+    """Módulos de DEFERRED_MODULES carregados após importar e instanciar as classes da pipeline."""
+    result = subprocess.run(
+        [sys.executable, '-c', CONSTRUCT_SCRIPT.format(modules=DEFERRED_MODULES)],
+        capture_output=True, text=True, check=True, env=_clean_env()
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run(repeat: int, top: int) -> bool:
+    ok = True
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        samples = [import_time(module) for _ in range(repeat)]
+        median = statistics.median(total for total, _ in samples)
+        status = 'ok' if median <= budget else 'ACIMA DO ORÇAMENTO'
+        ok &= median <= budget
+
+        print(f'{module}: {median:.0f}ms (orçamento {budget}ms) - {status}')
+        for name, cumulative in samples[-1][1][:top]:
+            print(f'    {name}: {cumulative:.0f}ms')
+
+    try:
+        loaded = loaded_deferred_modules()
+    except subprocess.CalledProcessError as e:
+        print(f'Falha ao instanciar as classes sem configuração: {e.stderr.strip().splitlines()[-1]}')
+        return False
+
+    if loaded:
+        print(f'Módulos carregados na instanciação (deveriam ser adiados até o primeiro uso): {loaded}')
+    else:
+        print('Instanciação sem carregar SDK da Azure nem driver do Banco - ok')
+
+    return ok and not loaded
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Verifica o orçamento de tempo de import da pipeline.')
+    parser.add_argument('--repeat', type=int, default=5, help='Execuções por módulo (usa a mediana).')
+    parser.add_argument('--top', type=int, default=5, help='Imports diretos mais lentos exibidos por módulo.')
+    args = parser.parse_args()
+
+    sys.exit(0 if run(args.repeat, args.top) else 1)
@@ -0,0 +1,127 @@
+"""Benchmark dos perfis de escrita Parquet: tamanho, tempo de escrita e tempo de leitura por tabela.
+
+Lê os CSVs de src/docs/data; tabelas sem CSV (ex: website_sessions) são geradas de forma sintética.
+
+Uso:
+    python -m benchmarks.bench_parquet --codecs snappy zstd --rows 500000
+"""
+import time
+import argparse
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from pathlib import Path
+
+from src.parquet.profiles import PARQUET_CODECS, parquet_profile, write_parquet
+from src.schema.arrow_schema import arrow_schema
+from src.schema.schema_validation import (
+    OrderSchema,
+    OrderItemSchema,
+    OrderItemRefundSchema,
+    ProductSchema,
+    WebsiteSessionsSchema,
+    WebsitePageviewSchema
+)
+
+TABLE_SCHEMAS = {
+    'orders': OrderSchema,
+    'order_items': OrderItemSchema,
+    'order_item_refunds': OrderItemRefundSchema,
+    'products': ProductSchema,
+    'website_sessions': WebsiteSessionsSchema,
+    'website_pageviews': WebsitePageviewSchema
+}
+
+
+def make_website_sessions(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Gera um DataFrame sintético no formato da tabela website_sessions."""
+    rng = np.random.default_rng(seed)
+    paid = rng.random(rows) < 0.85
+
+    return pd.DataFrame({
+        'website_session_id': np.arange(1, rows + 1),
+        'created_at': pd.Timestamp('2012-03-19') + pd.to_timedelta(np.sort(rng.integers(0, 3 * 365 * 86400, rows)), unit='s'),
+        'user_id': rng.integers(1, rows, rows),
+        'is_repeat_session': rng.integers(0, 2, rows),
+        'utm_source': np.where(paid, rng.choice(['gsearch', 'bsearch', 'socialbook'], size=rows), None),
+        'utm_campaign': np.where(paid, rng.choice(['nonbrand', 'brand', 'pilot'], size=rows), None),
+        'utm_content': np.where(paid, rng.choice(['g_ad_1', 'g_ad_2', 'b_ad_1', 'b_ad_2'], size=rows), None),
+        'device_type': rng.choice(['mobile', 'desktop'], size=rows),
+        'http_referer': rng.choice(['https://www.gsearch.com', 'https://www.bsearch.com', None], size=rows)
+    })
+
+
+def make_website_pageviews(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Gera um DataFrame sintético no formato da tabela website_pageviews."""
+    rng = np.random.default_rng(seed)
+    urls = ['/home', '/products', '/the-original-mr-fuzzy', '/cart', '/shipping', '/billing', '/thank-you-for-your-order']
+
+    return pd.DataFrame({
+        'website_pageview_id': np.arange(1, rows + 1),
+        'created_at': pd.Timestamp('2012-03-19') + pd.to_timedelta(np.sort(rng.integers(0, 3 * 365 * 86400, rows)), unit='s'),
+        'website_session_id': rng.integers(1, max(rows // 3, 2), rows),
+        'pageview_url': rng.choice(urls, size=rows)
+    })
+
+
+SYNTHETIC_TABLES = {
+    'website_sessions': make_website_sessions,
+    'website_pageviews': make_website_pageviews
+}
+
+
+def load_tables(data_path: str, rows: int) -> dict:
+    """Carrega as seis tabelas como tabelas Arrow (CSV quando existir, sintética caso contrário)."""
+    tables = {}
+    for name, schema in TABLE_SCHEMAS.items():
+        file = Path(data_path) / f'{name}.csv'
+        df = pd.read_csv(file) if file.exists() else SYNTHETIC_TABLES[name](rows)
+        df = schema.validate(df)
+        tables[name] = pa.Table.from_pandas(df, schema=arrow_schema(schema), preserve_index=False)
+    return tables
+
+
+def run(data_path: str, rows: int, codecs, repeat: int):
+    tables = load_tables(data_path, rows)
+
+    results = []
+    for name, table in tables.items():
+        profiles = {'pyarrow_default': None}
+        for codec in codecs:
+            profiles[codec] = parquet_profile(name, codec=codec)
+            profiles[f'{codec}_no_dict'] = parquet_profile(name, codec=codec, dictionary=False)
+
+        for label, profile in profiles.items():
+            encode_time, decode_time = float('inf'), float('inf')
+            for _ in range(repeat):
+                start_time = time.perf_counter()
+                buffer = write_parquet(table, profile)
+                encode_time = min(encode_time, time.perf_counter() - start_time)
+
+                start_time = time.perf_counter()
+                pq.read_table(pa.BufferReader(buffer))
+                decode_time = min(decode_time, time.perf_counter() - start_time)
+
+            results.append({
+                'table': name,
+                'profile': label,
+                'rows': table.num_rows,
+                'size_mb': round(buffer.size / 1024 ** 2, 3),
+                'encode_s': round(encode_time, 4),
+                'decode_s': round(decode_time, 4)
+            })
+
+    return pd.DataFrame(results)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark dos perfis de escrita Parquet.')
+    parser.add_argument('--data-path', default='src/docs/data')
+    parser.add_argument('--rows', type=int, default=500000, help='Linhas das tabelas sintéticas.')
+    parser.add_argument('--codecs', nargs='+', default=list(PARQUET_CODECS))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(run(args.data_path, args.rows, args.codecs, args.repeat).to_string(index=False))
@@ -0,0 +1,80 @@
+"""Benchmark do DBConnection.upsert_data: 'orm' (linha a linha) x 'on_conflict' x 'copy_merge'.
+
+Usa o Banco configurado no .env (DB_*) e recria somente a tabela raw_orders.
+
+Uso:
+    python -m benchmarks.bench_upsert --rows 20000 --existing-ratio 0.5
+"""
+import time
+import argparse
+import numpy as np
+import pandas as pd
+
+from sqlalchemy import text
+
+from src.database.db_connection import DBConnection
+from src.database.db_model import OrderTable
+
+
+def make_orders(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Gera um DataFrame sintético no formato da tabela orders."""
+    rng = np.random.default_rng(seed)
+    price = rng.choice([29.99, 45.99, 49.99, 59.99], size=rows)
+
+    return pd.DataFrame({
+        'order_id': np.arange(1, rows + 1),
+        'created_at': pd.Timestamp('2012-03-19') + pd.to_timedelta(rng.integers(0, 3 * 365 * 86400, rows), unit='s'),
+        'website_session_id': rng.integers(1, rows * 10, rows),
+        'user_id': rng.integers(1, rows * 8, rows),
+        'primary_product_id': rng.integers(1, 5, rows),
+        'items_purchased': rng.integers(1, 3, rows),
+        'price_usd': price,
+        'cogs_usd': np.round(price * 0.4, 2)
+    })
+
+
+def run(rows: int, existing_ratio: float, batch_size: int, methods):
+    db_conn = DBConnection()
+    table = OrderTable.__table__
+    table.drop(db_conn.engine, checkfirst=True)
+    table.create(db_conn.engine)
+
+    df = make_orders(rows)
+    existing = df.iloc[:int(rows * existing_ratio)]
+
+    changed = df.copy()
+    changed['items_purchased'] = changed['items_purchased'] + 1
+
+    results = []
+    for method in methods:
+        with db_conn.engine.begin() as conn:
+            conn.execute(text(f'TRUNCATE "{table.name}"'))
+        if len(existing):
+            db_conn.insert_data({'orders': existing}, method='copy_csv')
+
+        start_time = time.perf_counter()
+        counts = db_conn.upsert_data({'orders': changed}, batch_size=batch_size, method=method)
+        elapsed = time.perf_counter() - start_time
+
+        results.append({
+            'method': method,
+            'rows': rows,
+            'inserted': counts['orders']['inserted'],
+            'updated': counts['orders']['updated'],
+            'seconds': round(elapsed, 3),
+            'rows_per_sec': round(rows / elapsed) if elapsed > 0 else 0
+        })
+
+    table.drop(db_conn.engine, checkfirst=True)
+    return pd.DataFrame(results)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark de upsert no PostgreSQL.')
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--existing-ratio', type=float, default=0.5)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--methods', nargs='+', default=list(DBConnection.UPSERT_METHODS))
+    args = parser.parse_args()
+
+    print(run(args.rows, args.existing_ratio, args.batch_size, args.methods).to_string(index=False))
@@ -0,0 +1,72 @@
+"""Benchmark da validação: Pandera (`schema.validate(lazy=True)`) x FastValidator, por tabela.
+
+Lê os CSVs de src/docs/data; tabelas sem CSV são geradas de forma sintética (ver bench_parquet).
+
+Uso:
+    python -m benchmarks.bench_validation --rows 1000000 --chunksize 200000
+"""
+import time
+import argparse
+import pandas as pd
+
+from pathlib import Path
+
+from benchmarks.bench_parquet import TABLE_SCHEMAS, SYNTHETIC_TABLES
+from src.schema.fast_validation import FastValidator
+
+
+def load_raw_tables(data_path: str, rows: int) -> dict:
+    """Carrega as seis tabelas sem validação, como o `transform_data` as entrega."""
+    tables = {}
+    for name in TABLE_SCHEMAS:
+        file = Path(data_path) / f'{name}.csv'
+        tables[name] = pd.read_csv(file) if file.exists() else SYNTHETIC_TABLES[name](rows)
+    return tables
+
+
+def timed(function, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+def run(data_path: str, rows: int, chunksize: int, repeat: int):
+    tables = load_raw_tables(data_path, rows)
+
+    results = []
+    for name, df in tables.items():
+        model = TABLE_SCHEMAS[name]
+        chunks = [df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize)]
+
+        def fast_chunked():
+            validator = FastValidator(model)
+            for chunk in chunks:
+                validator.validate(chunk)
+
+        pandera_seconds = timed(lambda: model.validate(df, lazy=True), repeat)
+        fast_seconds = timed(lambda: FastValidator(model).validate(df), repeat)
+
+        results.append({
+            'table': name,
+            'rows': len(df),
+            'pandera_s': round(pandera_seconds, 4),
+            'fast_s': round(fast_seconds, 4),
+            'fast_chunked_s': round(timed(fast_chunked, repeat), 4),
+            'speedup': round(pandera_seconds / fast_seconds, 1) if fast_seconds > 0 else None
+        })
+
+    return pd.DataFrame(results)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark da validação: Pandera x FastValidator.')
+    parser.add_argument('--data-path', default='src/docs/data')
+    parser.add_argument('--rows', type=int, default=1000000, help='Linhas das tabelas sintéticas.')
+    parser.add_argument('--chunksize', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(run(args.data_path, args.rows, args.chunksize, args.repeat).to_string(index=False))
@@ -0,0 +1,209 @@
+"""Gerador de dados sintéticos para as seis tabelas da pipeline, válidos para os schemas do Pandera.
+
+As tabelas são geradas juntas, em blocos de sessões, com as relações e cardinalidades da base
+original: ~2,5 pageviews por sessão, ~7% das sessões com pedido, 1 ou 2 itens por pedido e
+~5% dos itens reembolsados; os 4 produtos são fixos. A memória depende do bloco, não da escala.
+
+Uso:
+    python -m benchmarks.synthetic_data --rows 10000000 --output benchmarks/data/10000000
+"""
+import time
+import argparse
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+START_DATE = pd.Timestamp('2012-03-19')
+PERIOD_SECONDS = 3 * 365 * 86400
+
+PRODUCTS = pd.DataFrame({
+    'product_id': [1, 2, 3, 4],
+    'created_at': pd.to_datetime(['2012-03-19 08:00:00', '2013-01-06 13:00:00', '2013-12-12 09:00:00', '2014-02-05 10:00:00']),
+    'product_name': ['The Original Mr. Fuzzy', 'The Forever Love Bear', 'The Birthday Sugar Panda', 'The Hudson River Mini bear']
+})
+PRODUCT_PRICES = np.array([0.0, 49.99, 59.99, 45.99, 29.99])
+PRODUCT_COGS = np.array([0.0, 19.49, 22.49, 14.49, 9.49])
+PRODUCT_WEIGHTS = np.array([0.6, 0.2, 0.12, 0.08])
+
+UTM = {
+    'gsearch': (['nonbrand', 'brand'], ['g_ad_1', 'g_ad_2']),
+    'bsearch': (['nonbrand', 'brand'], ['b_ad_1', 'b_ad_2']),
+    'socialbook': (['pilot', 'desktop_targeted'], ['social_ad_1', 'social_ad_2'])
+}
+PAGEVIEW_URLS = ['/home', '/lander-1', '/products', '/the-original-mr-fuzzy', '/cart', '/shipping', '/billing', '/thank-you-for-your-order']
+
+PAGEVIEWS_PER_SESSION = 2.5
+ORDER_RATE = 0.07
+SECOND_ITEM_RATE = 0.25
+REFUND_RATE = 0.05
+
+# Linhas de todas as tabelas por sessão: 1 + 2,5 + 0,07 * (1 + 1,25 * (1 + 0,05)).
+ROWS_PER_SESSION = 1 + PAGEVIEWS_PER_SESSION + ORDER_RATE * (1 + (1 + SECOND_ITEM_RATE) * (1 + REFUND_RATE))
+
+
+def _timestamps(rng: np.random.Generator, positions: np.ndarray, total: int) -> np.ndarray:
+    """Datas crescentes no período, proporcionais à posição do registro (com ruído de até 1 minuto)."""
+    seconds = positions / max(total, 1) * PERIOD_SECONDS + rng.integers(0, 60, len(positions))
+    return (START_DATE + pd.to_timedelta(np.sort(seconds.astype('int64')), unit='s')).to_numpy()
+
+
+def generate_chunk(
+        rng: np.random.Generator,
+        first_session: int,
+        sessions: int,
+        total_sessions: int,
+        next_ids: Dict[str, int]
+    ) -> Dict[str, pd.DataFrame]:
+    """Gera um bloco de sessões e os registros dependentes (pageviews, pedidos, itens e reembolsos).
+
+    Args:
+        rng (np.random.Generator): Gerador de números aleatórios.
+        first_session (int): Id da primeira sessão do bloco.
+        sessions (int): Quantidade de sessões do bloco.
+        total_sessions (int): Total de sessões (distribui as datas no período).
+        next_ids (Dict[str, int]): Próximo id de cada tabela; atualizado ao fim do bloco.
+
+    Returns:
+        Dict[str, DataFrame]: Bloco de cada tabela (exceto products).
+    """
+    session_ids = np.arange(first_session, first_session + sessions)
+    session_at = _timestamps(rng, session_ids - 1, total_sessions)
+
+    users = np.maximum(1, (session_ids * rng.uniform(0.75, 0.85, sessions)).astype('int64'))
+    repeat = rng.random(sessions) < 0.15
+    sources = rng.choice([*UTM, None], size=sessions, p=[0.7, 0.12, 0.03, 0.15])
+    paid = sources != None  # noqa: E711
+    campaign = np.array([rng.choice(UTM[source][0]) if source else None for source in sources], dtype=object)
+    content = np.array([rng.choice(UTM[source][1]) if source else None for source in sources], dtype=object)
+    referer = np.where(
+        paid,
+        np.char.add('https://www.', np.char.add(np.where(paid, sources, '').astype(str), '.com')).astype(object),
+        rng.choice(['https://www.gsearch.com', None], size=sessions)
+    )
+
+    website_sessions = pd.DataFrame({
+        'website_session_id': session_ids,
+        'created_at': session_at,
+        'user_id': users,
+        'is_repeat_session': repeat.astype('int64'),
+        'utm_source': sources,
+        'utm_campaign': campaign,
+        'utm_content': content,
+        'device_type': rng.choice(['mobile', 'desktop'], size=sessions, p=[0.3, 0.7]),
+        'http_referer': referer
+    })
+
+    views = rng.poisson(PAGEVIEWS_PER_SESSION - 1, sessions) + 1
+    view_session = np.repeat(np.arange(sessions), views)
+    view_step = np.arange(len(view_session)) - np.repeat(np.cumsum(views) - views, views)
+    website_pageviews = pd.DataFrame({
+        'website_pageview_id': np.arange(next_ids['website_pageviews'], next_ids['website_pageviews'] + len(view_session)),
+        'created_at': session_at[view_session] + pd.to_timedelta(view_step * 45, unit='s').to_numpy(),
+        'website_session_id': session_ids[view_session],
+        'pageview_url': np.array(PAGEVIEW_URLS, dtype=object)[np.minimum(view_step, len(PAGEVIEW_URLS) - 1)]
+    })
+
+    ordered = np.flatnonzero(rng.random(sessions) < ORDER_RATE)
+    order_ids = np.arange(next_ids['orders'], next_ids['orders'] + len(ordered))
+    order_at = session_at[ordered] + pd.to_timedelta(rng.integers(60, 1800, len(ordered)), unit='s').to_numpy()
+    primary = rng.choice([1, 2, 3, 4], size=len(ordered), p=PRODUCT_WEIGHTS)
+    items = 1 + (rng.random(len(ordered)) < SECOND_ITEM_RATE)
+    second = (primary % 4) + 1
+
+    item_order = np.repeat(np.arange(len(ordered)), items)
+    is_primary = (np.arange(len(item_order)) - np.repeat(np.cumsum(items) - items, items)) == 0
+    item_product = np.where(is_primary, primary[item_order], second[item_order])
+
+    orders = pd.DataFrame({
+        'order_id': order_ids,
+        'created_at': order_at,
+        'website_session_id': session_ids[ordered],
+        'user_id': users[ordered],
+        'primary_product_id': primary,
+        'items_purchased': items,
+        'price_usd': np.bincount(item_order, PRODUCT_PRICES[item_product], len(ordered)).round(2),
+        'cogs_usd': np.bincount(item_order, PRODUCT_COGS[item_product], len(ordered)).round(2)
+    })
+
+    item_ids = np.arange(next_ids['order_items'], next_ids['order_items'] + len(item_order))
+    order_items = pd.DataFrame({
+        'order_item_id': item_ids,
+        'created_at': order_at[item_order],
+        'order_id': order_ids[item_order],
+        'product_id': item_product,
+        'is_primary_item': is_primary.astype('int64'),
+        'price_usd': PRODUCT_PRICES[item_product],
+        'cogs_usd': PRODUCT_COGS[item_product]
+    })
+
+    refunded = np.flatnonzero(rng.random(len(item_ids)) < REFUND_RATE)
+    order_item_refunds = pd.DataFrame({
+        'order_item_refund_id': np.arange(next_ids['order_item_refunds'], next_ids['order_item_refunds'] + len(refunded)),
+        'created_at': order_at[item_order[refunded]] + pd.to_timedelta(rng.integers(1, 30, len(refunded)), unit='D').to_numpy(),
+        'order_item_id': item_ids[refunded],
+        'order_id': order_ids[item_order[refunded]],
+        'refund_amount_usd': PRODUCT_PRICES[item_product[refunded]]
+    })
+
+    chunk = {
+        'website_sessions': website_sessions,
+        'website_pageviews': website_pageviews,
+        'orders': orders,
+        'order_items': order_items,
+        'order_item_refunds': order_item_refunds
+    }
+    for name in next_ids:
+        next_ids[name] += len(chunk[name])
+    return chunk
+
+
+def generate_tables(
+        rows: int,
+        output: Union[str, Path],
+        seed: Optional[int] = 42,
+        chunk_sessions: Optional[int] = 500000
+    ) -> Dict[str, int]:
+    """Gera os CSVs das seis tabelas em `output`, com aproximadamente `rows` linhas no total.
+
+    Args:
+        rows (int): Total aproximado de linhas (somando as seis tabelas).
+        output (Union[str, Path]): Diretório de saída (um `{tabela}.csv` por tabela).
+        seed (Optional[int]): Semente, para gerar sempre os mesmos dados.
+        chunk_sessions (Optional[int]): Sessões geradas por bloco (limita a memória).
+
+    Returns:
+        Dict[str, int]: Quantidade de linhas geradas por tabela.
+    """
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+
+    rng = np.random.default_rng(seed)
+    total_sessions = max(1, int(rows / ROWS_PER_SESSION))
+    next_ids = {'website_pageviews': 1, 'orders': 1, 'order_items': 1, 'order_item_refunds': 1}
+
+    PRODUCTS.to_csv(output / 'products.csv', index=False)
+    counts = {'products': len(PRODUCTS)}
+
+    for first_session in range(1, total_sessions + 1, chunk_sessions):
+        sessions = min(chunk_sessions, total_sessions - first_session + 1)
+        for name, df in generate_chunk(rng, first_session, sessions, total_sessions, next_ids).items():
+            df.to_csv(output / f'{name}.csv', mode='a' if name in counts else 'w', header=name not in counts, index=False)
+            counts[name] = counts.get(name, 0) + len(df)
+
+    return counts
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Gera CSVs sintéticos das seis tabelas da pipeline.')
+    parser.add_argument('--rows', type=int, default=1000000, help='Total aproximado de linhas (seis tabelas).')
+    parser.add_argument('--output', default=None, help='Diretório de saída (padrão: benchmarks/data/{rows}).')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--chunk-sessions', type=int, default=500000)
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    counts = generate_tables(args.rows, args.output or f'benchmarks/data/{args.rows}', args.seed, args.chunk_sessions)
+    print(pd.Series(counts, name='rows').to_string())
+    print(f'{sum(counts.values())} linhas geradas em {time.perf_counter() - start_time:.1f}s.')
@@ -0,0 +1,150 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import logging
+import threading
+
+from pathlib import Path
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# ioctl do Linux para clonar um arquivo por reflink (btrfs, XFS); em outros sistemas o arquivo é copiado.
+FICLONE = 0x40049409
+
+
+class FileCache:
+    """Cache local em disco, com chave + tag de versão (ex: nome do blob + ETag) e despejo LRU por tamanho."""
+
+    MANIFEST_NAME = 'manifest.json'
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: Optional[int] = 1024 ** 3):
+        """Inicializa a classe FileCache.
+
+        Args:
+            cache_dir (Union[str, Path]): Diretório do cache.
+            max_bytes (Optional[int]): Tamanho máximo do cache; os itens menos usados são removidos ao exceder.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._manifest_path = self.cache_dir / self.MANIFEST_NAME
+        self._entries = self._load_manifest()
+
+    def _load_manifest(self) -> dict:
+        """Carrega o manifesto do cache (descartando entradas cujo arquivo não existe mais)."""
+        if not self._manifest_path.exists():
+            return {}
+
+        try:
+            entries = json.loads(self._manifest_path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f'Manifesto do cache inválido, recriando: {str(e)}')
+            return {}
+
+        return {key: entry for key, entry in entries.items() if (self.cache_dir / entry['file']).exists()}
+
+    def _save_manifest(self):
+        temp_path = self._manifest_path.with_suffix('.tmp')
+        temp_path.write_text(json.dumps(self._entries))
+        os.replace(temp_path, self._manifest_path)
+        self._dirty = False
+
+    def _file_name(self, key: str) -> str:
+        return hashlib.sha1(key.encode('utf-8')).hexdigest() + Path(key).suffix
+
+    def get(self, key: str, tag: str) -> Optional[Path]:
+        """Retorna o arquivo em cache se a tag coincidir.
+
+        O acesso é registrado apenas em memória; o manifesto é gravado no próximo `put` ou em `flush`.
+
+        Args:
+            key (str): Chave do item (ex: nome do blob).
+            tag (str): Versão esperada (ex: ETag).
+
+        Returns:
+            Optional[Path]: Caminho do arquivo em cache, ou None se ausente/desatualizado.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry['tag'] != tag:
+                return None
+
+            entry['last_access'] = time.time()
+            self._dirty = True
+            return self.cache_dir / entry['file']
+
+    def flush(self):
+        """Grava no manifesto os acessos registrados por `get` desde a última gravação."""
+        with self._lock:
+            if self._dirty:
+                self._save_manifest()
+
+    def put(self, key: str, tag: str, data: Union[bytes, str, Path]) -> Path:
+        """Grava um item no cache (substituindo versões anteriores) e aplica o despejo LRU.
+
+        Args:
+            key (str): Chave do item (ex: nome do blob).
+            tag (str): Versão do item (ex: ETag).
+            data (Union[bytes, str, Path]): Conteúdo, ou caminho de um arquivo local a ser copiado.
+
+        Returns:
+            Path: Caminho do arquivo em cache.
+        """
+        file_name = self._file_name(key)
+        path = self.cache_dir / file_name
+        temp_path = path.with_name(path.name + '.tmp')
+
+        if isinstance(data, (str, Path)):
+            clone_or_copy(data, temp_path)
+        else:
+            temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            self._entries[key] = {
+                'tag': tag,
+                'file': file_name,
+                'size': path.stat().st_size,
+                'last_access': time.time()
+            }
+            self._evict(keep=key)
+            self._save_manifest()
+
+        return path
+
+    def _evict(self, keep: Optional[str] = None):
+        """Remove os itens menos usados recentemente até o cache caber em `max_bytes` (exceto `keep`)."""
+        total = sum(entry['size'] for entry in self._entries.values())
+        for key, entry in sorted(self._entries.items(), key=lambda item: item[1]['last_access']):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+
+            (self.cache_dir / entry['file']).unlink(missing_ok=True)
+            del self._entries[key]
+            total -= entry['size']
+            logger.info(f'Cache: {key} removido (LRU).')
+
+
+def clone_or_copy(source: Union[str, Path], dest: Union[str, Path]):
+    """Copia `source` para `dest`, usando reflink (cópia sob demanda do sistema de arquivos) quando disponível.
+
+    Diferente de um hard link, `dest` não compartilha o inode com `source`: gravações em um
+    dos arquivos (ex: o arquivo em `download_path`) não alteram o outro (ex: o arquivo em cache).
+    """
+    dest = Path(dest)
+    dest.unlink(missing_ok=True)
+    try:
+        import fcntl
+
+        with open(source, 'rb') as src_file, open(dest, 'wb') as dest_file:
+            fcntl.ioctl(dest_file.fileno(), FICLONE, src_file.fileno())
+    except (ImportError, OSError):
+        shutil.copyfile(source, dest)
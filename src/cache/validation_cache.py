@@ -0,0 +1,129 @@
+import os
+import inspect
+import hashlib
+import logging
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pandera.pandas as pandera
+
+from pathlib import Path
+from typing import Optional, Type, Union
+
+from src.cache.file_cache import FileCache
+from src.parquet.profiles import write_parquet
+
+logger = logging.getLogger(__name__)
+
+
+def schema_version(model: Type[pandera.DataFrameModel]) -> str:
+    """Hash da definição de um DataFrameModel: muda sempre que um campo, check ou Config muda.
+
+    Usa o código-fonte da classe e, como garantia, a representação do schema compilado.
+    """
+    try:
+        source = inspect.getsource(model)
+    except (OSError, TypeError):
+        source = ''
+    return hashlib.sha256(f'{source}\n{model.to_schema()!r}'.encode('utf-8')).hexdigest()[:16]
+
+
+def file_fingerprint(path: Union[str, Path], content_hash: Optional[bool] = False) -> str:
+    """Identifica a versão de um arquivo por tamanho + mtime, ou pelo SHA-256 do conteúdo."""
+    if content_hash:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    stat = os.stat(path)
+    return f'{stat.st_size}-{stat.st_mtime_ns}'
+
+
+class ValidationCache:
+    """Cache persistente dos DataFrames já validados, gravados em Parquet com os tipos do schema.
+
+    A chave é o caminho do arquivo de origem e a tag combina a versão do arquivo, a versão do
+    schema, o engine de leitura, o validador e o limite de rejeição da quarentena; qualquer
+    mudança em um deles invalida a entrada. Só são gravados arquivos validados sem rejeições.
+    """
+
+    def __init__(
+            self,
+            cache_dir: Union[str, Path],
+            max_bytes: Optional[int] = 2 * 1024 ** 3,
+            content_hash: Optional[bool] = False
+        ):
+        """Inicializa a classe ValidationCache.
+
+        Args:
+            cache_dir (Union[str, Path]): Diretório do cache.
+            max_bytes (Optional[int]): Tamanho máximo do cache (despejo LRU).
+            content_hash (Optional[bool]): Usa o SHA-256 do arquivo em vez de tamanho + mtime.
+        """
+        self.cache = FileCache(cache_dir, max_bytes=max_bytes)
+        self.content_hash = content_hash
+
+    def _key(self, path: Union[str, Path]) -> str:
+        return f'{Path(path).resolve()}.parquet'
+
+    def tag(
+            self,
+            path: Union[str, Path],
+            model: Type[pandera.DataFrameModel],
+            engine: Optional[str] = 'pandas',
+            validation_engine: Optional[str] = 'pandera',
+            reject_threshold: Optional[float] = None
+        ) -> str:
+        """Versão da entrada de um arquivo; calcule-a antes de ler o arquivo e use-a no `put`.
+
+        Args:
+            path (Union[str, Path]): Arquivo de origem.
+            model (Type[DataFrameModel]): Schema de validação.
+            engine (Optional[str]): Engine de leitura ('pandas' ou 'arrow').
+            validation_engine (Optional[str]): Validador ('pandera' ou 'fast').
+            reject_threshold (Optional[float]): Limite de rejeição da quarentena, ou None sem quarentena.
+
+        Returns:
+            str: Versão da entrada.
+        """
+        return (
+            f'{file_fingerprint(path, self.content_hash)}:{schema_version(model)}:{engine}'
+            f':{validation_engine}:{reject_threshold}'
+        )
+
+    def get(self, path: Union[str, Path], tag: str) -> Optional[pa.Table]:
+        """Retorna a tabela validada do arquivo, se a versão (ver `tag`) coincidir.
+
+        Args:
+            path (Union[str, Path]): Arquivo de origem.
+            tag (str): Versão esperada.
+
+        Returns:
+            Optional[pa.Table]: Tabela Arrow (use `to_pandas()` para o DataFrame tipado), ou None.
+        """
+        cached = self.cache.get(self._key(path), tag)
+        if cached is None:
+            return None
+        self.cache.flush()
+
+        try:
+            return pq.read_table(cached)
+        except (OSError, pa.ArrowInvalid) as e:
+            logger.warning(f'Cache de validação de {path} ilegível, ignorando: {str(e)}')
+            return None
+
+    def put(self, path: Union[str, Path], tag: str, df: pd.DataFrame) -> Path:
+        """Grava o DataFrame validado de um arquivo (substituindo versões anteriores).
+
+        Args:
+            path (Union[str, Path]): Arquivo de origem.
+            tag (str): Versão calculada antes da leitura do arquivo.
+            df (DataFrame): DataFrame validado.
+
+        Returns:
+            Path: Caminho do arquivo em cache.
+        """
+        data = write_parquet(pa.Table.from_pandas(df, preserve_index=False))
+        return self.cache.put(self._key(path), tag, data)
@@ -0,0 +1,346 @@
+import os
+import time
+import asyncio
+import logging
+
+from pathlib import Path
+from typing import List, Union, BinaryIO, Dict, Optional, Iterable, Any
+
+from azure.core.exceptions import ResourceNotFoundError
+from azure.identity.aio import ClientSecretCredential
+from azure.storage.blob.aio import BlobServiceClient
+
+from src.environment import setup_environment
+from src.cloud.storage_backend import data_size, transfer_stats
+
+logger = logging.getLogger(__name__)
+
+class AsyncAzureCloud:
+    """Classe responsável por fazer as conexões assíncronas com a Azure (azure.storage.blob.aio).
+
+    Os clientes são criados no primeiro uso, dentro do event loop corrente, e descartados em
+    `close()`; assim a mesma instância pode ser usada em execuções de `asyncio.run` distintas.
+    """
+
+    def __init__(self, max_parallel: Optional[int] = 32, max_concurrency: Optional[int] = 4):
+        """Inicializa a classe AsyncAzureCloud.
+
+        Args:
+            max_parallel (Optional[int]): Quantidade de blobs transferidos ao mesmo tempo em `upload_many`/`download_many`.
+            max_concurrency (Optional[int]): Conexões paralelas por blob (transferência em blocos do SDK).
+        """
+        setup_environment()
+
+        self.client_id = os.getenv('AZURE_CLIENT_ID')
+        self.tenant_id = os.getenv('AZURE_TENANT_ID')
+        self.client_secret = os.getenv('AZURE_CLIENT_SECRET')
+        self.account_url = os.getenv('AZURE_STORAGE_URL')
+        self.connection_string = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
+        self.container_name = os.getenv('AZURE_CONTAINER_NAME')
+        self.blob_prefix = os.getenv('AZURE_BLOB_PREFIX')
+
+        self.max_parallel = max_parallel
+        self.max_concurrency = max_concurrency
+
+        self.credentials = None
+        self.blob_service_client = None
+        self.container_client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _container(self):
+        """Retorna o cliente do Container, criando os clientes no event loop corrente se necessário."""
+        if self.container_client is not None:
+            return self.container_client
+
+        try:
+            if self.connection_string:
+                self.blob_service_client = BlobServiceClient.from_connection_string(self.connection_string)
+            else:
+                self.credentials = ClientSecretCredential(
+                    client_id=self.client_id,
+                    tenant_id=self.tenant_id,
+                    client_secret=self.client_secret
+                )
+                self.blob_service_client = BlobServiceClient(
+                    account_url=self.account_url,
+                    credential=self.credentials
+                )
+
+            self.container_client = self.blob_service_client.get_container_client(self.container_name)
+            return self.container_client
+
+        except Exception as e:
+            logger.error(f'Erro ao se conectar com a Azure: {str(e)}')
+            raise
+
+    async def close(self):
+        """Fecha as conexões abertas."""
+        if self.blob_service_client is not None:
+            await self.blob_service_client.close()
+        if self.credentials is not None:
+            await self.credentials.close()
+
+        self.credentials = None
+        self.blob_service_client = None
+        self.container_client = None
+
+    async def upload_data(
+            self,
+            blob_name: str,
+            data: Union[bytes, BinaryIO],
+            metadata: Optional[Dict[str, str]] = None
+        ) -> str:
+        """Faz o Upload de Arquivos para a Azure.
+
+        Args:
+            blob_name (str): Nome do arquivo a ser salvo.
+            data (Union[bytes, BinaryIO]): Conteúdo binário do arquivo, ou arquivo aberto.
+            metadata (Optional[Dict[str, str]]): Metadados gravados no blob (ex: hash do conteúdo).
+
+        Returns:
+            str: ETag do blob enviado.
+        """
+        try:
+            blob_client = self._container().get_blob_client(blob_name)
+            result = await blob_client.upload_blob(
+                data,
+                overwrite=True,
+                metadata=metadata,
+                max_concurrency=self.max_concurrency
+            )
+            logger.info(f'Arquivo {blob_name} salvo com sucesso.')
+            return result.get('etag')
+
+        except Exception as e:
+            logger.error(f'Erro ao salvar dados: {str(e)}')
+            raise
+
+    async def download_data(self, blob_name: str) -> bytes:
+        """Faz o Download de Arquivos da Azure.
+
+        Args:
+            blob_name (str): Nome do arquivo a ser baixado.
+
+        Returns:
+            bytes: Conteúdo binário do arquivo.
+        """
+        try:
+            blob_client = self._container().get_blob_client(blob_name)
+            downloader = await blob_client.download_blob(max_concurrency=self.max_concurrency)
+            data = await downloader.readall()
+
+            logger.info(f'Download concluído com sucesso para: {blob_name}')
+            return data
+
+        except Exception as e:
+            logger.error(f'Erro ao baixar aquivo: {str(e)}')
+            raise
+
+    async def download_to_file(self, blob_name: str, path: Union[str, Path]) -> int:
+        """Faz o Download de um Arquivo da Azure direto para o disco, bloco a bloco.
+
+        As gravações em disco são feitas em uma thread (`asyncio.to_thread`), sem bloquear o event loop.
+
+        Args:
+            blob_name (str): Nome do arquivo a ser baixado.
+            path (Union[str, Path]): Caminho de destino.
+
+        Returns:
+            int: Quantidade de bytes baixados.
+        """
+        try:
+            blob_client = self._container().get_blob_client(blob_name)
+            downloader = await blob_client.download_blob(max_concurrency=self.max_concurrency)
+
+            size = 0
+            file = await asyncio.to_thread(open, path, 'wb')
+            try:
+                async for chunk in downloader.chunks():
+                    await asyncio.to_thread(file.write, chunk)
+                    size += len(chunk)
+            finally:
+                await asyncio.to_thread(file.close)
+            return size
+
+        except Exception as e:
+            logger.error(f'Erro ao baixar aquivo: {str(e)}')
+            raise
+
+    async def get_blob_metadata(self, blob_name: str) -> Dict[str, str]:
+        """Retorna os metadados de um blob.
+
+        Args:
+            blob_name (str): Nome do arquivo.
+
+        Returns:
+            Dict[str, str]: Metadados do blob, ou dicionário vazio se o blob não existir.
+        """
+        try:
+            properties = await self._container().get_blob_client(blob_name).get_blob_properties()
+            return dict(properties.metadata or {})
+
+        except ResourceNotFoundError:
+            return {}
+
+        except Exception as e:
+            logger.error(f'Erro ao consultar metadados de {blob_name}: {str(e)}')
+            raise
+
+    async def delete_blob(self, blob_name: str):
+        """Remove um blob do Container (blobs inexistentes são ignorados).
+
+        Args:
+            blob_name (str): Nome do arquivo.
+        """
+        try:
+            await self._container().delete_blob(blob_name)
+            logger.info(f'Arquivo {blob_name} removido.')
+
+        except ResourceNotFoundError:
+            return
+
+        except Exception as e:
+            logger.error(f'Erro ao remover {blob_name}: {str(e)}')
+            raise
+
+    async def list_blobs_properties(self, prefix: Optional[str] = None) -> Dict[str, str]:
+        """Lista arquivos no Container da Azure com seus ETags.
+
+        Args:
+            prefix (Optional[str]): Prefixo dos blobs (padrão: AZURE_BLOB_PREFIX).
+
+        Returns:
+            Dict[str, str]: Dicionário com {'nome do blob': ETag}.
+        """
+        logger.info('Listando arquivos...')
+
+        try:
+            blobs = {
+                blob.name: blob.etag
+                async for blob in self._container().list_blobs(name_starts_with=prefix or self.blob_prefix)
+            }
+
+            logger.info(f'{len(blobs)} arquivos listados.')
+            return blobs
+
+        except Exception as e:
+            logger.error(f'Erro ao listar arquivos: {str(e)}')
+            raise
+
+    async def list_blobs_file(self, prefix: Optional[str] = None) -> List[str]:
+        """Lista arquivos no Container da Azure.
+
+        Args:
+            prefix (Optional[str]): Prefixo dos blobs (padrão: AZURE_BLOB_PREFIX).
+
+        Returns:
+            List[str]: Lista com os diretórios dos arquivos (ex:'raw_data/products').
+        """
+        logger.info('Listando arquivos...')
+
+        try:
+            blobs = [
+                blob.name
+                async for blob in self._container().list_blobs(name_starts_with=prefix or self.blob_prefix)
+            ]
+
+            logger.info(f'{len(blobs)} arquivos listados.')
+            return blobs
+
+        except Exception as e:
+            logger.error(f'Erro ao listar arquivos: {str(e)}')
+            raise
+
+    async def upload_many(
+            self,
+            items: Dict[str, Union[bytes, BinaryIO]],
+            metadata: Optional[Dict[str, Dict[str, str]]] = None
+        ) -> Dict[str, Dict[str, Any]]:
+        """Faz o Upload de vários Arquivos de forma concorrente (até `max_parallel` ao mesmo tempo).
+
+        Args:
+            items (Dict[str, Union[bytes, BinaryIO]]): Dicionário com {'nome do blob': conteúdo}.
+            metadata (Optional[Dict[str, Dict[str, str]]]): Metadados por blob ({'nome do blob': {...}}).
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Estatísticas por blob ({'etag', 'bytes', 'seconds', 'mb_per_sec'}).
+        """
+        logger.info(f'Salvando {len(items)} arquivo(s) na Azure...')
+
+        metadata = metadata or {}
+
+        async def upload_one(blob_name, data):
+            start_time = time.perf_counter()
+            size = data_size(data)
+            etag = await self.upload_data(blob_name, data, metadata.get(blob_name))
+            stats = transfer_stats(blob_name, size, time.perf_counter() - start_time)
+            stats['etag'] = etag
+            return stats
+
+        return await self._run_many(upload_one, items.items())
+
+    async def download_many(self, blob_names: Iterable[str], dest_dir: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+        """Faz o Download de vários Arquivos de forma concorrente, gravando direto em disco.
+
+        Args:
+            blob_names (Iterable[str]): Nomes dos blobs a serem baixados.
+            dest_dir (Union[str, Path]): Diretório de destino (o arquivo mantém o caminho do blob, ex: 'raw_data/orders.parquet').
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Estatísticas por blob ({'path', 'bytes', 'seconds', 'mb_per_sec'}).
+        """
+        dest_dir = Path(dest_dir)
+
+        async def download_one(blob_name, path):
+            start_time = time.perf_counter()
+            await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+            size = await self.download_to_file(blob_name, path)
+            stats = transfer_stats(blob_name, size, time.perf_counter() - start_time)
+            stats['path'] = path
+            return stats
+
+        items = [(blob_name, dest_dir / blob_name) for blob_name in blob_names]
+        logger.info(f'Fazendo Download de {len(items)} arquivo(s)...')
+        return await self._run_many(download_one, items)
+
+    async def delete_blobs(self, blob_names: Iterable[str]):
+        """Remove vários blobs de forma concorrente (até `max_parallel` ao mesmo tempo).
+
+        Args:
+            blob_names (Iterable[str]): Nomes dos blobs a serem removidos.
+        """
+        items = [(blob_name, None) for blob_name in blob_names]
+        logger.info(f'Removendo {len(items)} arquivo(s)...')
+        await self._run_many(lambda blob_name, _: self.delete_blob(blob_name), items)
+
+    async def _run_many(self, transfer, items) -> Dict[str, Dict[str, Any]]:
+        """Executa as transferências com no máximo `max_parallel` em andamento; erros são relançados ao final."""
+        semaphore = asyncio.Semaphore(self.max_parallel)
+
+        async def bounded(blob_name, value):
+            async with semaphore:
+                return await transfer(blob_name, value)
+
+        items = list(items)
+        results = await asyncio.gather(
+            *(bounded(blob_name, value) for blob_name, value in items),
+            return_exceptions=True
+        )
+
+        stats, errors = {}, {}
+        for (blob_name, _), result in zip(items, results):
+            if isinstance(result, Exception):
+                errors[blob_name] = result
+            else:
+                stats[blob_name] = result
+
+        if errors:
+            logger.error(f'{len(errors)} transferência(s) falharam: {list(errors)}')
+            raise next(iter(errors.values()))
+
+        return stats
@@ -1,75 +1,172 @@
+import io
 import os
 import logging
+import threading
 
 from pathlib import Path
-from dotenv import load_dotenv
-from typing import List
+from typing import List, Union, BinaryIO, Dict, Optional
 
-from azure.identity import ClientSecretCredential
-from azure.storage.blob import BlobServiceClient
+from src.cloud.storage_backend import StorageBackend
+from src.environment import setup_environment
 
 logger = logging.getLogger(__name__)
 
-class AzureCloud:
-    """Classe responsável por fazer as conexões com a Azure."""
+class BlobReader(io.RawIOBase):
+    """Arquivo somente-leitura, com seek, sobre um blob: cada leitura é um download por intervalo (range).
 
-    def __init__(self):
-        """Inicializa a classe AzureCloud"""
-        load_dotenv()
+    Permite que leitores como o `pyarrow.parquet.ParquetFile` busquem apenas o rodapé e os
+    row groups necessários, sem baixar o blob inteiro.
+    """
 
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+    def __init__(self, blob_client, size: int):
+        """Inicializa a classe BlobReader.
+
+        Args:
+            blob_client (BlobClient): Cliente do blob.
+            size (int): Tamanho do blob, em bytes.
+        """
+        self._blob_client = blob_client
+        self._size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._position = max(0, min(offset, self._size))
+        return self._position
+
+    def readinto(self, b) -> int:
+        length = min(len(b), self._size - self._position)
+        if length <= 0:
+            return 0
+
+        data = self._blob_client.download_blob(offset=self._position, length=length).readall()
+        b[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
+class AzureCloud(StorageBackend):
+    """Classe responsável por fazer as conexões com a Azure.
+
+    Os clientes (credencial, BlobServiceClient e Container) são criados no primeiro acesso ao
+    Container, e não na construção; instanciar a classe não exige configuração da Azure.
+    """
+
+    def __init__(self, max_workers: Optional[int] = 8, max_concurrency: Optional[int] = 4):
+        """Inicializa a classe AzureCloud
+
+        Se `AZURE_STORAGE_CONNECTION_STRING` estiver definida (ex: emulador Azurite), a conexão é
+        feita pela connection string; caso contrário, via ClientSecretCredential.
+
+        Args:
+            max_workers (Optional[int]): Quantidade de blobs transferidos ao mesmo tempo em `upload_many`/`download_many`.
+            max_concurrency (Optional[int]): Conexões paralelas por blob (transferência em blocos do SDK).
+        """
+        setup_environment()
+
+        super().__init__(max_workers=max_workers, blob_prefix=os.getenv('AZURE_BLOB_PREFIX'))
 
         self.client_id = os.getenv('AZURE_CLIENT_ID')
         self.tenant_id = os.getenv('AZURE_TENANT_ID')
         self.client_secret = os.getenv('AZURE_CLIENT_SECRET')
         self.account_url = os.getenv('AZURE_STORAGE_URL')
+        self.connection_string = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
         self.container_name = os.getenv('AZURE_CONTAINER_NAME')
-        self.blob_prefix = os.getenv('AZURE_BLOB_PREFIX')
 
-        try:
-            self.credentials = ClientSecretCredential(
-                client_id=self.client_id,
-                tenant_id=self.tenant_id,
-                client_secret=self.client_secret
-            )
-        
-        except Exception as e:
-            logger.error(f'Erro ao se conectar com a Azure: {str(e)}')
-            raise
+        self.max_concurrency = max_concurrency
 
-        try:
-            self.blob_service_client = BlobServiceClient(
-                account_url=self.account_url,
-                credential=self.credentials
-            )
+        self.credentials = None
+        self.blob_service_client = None
+        self._container_client = None
+        self._connect_lock = threading.Lock()
 
-        except Exception as e:
-            logger.error(f'Erro ao se conectar com o Container: {str(e)}')
-            raise
+    @property
+    def container_client(self):
+        """Cliente do Container, criado (junto com a credencial e o BlobServiceClient) no primeiro uso."""
+        # Transferências concorrentes (`upload_many`) podem fazer o primeiro acesso ao mesmo tempo.
+        with self._connect_lock:
+            if self._container_client is None:
+                self._container_client = self._connect()
+        return self._container_client
+
+    def _connect(self):
+        """Cria a credencial (ou usa a connection string), o BlobServiceClient e o cliente do Container."""
+        # O SDK da Azure só é importado aqui: importar o módulo e instanciar a classe não o carregam.
+        from azure.identity import ClientSecretCredential
+        from azure.storage.blob import BlobServiceClient
+
+        if self.connection_string:
+            try:
+                self.blob_service_client = BlobServiceClient.from_connection_string(self.connection_string)
+
+            except Exception as e:
+                logger.error(f'Erro ao se conectar com o Container: {str(e)}')
+                raise
+
+        else:
+            try:
+                self.credentials = ClientSecretCredential(
+                    client_id=self.client_id,
+                    tenant_id=self.tenant_id,
+                    client_secret=self.client_secret
+                )
+
+            except Exception as e:
+                logger.error(f'Erro ao se conectar com a Azure: {str(e)}')
+                raise
+
+            try:
+                self.blob_service_client = BlobServiceClient(
+                    account_url=self.account_url,
+                    credential=self.credentials
+                )
 
-    def upload_data(self, blob_name: str, data: bytes) -> str:
+            except Exception as e:
+                logger.error(f'Erro ao se conectar com o Container: {str(e)}')
+                raise
+
+        return self.blob_service_client.get_container_client(self.container_name)
+
+    def upload_data(
+            self,
+            blob_name: str,
+            data: Union[bytes, BinaryIO],
+            metadata: Optional[Dict[str, str]] = None
+        ) -> str:
         """Faz o Upload de Arquivos para a Azure.
         
         Args:
             blob_name (str): Nome do arquivo a ser salvo.
-            data (bytes): Conteúdo binário do arquivo.
+            data (Union[bytes, BinaryIO]): Conteúdo binário do arquivo, ou arquivo aberto (enviado em streaming).
+            metadata (Optional[Dict[str, str]]): Metadados gravados no blob (ex: hash do conteúdo).
 
         Returns:
-            str: Mensagem de sucesso, se erro, mensagem de erro.
+            str: ETag do blob enviado.
         """
         logger.info('Salvando Dados na Azure...')
 
         try:
-            blob_client = self.blob_service_client.get_blob_client(
-                container=self.container_name,
-                blob=blob_name
+            blob_client = self.container_client.get_blob_client(blob_name)
+            result = blob_client.upload_blob(
+                data,
+                overwrite=True,
+                metadata=metadata,
+                max_concurrency=self.max_concurrency
             )
-
-            blob_client.upload_blob(data, overwrite=True)
             logger.info(f'Arquivo {blob_name} salvo com sucesso.')
+            return result.get('etag')
 
         except Exception as e:
             logger.error(f'Erro ao salvar dados: {str(e)}')
@@ -87,12 +184,9 @@ class AzureCloud:
         logger.info('Fazendo Dowload de Arquivos...')
 
         try:
-            blob_client = self.blob_service_client.get_blob_client(
-                container=self.container_name,
-                blob=blob_name
-            )
+            blob_client = self.container_client.get_blob_client(blob_name)
 
-            download_buffer = blob_client.download_blob()
+            download_buffer = blob_client.download_blob(max_concurrency=self.max_concurrency)
             data = download_buffer.readall()
 
             logger.info(f'Download concluído com sucesso para: {blob_name}')
@@ -102,8 +196,117 @@ class AzureCloud:
             logger.error(f'Erro ao baixar aquivo: {str(e)}')
             raise
 
-    def list_blobs_file(self) -> List[Path]:
+    def open_blob(self, blob_name: str) -> BlobReader:
+        """Abre um blob para leitura aleatória (downloads por intervalo), sem baixá-lo por inteiro.
+
+        Args:
+            blob_name (str): Nome do arquivo.
+
+        Returns:
+            BlobReader: Objeto file-like somente-leitura.
+        """
+        try:
+            blob_client = self.container_client.get_blob_client(blob_name)
+            size = blob_client.get_blob_properties().size
+            return BlobReader(blob_client, size)
+
+        except Exception as e:
+            logger.error(f'Erro ao abrir arquivo {blob_name}: {str(e)}')
+            raise
+
+    def download_to_file(self, blob_name: str, sink: Union[str, Path, BinaryIO]) -> int:
+        """Faz o Download de um Arquivo da Azure direto para um arquivo (sem manter o blob em memória).
+
+        Args:
+            blob_name (str): Nome do arquivo a ser baixado.
+            sink (Union[str, Path, BinaryIO]): Caminho de destino ou objeto file-like aberto para escrita.
+
+        Returns:
+            int: Quantidade de bytes baixados.
+        """
+        try:
+            blob_client = self.container_client.get_blob_client(blob_name)
+            downloader = blob_client.download_blob(max_concurrency=self.max_concurrency)
+
+            if isinstance(sink, (str, Path)):
+                with open(sink, 'wb') as file:
+                    return downloader.readinto(file)
+            return downloader.readinto(sink)
+
+        except Exception as e:
+            logger.error(f'Erro ao baixar aquivo: {str(e)}')
+            raise
+
+    def get_blob_metadata(self, blob_name: str) -> Dict[str, str]:
+        """Retorna os metadados de um blob.
+
+        Args:
+            blob_name (str): Nome do arquivo.
+
+        Returns:
+            Dict[str, str]: Metadados do blob, ou dicionário vazio se o blob não existir.
+        """
+        from azure.core.exceptions import ResourceNotFoundError
+
+        try:
+            properties = self.container_client.get_blob_client(blob_name).get_blob_properties()
+            return dict(properties.metadata or {})
+
+        except ResourceNotFoundError:
+            return {}
+
+        except Exception as e:
+            logger.error(f'Erro ao consultar metadados de {blob_name}: {str(e)}')
+            raise
+
+    def delete_blob(self, blob_name: str):
+        """Remove um blob do Container (blobs inexistentes são ignorados).
+
+        Args:
+            blob_name (str): Nome do arquivo.
+        """
+        from azure.core.exceptions import ResourceNotFoundError
+
+        try:
+            self.container_client.delete_blob(blob_name)
+            logger.info(f'Arquivo {blob_name} removido.')
+
+        except ResourceNotFoundError:
+            return
+
+        except Exception as e:
+            logger.error(f'Erro ao remover {blob_name}: {str(e)}')
+            raise
+
+    def list_blobs_properties(self, prefix: Optional[str] = None) -> Dict[str, str]:
+        """Lista arquivos no Container da Azure com seus ETags.
+
+        Args:
+            prefix (Optional[str]): Prefixo dos blobs (padrão: AZURE_BLOB_PREFIX).
+
+        Returns:
+            Dict[str, str]: Dicionário com {'nome do blob': ETag}.
+        """
+        logger.info('Listando arquivos...')
+
+        try:
+            blobs = {
+                blob.name: blob.etag
+                for blob in self.container_client.list_blobs(name_starts_with=prefix or self.blob_prefix)
+            }
+
+            logger.info(f'{len(blobs)} arquivos listados.')
+            return blobs
+
+        except Exception as e:
+            logger.error(f'Erro ao listar arquivos: {str(e)}')
+            raise
+
+    def list_blobs_file(self, prefix: Optional[str] = None) -> List[Path]:
         """Lista arquivos no Container da Azure.
+
+        Args:
+            prefix (Optional[str]): Prefixo dos blobs (padrão: AZURE_BLOB_PREFIX).
         
         Returns:
             List[Path]: Lista com os diretórios dos arquivos (ex:'raw_data/products').
@@ -111,8 +314,7 @@ class AzureCloud:
         logger.info('Listando arquivos...')
 
         try:
-            container_client = self.blob_service_client.get_container_client(self.container_name)
-            blob_names = container_client.list_blobs(name_starts_with=self.blob_prefix)
+            blob_names = self.container_client.list_blobs(name_starts_with=prefix or self.blob_prefix)
 
             blobs = [blob.name for blob in blob_names]
 
@@ -121,4 +323,4 @@ class AzureCloud:
         
         except Exception as e:
             logger.error(f'Erro ao listar arquivos: {str(e)}')
-            return []
\ No newline at end of file
+            raise
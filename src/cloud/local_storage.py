@@ -0,0 +1,253 @@
+import io
+import os
+import json
+import mmap
+import uuid
+import shutil
+import logging
+
+from pathlib import Path, PurePosixPath
+from typing import Union, BinaryIO, Dict, Optional, Any
+
+from src.cloud.storage_backend import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+METADATA_DIR = '.metadata'
+STAGING_DIR = '.staging'
+
+
+def copy_stream(source: BinaryIO, target: BinaryIO) -> int:
+    """Copia um arquivo aberto para outro, via `os.sendfile` (sem passar pelo espaço do usuário) quando possível.
+
+    Onde o `sendfile` entre arquivos comuns não é suportado (ex: macOS, que só escreve em sockets,
+    ou sistemas de arquivos que retornam EINVAL), a cópia continua em blocos via read/write.
+
+    Args:
+        source (BinaryIO): Arquivo de origem, a partir da posição corrente.
+        target (BinaryIO): Arquivo de destino.
+
+    Returns:
+        int: Quantidade de bytes copiados.
+    """
+    try:
+        source_fd, target_fd = source.fileno(), target.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        source_fd = target_fd = None
+
+    size = 0
+    if source_fd is not None and hasattr(os, 'sendfile'):
+        target.flush()
+        offset = start = source.tell()
+        try:
+            while True:
+                sent = os.sendfile(target_fd, source_fd, offset, 1024 ** 3)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError as e:
+            logger.debug(f'sendfile indisponível ({str(e)}), copiando em blocos.')
+            size = offset - start
+            source.seek(offset)
+            if size:
+                target.seek(0, os.SEEK_END)
+        else:
+            source.seek(offset)
+            target.seek(0, os.SEEK_END)
+            return offset - start
+
+    while True:
+        block = source.read(1024 * 1024)
+        if not block:
+            return size
+        target.write(block)
+        size += len(block)
+
+
+class LocalStorage(StorageBackend):
+    """Armazenamento de blobs em um diretório local, com a mesma interface do AzureCloud.
+
+    Cada blob é um arquivo sob `root` (o nome do blob é o caminho relativo) e os metadados
+    ficam em `root/.metadata`, junto com o ETag, novo (uuid) a cada escrita como no MemoryStorage.
+    As escritas são atômicas (arquivo temporário + rename), `open_blob` mapeia o arquivo em
+    memória (mmap) e as cópias entre arquivos usam `sendfile`. Serve para execuções locais e
+    benchmarks sem rede.
+    """
+
+    def __init__(
+            self,
+            root: Optional[Union[str, Path]] = None,
+            max_workers: Optional[int] = 8,
+            blob_prefix: Optional[str] = 'raw_data/'
+        ):
+        """Inicializa a classe LocalStorage.
+
+        Args:
+            root (Optional[Union[str, Path]]): Diretório dos blobs (padrão: LOCAL_STORAGE_PATH, ou 'src/docs/local_storage').
+            max_workers (Optional[int]): Quantidade de blobs transferidos ao mesmo tempo em `upload_many`/`download_many`.
+            blob_prefix (Optional[str]): Prefixo padrão das listagens (equivalente ao AZURE_BLOB_PREFIX).
+        """
+        super().__init__(max_workers=max_workers, blob_prefix=blob_prefix)
+
+        self.root = Path(root or os.getenv('LOCAL_STORAGE_PATH') or 'src/docs/local_storage')
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, blob_name: str) -> Path:
+        return self.root.joinpath(*PurePosixPath(blob_name).parts)
+
+    def _metadata_path(self, blob_name: str) -> Path:
+        return self.root.joinpath(METADATA_DIR, *PurePosixPath(f'{blob_name}.json').parts)
+
+    def _read_sidecar(self, blob_name: str) -> Dict[str, Any]:
+        """Lê o arquivo `.metadata` de um blob ({'etag', 'metadata'}), ou dicionário vazio se não existir."""
+        try:
+            return json.loads(self._metadata_path(blob_name).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    def _etag(self, blob_name: str, path: Path) -> str:
+        """ETag gravado na última escrita; blobs sem `.metadata` (ex: copiados à mão) usam mtime + tamanho."""
+        etag = self._read_sidecar(blob_name).get('etag')
+        if etag:
+            return etag
+        stat = path.stat()
+        return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+    def upload_data(
+            self,
+            blob_name: str,
+            data: Union[bytes, BinaryIO],
+            metadata: Optional[Dict[str, str]] = None
+        ) -> str:
+        """Grava um blob no diretório local.
+
+        Args:
+            blob_name (str): Nome do arquivo a ser salvo.
+            data (Union[bytes, BinaryIO]): Conteúdo binário do arquivo, ou arquivo aberto.
+            metadata (Optional[Dict[str, str]]): Metadados gravados junto com o blob.
+
+        Returns:
+            str: ETag do blob gravado.
+        """
+        try:
+            path = self._path(blob_name)
+            staging = self.root / STAGING_DIR / f'{uuid.uuid4().hex}.tmp'
+            staging.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(staging, 'wb') as file:
+                if isinstance(data, (bytes, bytearray, memoryview)):
+                    file.write(data)
+                else:
+                    copy_stream(data, file)
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(staging, path)
+
+            # Gravado depois do blob: numa leitura concorrente, o ETag antigo com o conteúdo novo só
+            # causa um novo download, enquanto o ETag novo com o conteúdo antigo envenenaria o cache.
+            etag = f'"{uuid.uuid4().hex}"'
+            metadata_path = self._metadata_path(blob_name)
+            metadata_staging = self.root / STAGING_DIR / f'{uuid.uuid4().hex}.json'
+            metadata_staging.write_text(json.dumps({'etag': etag, 'metadata': metadata or {}}), encoding='utf-8')
+            metadata_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(metadata_staging, metadata_path)
+
+            logger.info(f'Arquivo {blob_name} salvo com sucesso.')
+            return etag
+
+        except Exception as e:
+            logger.error(f'Erro ao salvar dados: {str(e)}')
+            raise
+
+    def download_data(self, blob_name: str) -> bytes:
+        """Retorna o conteúdo de um blob.
+
+        Args:
+            blob_name (str): Nome do arquivo.
+
+        Returns:
+            bytes: Conteúdo binário do arquivo.
+        """
+        try:
+            return self._path(blob_name).read_bytes()
+
+        except Exception as e:
+            logger.error(f'Erro ao ler arquivo: {str(e)}')
+            raise
+
+    def open_blob(self, blob_name: str) -> BinaryIO:
+        """Abre um blob mapeado em memória (mmap): leituras aleatórias sem cópia para o processo.
+
+        Args:
+            blob_name (str): Nome do arquivo.
+
+        Returns:
+            BinaryIO: Objeto file-like somente-leitura (feche-o, ou use `with`, ao terminar).
+        """
+        try:
+            with open(self._path(blob_name), 'rb') as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    return io.BytesIO()
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        except Exception as e:
+            logger.error(f'Erro ao abrir arquivo {blob_name}: {str(e)}')
+            raise
+
+    def download_to_file(self, blob_name: str, sink: Union[str, Path, BinaryIO]) -> int:
+        """Copia um blob para um caminho (`shutil.copyfile`, que usa `sendfile`) ou arquivo aberto.
+
+        Args:
+            blob_name (str): Nome do arquivo a ser copiado.
+            sink (Union[str, Path, BinaryIO]): Caminho de destino ou objeto file-like aberto para escrita.
+
+        Returns:
+            int: Quantidade de bytes copiados.
+        """
+        try:
+            path = self._path(blob_name)
+            if isinstance(sink, (str, Path)):
+                shutil.copyfile(path, sink)
+                return path.stat().st_size
+
+            with open(path, 'rb') as file:
+                return copy_stream(file, sink)
+
+        except Exception as e:
+            logger.error(f'Erro ao copiar arquivo: {str(e)}')
+            raise
+
+    def get_blob_metadata(self, blob_name: str) -> Dict[str, str]:
+        """Retorna os metadados de um blob, ou dicionário vazio se o blob (ou os metadados) não existir."""
+        if not self._path(blob_name).is_file():
+            return {}
+        return dict(self._read_sidecar(blob_name).get('metadata') or {})
+
+    def delete_blob(self, blob_name: str):
+        """Remove um blob e os seus metadados (blobs inexistentes são ignorados)."""
+        self._path(blob_name).unlink(missing_ok=True)
+        self._metadata_path(blob_name).unlink(missing_ok=True)
+        logger.info(f'Arquivo {blob_name} removido.')
+
+    def list_blobs_properties(self, prefix: Optional[str] = None) -> Dict[str, str]:
+        """Lista os blobs do diretório com seus ETags.
+
+        Args:
+            prefix (Optional[str]): Prefixo dos blobs (padrão: `blob_prefix`).
+
+        Returns:
+            Dict[str, str]: Dicionário com {'nome do blob': ETag}.
+        """
+        prefix = prefix or self.blob_prefix or ''
+
+        blobs = {}
+        for path in sorted(self.root.rglob('*')):
+            relative = path.relative_to(self.root)
+            if relative.parts[0] in (METADATA_DIR, STAGING_DIR) or not path.is_file():
+                continue
+            blob_name = relative.as_posix()
+            if blob_name.startswith(prefix):
+                blobs[blob_name] = self._etag(blob_name, path)
+
+        logger.info(f'{len(blobs)} arquivos listados.')
+        return blobs
@@ -0,0 +1,88 @@
+import io
+import uuid
+import logging
+import threading
+
+from pathlib import Path
+from typing import Union, BinaryIO, Dict, Optional
+
+from src.cloud.storage_backend import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryStorage(StorageBackend):
+    """Armazenamento de blobs em memória, com a mesma interface do AzureCloud.
+
+    Os blobs vivem apenas enquanto a instância existir (ETag novo a cada escrita); serve para
+    testes e benchmarks que medem serialização e transferência sem rede nem disco.
+    """
+
+    def __init__(self, max_workers: Optional[int] = 8, blob_prefix: Optional[str] = 'raw_data/'):
+        """Inicializa a classe MemoryStorage.
+
+        Args:
+            max_workers (Optional[int]): Quantidade de blobs transferidos ao mesmo tempo em `upload_many`/`download_many`.
+            blob_prefix (Optional[str]): Prefixo padrão das listagens (equivalente ao AZURE_BLOB_PREFIX).
+        """
+        super().__init__(max_workers=max_workers, blob_prefix=blob_prefix)
+
+        self.blobs = {}
+        self._lock = threading.Lock()
+
+    def _blob(self, blob_name: str):
+        try:
+            return self.blobs[blob_name]
+        except KeyError:
+            logger.error(f'Arquivo {blob_name} não encontrado.')
+            raise FileNotFoundError(blob_name)
+
+    def upload_data(
+            self,
+            blob_name: str,
+            data: Union[bytes, BinaryIO],
+            metadata: Optional[Dict[str, str]] = None
+        ) -> str:
+        """Grava um blob em memória e retorna o seu ETag."""
+        content = bytes(data) if isinstance(data, (bytes, bytearray, memoryview)) else data.read()
+        etag = f'"{uuid.uuid4().hex}"'
+
+        with self._lock:
+            self.blobs[blob_name] = (content, etag, dict(metadata or {}))
+
+        logger.info(f'Arquivo {blob_name} salvo com sucesso.')
+        return etag
+
+    def download_data(self, blob_name: str) -> bytes:
+        """Retorna o conteúdo de um blob."""
+        return self._blob(blob_name)[0]
+
+    def open_blob(self, blob_name: str) -> BinaryIO:
+        """Abre um blob para leitura aleatória (o BytesIO compartilha o buffer enquanto não há escrita)."""
+        return io.BytesIO(self._blob(blob_name)[0])
+
+    def download_to_file(self, blob_name: str, sink: Union[str, Path, BinaryIO]) -> int:
+        """Grava um blob em um caminho ou arquivo aberto e retorna a quantidade de bytes."""
+        content = self.download_data(blob_name)
+        if isinstance(sink, (str, Path)):
+            Path(sink).write_bytes(content)
+        else:
+            sink.write(content)
+        return len(content)
+
+    def get_blob_metadata(self, blob_name: str) -> Dict[str, str]:
+        """Retorna os metadados de um blob, ou dicionário vazio se o blob não existir."""
+        blob = self.blobs.get(blob_name)
+        return dict(blob[2]) if blob else {}
+
+    def delete_blob(self, blob_name: str):
+        """Remove um blob (blobs inexistentes são ignorados)."""
+        with self._lock:
+            self.blobs.pop(blob_name, None)
+
+    def list_blobs_properties(self, prefix: Optional[str] = None) -> Dict[str, str]:
+        """Lista os blobs com seus ETags ({'nome do blob': ETag})."""
+        prefix = prefix or self.blob_prefix or ''
+        with self._lock:
+            blobs = sorted(self.blobs.items())
+        return {blob_name: etag for blob_name, (_, etag, _) in blobs if blob_name.startswith(prefix)}
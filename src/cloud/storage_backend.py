@@ -0,0 +1,213 @@
+import os
+import time
+import logging
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List, Union, BinaryIO, Dict, Optional, Iterable, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+logger = logging.getLogger(__name__)
+
+STORAGE_BACKENDS = ('azure', 'local', 'memory')
+
+
+def data_size(data: Union[bytes, BinaryIO]) -> Optional[int]:
+    """Tamanho do conteúdo a ser enviado (bytes ou arquivo com seek), ou None se desconhecido."""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return len(data)
+    try:
+        position = data.tell()
+        size = data.seek(0, os.SEEK_END) - position
+        data.seek(position)
+        return size
+    except (AttributeError, OSError):
+        return None
+
+
+def transfer_stats(blob_name: str, size: Optional[int], seconds: float) -> Dict[str, float]:
+    """Monta e registra as estatísticas de transferência de um blob."""
+    mb_per_sec = (size / 1024 ** 2) / seconds if size and seconds > 0 else 0.0
+    logger.info(f'{blob_name}: {size or 0} bytes em {seconds:.2f}s ({mb_per_sec:.2f}MB/s)')
+    return {'bytes': size or 0, 'seconds': seconds, 'mb_per_sec': mb_per_sec}
+
+
+class StorageBackend(ABC):
+    """Interface dos armazenamentos de blobs usados pela pipeline (Azure, disco local ou memória).
+
+    As implementações fornecem as operações de um blob (upload, download, leitura aleatória,
+    metadados, listagem e remoção); as transferências em lote (`upload_many`/`download_many`), com
+    estatísticas de throughput, são comuns a todas.
+    """
+
+    def __init__(self, max_workers: Optional[int] = 8, blob_prefix: Optional[str] = None):
+        """Inicializa a classe StorageBackend.
+
+        Args:
+            max_workers (Optional[int]): Quantidade de blobs transferidos ao mesmo tempo em `upload_many`/`download_many`.
+            blob_prefix (Optional[str]): Prefixo padrão das listagens.
+        """
+        self.max_workers = max_workers
+        self.blob_prefix = blob_prefix
+
+    @abstractmethod
+    def upload_data(
+            self,
+            blob_name: str,
+            data: Union[bytes, BinaryIO],
+            metadata: Optional[Dict[str, str]] = None
+        ) -> str:
+        """Grava um blob (bytes ou arquivo aberto) e retorna o seu ETag."""
+
+    @abstractmethod
+    def download_data(self, blob_name: str) -> bytes:
+        """Retorna o conteúdo de um blob."""
+
+    @abstractmethod
+    def open_blob(self, blob_name: str) -> BinaryIO:
+        """Abre um blob para leitura aleatória (objeto file-like com seek), sem carregá-lo por inteiro."""
+
+    @abstractmethod
+    def download_to_file(self, blob_name: str, sink: Union[str, Path, BinaryIO]) -> int:
+        """Grava um blob em um caminho ou arquivo aberto e retorna a quantidade de bytes."""
+
+    @abstractmethod
+    def get_blob_metadata(self, blob_name: str) -> Dict[str, str]:
+        """Retorna os metadados de um blob, ou dicionário vazio se o blob não existir."""
+
+    @abstractmethod
+    def list_blobs_properties(self, prefix: Optional[str] = None) -> Dict[str, str]:
+        """Lista os blobs com seus ETags ({'nome do blob': ETag})."""
+
+    @abstractmethod
+    def delete_blob(self, blob_name: str):
+        """Remove um blob (e os seus metadados); blobs inexistentes são ignorados."""
+
+    def list_blobs_file(self, prefix: Optional[str] = None) -> List[str]:
+        """Lista os nomes dos blobs (ex: 'raw_data/products.parquet')."""
+        return list(self.list_blobs_properties(prefix))
+
+    def upload_many(
+            self,
+            items: Dict[str, Union[bytes, str, Path, BinaryIO]],
+            metadata: Optional[Dict[str, Dict[str, str]]] = None
+        ) -> Dict[str, Dict[str, Any]]:
+        """Faz o Upload de vários Arquivos de forma concorrente.
+
+        Args:
+            items (Dict[str, Union[bytes, str, Path, BinaryIO]]): Dicionário com {'nome do blob': conteúdo}.
+                O conteúdo pode ser bytes, um arquivo aberto ou o caminho de um arquivo local (enviado em streaming).
+            metadata (Optional[Dict[str, Dict[str, str]]]): Metadados por blob ({'nome do blob': {...}}).
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Estatísticas por blob ({'etag', 'bytes', 'seconds', 'mb_per_sec'}).
+        """
+        logger.info(f'Salvando {len(items)} arquivo(s)...')
+
+        metadata = metadata or {}
+        return self._run_many(
+            lambda blob_name, data: self._upload_one(blob_name, data, metadata.get(blob_name)),
+            items.items()
+        )
+
+    def download_many(self, blob_names: Iterable[str], dest_dir: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+        """Faz o Download de vários Arquivos de forma concorrente, gravando direto em disco.
+
+        Args:
+            blob_names (Iterable[str]): Nomes dos blobs a serem baixados.
+            dest_dir (Union[str, Path]): Diretório de destino (o arquivo mantém o caminho do blob, ex: 'raw_data/orders.parquet').
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Estatísticas por blob ({'path', 'bytes', 'seconds', 'mb_per_sec'}).
+        """
+        dest_dir = Path(dest_dir)
+
+        items = [(blob_name, dest_dir / blob_name) for blob_name in blob_names]
+        logger.info(f'Fazendo Download de {len(items)} arquivo(s)...')
+        return self._run_many(self._download_one, items)
+
+    def delete_blobs(self, blob_names: Iterable[str]):
+        """Remove vários blobs de forma concorrente.
+
+        Args:
+            blob_names (Iterable[str]): Nomes dos blobs a serem removidos.
+        """
+        items = [(blob_name, None) for blob_name in blob_names]
+        logger.info(f'Removendo {len(items)} arquivo(s)...')
+        self._run_many(lambda blob_name, _: self.delete_blob(blob_name), items)
+
+    def _upload_one(
+            self,
+            blob_name: str,
+            data: Union[bytes, str, Path, BinaryIO],
+            metadata: Optional[Dict[str, str]] = None
+        ) -> Dict[str, Any]:
+        """Envia um blob e mede o throughput."""
+        start_time = time.perf_counter()
+
+        if isinstance(data, (str, Path)):
+            size = os.path.getsize(data)
+            with open(data, 'rb') as file:
+                etag = self.upload_data(blob_name, file, metadata)
+        else:
+            size = data_size(data)
+            etag = self.upload_data(blob_name, data, metadata)
+
+        stats = transfer_stats(blob_name, size, time.perf_counter() - start_time)
+        stats['etag'] = etag
+        return stats
+
+    def _download_one(self, blob_name: str, path: Path) -> Dict[str, Any]:
+        """Baixa um blob para o disco e mede o throughput."""
+        start_time = time.perf_counter()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        size = self.download_to_file(blob_name, path)
+
+        stats = transfer_stats(blob_name, size, time.perf_counter() - start_time)
+        stats['path'] = path
+        return stats
+
+    def _run_many(self, transfer, items) -> Dict[str, Dict[str, float]]:
+        """Executa as transferências em um pool limitado; erros são relançados ao final."""
+        stats, errors = {}, {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(transfer, blob_name, value): blob_name for blob_name, value in items}
+
+            for future in as_completed(futures):
+                blob_name = futures[future]
+                try:
+                    stats[blob_name] = future.result()
+                except Exception as e:
+                    errors[blob_name] = e
+
+        if errors:
+            logger.error(f'{len(errors)} transferência(s) falharam: {list(errors)}')
+            raise next(iter(errors.values()))
+
+        return stats
+
+
+def storage_backend(backend: Optional[str] = None, **kwargs) -> StorageBackend:
+    """Cria o armazenamento configurado.
+
+    Args:
+        backend (Optional[str]): 'azure', 'local' ou 'memory' (padrão: variável STORAGE_BACKEND, ou 'azure').
+        **kwargs: Parâmetros do construtor do armazenamento (ex: `root` do LocalStorage).
+
+    Returns:
+        StorageBackend: Instância do armazenamento escolhido.
+    """
+    backend = backend or os.getenv('STORAGE_BACKEND') or 'azure'
+    if backend not in STORAGE_BACKENDS:
+        raise ValueError(f'Armazenamento inválido: {backend}. Use um de {STORAGE_BACKENDS}.')
+
+    # Importados aqui: cada módulo importa esta interface, e o SDK da Azure só é carregado se usado.
+    if backend == 'azure':
+        from src.cloud.cloud_connection import AzureCloud
+        return AzureCloud(**kwargs)
+    if backend == 'local':
+        from src.cloud.local_storage import LocalStorage
+        return LocalStorage(**kwargs)
+
+    from src.cloud.memory_storage import MemoryStorage
+    return MemoryStorage(**kwargs)
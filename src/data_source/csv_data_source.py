@@ -1,11 +1,21 @@
 import os
-import io
+import re
+import time
+import asyncio
+import hashlib
+import tempfile
 import pandas as pd
+import functools
+import pyarrow as pa
+import pandera.pandas as pandera
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import datetime
 import logging
 
-from typing import Optional, List, Dict
-from pathlib import Path
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Iterator, Tuple, Type
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path, PurePosixPath
 
 from src.data_source.generic_data_source import GenericDataSource
 from src.schema.schema_validation import (
@@ -16,33 +26,266 @@ from src.schema.schema_validation import (
     WebsiteSessionsSchema,
     WebsitePageviewSchema
 )
-from src.cloud.cloud_connection import AzureCloud
-from src.database.db_connection import DBConnection
+from src.schema.arrow_schema import arrow_schema, enumerated_columns, typed_validation_schema
+from src.schema.fast_validation import FastValidator
+from src.schema.quarantine import validate_with_quarantine
+from src.parquet.partitioning import partition_dataframe, read_partitioned, PARTITION_SUCCESS_MARKER
+from src.parquet.profiles import DICTIONARY_COLUMNS, parquet_profile, writer_options, write_parquet
+from src.cloud.storage_backend import StorageBackend, storage_backend
+from src.data_source.lake_loader import BLOB_SUFFIX_PATTERN, lake_blobs
+from src.cache.file_cache import FileCache, clone_or_copy
+from src.cache.validation_cache import ValidationCache
+from src.monitoring.metrics import PipelineMetrics, peak_rss_mb
+from src.environment import setup_environment
+
+if TYPE_CHECKING:
+    # Importado sob demanda em `_transfer_async`: o SDK assíncrono da Azure (e o aiohttp) só carrega com `use_async`.
+    from src.cloud.async_cloud_connection import AsyncAzureCloud
+    # Importado sob demanda em `db_conn`: o SQLAlchemy só carrega no primeiro acesso ao Banco.
+    from src.database.db_connection import DBConnection
 
 logger = logging.getLogger(__name__)
 
+
+def file_sha256(path: Path, block_size: Optional[int] = 1024 * 1024) -> str:
+    """Calcula o SHA-256 de um arquivo lendo em blocos.
+
+    Args:
+        path (Path): Diretório do arquivo.
+        block_size (Optional[int]): Tamanho de cada leitura, em bytes.
+
+    Returns:
+        str: Hash hexadecimal do conteúdo.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def filter_past_watermark(chunk: pd.DataFrame, pk_column: str, watermark: Dict[str, Any]) -> pd.DataFrame:
+    """Mantém apenas as linhas além da watermark da tabela.
+
+    Uma linha é nova quando `created_at` é maior que o maior `created_at` carregado
+    ou quando a chave primária é maior que a maior chave carregada.
+
+    Args:
+        chunk (DataFrame): Bloco lido do arquivo.
+        pk_column (str): Nome da coluna de chave primária.
+        watermark (Dict[str, Any]): {'max_created_at', 'max_pk'}.
+
+    Returns:
+        DataFrame: Linhas novas do bloco.
+    """
+    max_created_at = watermark.get('max_created_at')
+    max_pk = watermark.get('max_pk')
+
+    is_new = pd.Series(False, index=chunk.index)
+    if max_created_at is not None:
+        is_new |= pd.to_datetime(chunk['created_at']) > pd.Timestamp(max_created_at)
+    if max_pk is not None:
+        is_new |= chunk[pk_column] > max_pk
+    return chunk[is_new]
+
+
+def read_csv_past_watermark(
+        file: Path,
+        pk_column: str,
+        watermark: Optional[Dict[str, Any]],
+        chunksize: Optional[int] = 100000
+    ) -> pd.DataFrame:
+    """Lê o arquivo em blocos mantendo apenas as linhas além da watermark.
+
+    Args:
+        file (Path): Diretório do arquivo.
+        pk_column (str): Nome da coluna de chave primária.
+        watermark (Optional[Dict[str, Any]]): {'max_created_at', 'max_pk'}, ou None se nunca carregado.
+        chunksize (Optional[int]): Tamanho dos blocos de leitura.
+
+    Returns:
+        DataFrame: Linhas novas do arquivo.
+    """
+    if not watermark:
+        return pd.read_csv(file)
+
+    chunks = [
+        filter_past_watermark(chunk, pk_column, watermark)
+        for chunk in pd.read_csv(file, chunksize=chunksize)
+    ]
+    return pd.concat(chunks, ignore_index=True)
+
+
+def dictionary_columns(name: str, schema: Type[pandera.DataFrameModel]) -> List[str]:
+    """Colunas de texto lidas como dictionary/category no engine 'arrow' (domínio fechado ou baixa cardinalidade)."""
+    return list(dict.fromkeys(enumerated_columns(schema) + DICTIONARY_COLUMNS.get(name, [])))
+
+
+def read_csv_arrow(
+        file: Path,
+        schema: Type[pandera.DataFrameModel],
+        dictionary_columns: Optional[List[str]] = None
+    ) -> pa.Table:
+    """Lê o arquivo direto para uma tabela Arrow, com os tipos derivados do schema de validação.
+
+    Colunas fora do schema são lidas com tipo inferido, para que o modo `strict` as rejeite.
+
+    Args:
+        file (Path): Diretório do arquivo.
+        schema (Type[DataFrameModel]): Schema de validação do arquivo.
+        dictionary_columns (Optional[List[str]]): Colunas de texto lidas como dictionary.
+
+    Returns:
+        pa.Table: Tabela Arrow tipada.
+    """
+    import pyarrow.csv as pa_csv
+
+    convert_options = pa_csv.ConvertOptions(
+        column_types=arrow_schema(schema, dictionary_columns),
+        strings_can_be_null=True
+    )
+    return pa_csv.read_csv(file, convert_options=convert_options)
+
+
+def filter_table_past_watermark(table: pa.Table, pk_column: str, watermark: Optional[Dict[str, Any]]) -> pa.Table:
+    """Equivalente de `filter_past_watermark` para tabelas Arrow (sem watermark, a tabela é mantida)."""
+    if not watermark:
+        return table
+
+    max_created_at = watermark.get('max_created_at')
+    max_pk = watermark.get('max_pk')
+
+    conditions = []
+    if max_created_at is not None:
+        created_at = table.column('created_at')
+        conditions.append(pc.greater(created_at, pa.scalar(pd.Timestamp(max_created_at).to_pydatetime(), type=created_at.type)))
+    if max_pk is not None:
+        conditions.append(pc.greater(table.column(pk_column), max_pk))
+
+    if not conditions:
+        return table.slice(0, 0)
+    return table.filter(functools.reduce(pc.or_, conditions))
+
+
+def read_and_validate(
+        file: Path,
+        schema: Type[pandera.DataFrameModel],
+        pk_column: str,
+        watermark: Optional[Dict[str, Any]] = None,
+        engine: Optional[str] = 'pandas',
+        validation_engine: Optional[str] = 'pandera',
+        max_reject_rate: Optional[float] = None
+    ) -> Tuple[pd.DataFrame, Optional[pd.DataFrame], Dict[str, Dict[str, float]]]:
+    """Lê e valida um arquivo. Função de módulo para poder ser executada em um ProcessPoolExecutor.
+
+    As métricas do processo filho não chegam ao PipelineMetrics do processo principal; por isso
+    os tempos de leitura e validação são devolvidos junto com o resultado, para serem registrados lá.
+
+    Args:
+        file (Path): Diretório do arquivo.
+        schema (Type[DataFrameModel]): Schema de validação do arquivo.
+        pk_column (str): Nome da coluna de chave primária.
+        watermark (Optional[Dict[str, Any]]): Watermark da tabela (carga incremental).
+        engine (Optional[str]): 'pandas' ou 'arrow' (leitura tipada, sem coerção na validação).
+        validation_engine (Optional[str]): 'pandera' ou 'fast' (FastValidator).
+        max_reject_rate (Optional[float]): Ativa a quarentena com esse limite de rejeição (None para desativar).
+
+    Returns:
+        Tuple[DataFrame, Optional[DataFrame], Dict[str, Dict[str, float]]]: (DataFrame validado, vazio se não houver
+            linhas novas; linhas rejeitadas; {'read'/'validate': {'seconds', 'cpu_seconds', 'rows', 'bytes'}}).
+    """
+    timings = {}
+    start_time, start_cpu = time.perf_counter(), time.thread_time()
+
+    if engine == 'arrow':
+        columns = dictionary_columns(Path(file).stem, schema)
+        table = filter_table_past_watermark(read_csv_arrow(file, schema, columns), pk_column, watermark)
+        df = table.to_pandas()
+        validation_schema = typed_validation_schema(schema, columns)
+    else:
+        df = read_csv_past_watermark(file, pk_column, watermark)
+        validation_schema = schema
+
+    timings['read'] = {
+        'seconds': time.perf_counter() - start_time,
+        'cpu_seconds': time.thread_time() - start_cpu,
+        'rows': len(df),
+        'bytes': os.path.getsize(file)
+    }
+    if df.empty:
+        return df, None, timings
+
+    if validation_engine == 'fast':
+        validate = FastValidator(schema).validate
+    else:
+        validate = functools.partial(validation_schema.validate, lazy=True)
+
+    start_time, start_cpu = time.perf_counter(), time.thread_time()
+    if max_reject_rate is None:
+        df_validado, rejects = validate(df), None
+    else:
+        df_validado, rejects = validate_with_quarantine(df, validate, max_reject_rate, Path(file).stem)
+
+    timings['validate'] = {
+        'seconds': time.perf_counter() - start_time,
+        'cpu_seconds': time.thread_time() - start_cpu,
+        'rows': len(df),
+        'bytes': 0
+    }
+    return df_validado, rejects, timings
+
 class CSVDataSource(GenericDataSource):
     """Classe responsável por fazer a Coleta de Dados de arquivo do tipo CSV."""
 
+    PIPELINE_MODES = ('full', 'incremental')
+    INGESTION_ENGINES = ('pandas', 'arrow')
+    VALIDATION_ENGINES = ('pandera', 'fast')
+    REJECT_THRESHOLD = 0.01
+    CONTENT_HASH_KEY = 'source_sha256'
+
     def __init__(
             self,
             default_path: Optional[str] = None,
             download_path: Optional[str] = None,
-            azure_cloud: Optional[AzureCloud] = None,
-            db_conn: Optional[DBConnection] = None
+            azure_cloud: Optional[StorageBackend] = None,
+            db_conn: Optional['DBConnection'] = None,
+            async_azure_cloud: Optional['AsyncAzureCloud'] = None,
+            parquet_cache: Optional[FileCache] = None,
+            partitioning: Optional[Dict[str, str]] = None,
+            parquet_profiles: Optional[Dict[str, Dict[str, Any]]] = None,
+            reject_thresholds: Optional[Dict[str, float]] = None,
+            validation_cache: Optional[ValidationCache] = None,
+            metrics: Optional[PipelineMetrics] = None
         ):
-        """Inicializa a classe CSVDataSource."""
+        """Inicializa a classe CSVDataSource.
+
+        Args:
+            azure_cloud (Optional[StorageBackend]): Armazenamento do Data Lake (padrão: `storage_backend()`, escolhido
+                pela variável STORAGE_BACKEND: 'azure', 'local' ou 'memory').
+            partitioning (Optional[Dict[str, str]]): Tabelas gravadas particionadas por `created_at`,
+                com a granularidade de cada uma (ex: {'orders': 'day'}); as demais seguem em um único arquivo.
+            parquet_profiles (Optional[Dict[str, Dict[str, Any]]]): Perfil de escrita Parquet por tabela
+                (ex: {'orders': parquet_profile('orders', codec='snappy')}); padrão: `parquet_profile(nome)`.
+            reject_thresholds (Optional[Dict[str, float]]): Fração máxima de linhas rejeitadas por tabela no modo
+                quarentena (ex: {'website_pageviews': 0.001}); padrão: REJECT_THRESHOLD.
+            validation_cache (Optional[ValidationCache]): Cache dos arquivos já validados (padrão: 'src/docs/validation_cache').
+            metrics (Optional[PipelineMetrics]): Métricas por estágio e tabela de cada execução (padrão: relatórios
+                JSON e OpenMetrics em 'src/docs/metrics').
+        """
         super().__init__()
 
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        setup_environment()
 
         self.default_path = None
         self.download_path = None
-        self.azure_cloud = azure_cloud or AzureCloud()
-        self.db_conn = db_conn or DBConnection()
+        self.azure_cloud = azure_cloud or storage_backend()
+        self._db_conn = db_conn
+        self.async_azure_cloud = async_azure_cloud
+        self.source_files = {}
+        self.arrow_tables = {}
+        self.rejects = {}
+        self.reject_thresholds = reject_thresholds or {}
+        self.partitioning = partitioning or {}
 
         if not default_path or default_path is None:
             self.default_path = 'src/docs/data'
@@ -54,6 +297,13 @@ class CSVDataSource(GenericDataSource):
         else:
             self.download_path = download_path
 
+        self.parquet_cache = parquet_cache or FileCache('src/docs/parquet_cache')
+        self.validation_cache = validation_cache or ValidationCache('src/docs/validation_cache')
+        self.cached_validations = set()
+        self.cached_validation_settings = ('pandera', False)
+        self.pending_validations = {}
+        self.metrics = metrics or PipelineMetrics(report_dir='src/docs/metrics')
+
         self.validation_schema = {
             'orders': OrderSchema,
             'order_items': OrderItemSchema,
@@ -63,25 +313,448 @@ class CSVDataSource(GenericDataSource):
             'website_pageviews': WebsitePageviewSchema
         }
 
-    def start(self):
-        """Inicia a Pipeline de Dados."""
+        self.parquet_profiles = {name: parquet_profile(name) for name in self.validation_schema}
+        self.parquet_profiles.update(parquet_profiles or {})
+
+    @property
+    def db_conn(self) -> 'DBConnection':
+        """Conexão com o Banco, criada no primeiro uso (o SQLAlchemy só é importado nesse momento)."""
+        if self._db_conn is None:
+            from src.database.db_connection import DBConnection
+
+            self._db_conn = DBConnection()
+        return self._db_conn
+
+    def start(
+            self,
+            load_method: Optional[str] = 'orm',
+            mode: Optional[str] = 'full',
+            chunksize: Optional[int] = None,
+            max_workers: Optional[int] = None,
+            use_async: Optional[bool] = False,
+            skip_unchanged: Optional[bool] = False,
+            engine: Optional[str] = 'pandas',
+            validation_engine: Optional[str] = 'pandera',
+            quarantine: Optional[bool] = False,
+            run_id: Optional[str] = None,
+            db_workers: Optional[int] = None,
+            deferred_indexes: Optional[bool] = False
+        ):
+        """Inicia a Pipeline de Dados.
+
+        No modo 'full' todos os arquivos são recarregados em tabelas sombra (`raw_*__next`), que
+        substituem as tabelas `raw_*` em uma única transação ao final; até lá os leitores continuam
+        vendo os dados anteriores, e uma falha mantém as tabelas atuais intactas. No modo
+        'incremental' apenas as linhas além da watermark de cada tabela (maior `created_at`
+        e maior chave primária já carregados) são lidas, validadas, enviadas e inseridas.
+
+        Com `chunksize`, cada arquivo é processado em blocos (leitura, validação, Parquet e
+        insert), de modo que o pico de memória depende do tamanho do bloco e não do volume.
+
+        Com `max_workers`, cada tabela percorre leitura, validação, upload e insert de forma
+        independente e concorrente: leitura e validação em processos, upload e insert em threads.
+
+        Args:
+            load_method (Optional[str]): Método de carga no Banco ('orm', 'copy_csv' ou 'copy_binary').
+            mode (Optional[str]): 'full' ou 'incremental'.
+            chunksize (Optional[int]): Tamanho dos blocos no modo streaming (None para desativar).
+            max_workers (Optional[int]): Quantidade de workers no modo paralelo (None para desativar).
+            use_async (Optional[bool]): Faz upload e download com o AsyncAzureCloud (asyncio).
+            skip_unchanged (Optional[bool]): Não serializa nem envia tabelas cujo arquivo de origem não mudou.
+            engine (Optional[str]): Leitura dos CSVs: 'pandas' ou 'arrow' (tipos do schema na leitura, colunas
+                enumeradas como category e a tabela Arrow reaproveitada no Parquet). O modo streaming usa 'pandas'.
+            validation_engine (Optional[str]): 'pandera' ou 'fast' (FastValidator: máscaras vetorizadas e, no modo
+                streaming, unicidade das chaves garantida entre blocos).
+            quarantine (Optional[bool]): Linhas inválidas vão para a quarentena (`quarantine/` na Azure e tabelas
+                `*_rejects`) e as válidas seguem; a tabela só é rejeitada se passar de `reject_thresholds`. Não é
+                aceito com engine 'arrow' (fora do modo streaming): a leitura tipada falha no arquivo inteiro em vez
+                de isolar as linhas inválidas.
+            run_id (Optional[str]): Identificador da execução no modo 'full': cada bloco é gravado com checkpoint e
+                repetido em quedas de conexão; rodar de novo com o mesmo `run_id` (e os mesmos `chunksize` e
+                `db_workers`) retoma a carga sem recriar as tabelas.
+            db_workers (Optional[int]): Conexões usadas ao mesmo tempo no insert do modo 'full' (tabelas e faixas de
+                chaves carregadas em paralelo, ver `DBConnection.parallel_insert`); None para uma única transação.
+                Com `max_workers`, cada tabela é carregada com até `db_workers` conexões; não é aceito com `chunksize`.
+            deferred_indexes (Optional[bool]): No modo 'full', carrega as tabelas sem chave primária e índices (UNLOGGED,
+                exceto com `run_id`) e cria tudo de uma vez ao final, seguido de ANALYZE.
+        """
+        if mode not in self.PIPELINE_MODES:
+            raise ValueError(f'Modo inválido: {mode}. Use um de {self.PIPELINE_MODES}.')
+        if engine not in self.INGESTION_ENGINES:
+            raise ValueError(f'Engine inválido: {engine}. Use um de {self.INGESTION_ENGINES}.')
+        if validation_engine not in self.VALIDATION_ENGINES:
+            raise ValueError(f'Engine de validação inválido: {validation_engine}. Use um de {self.VALIDATION_ENGINES}.')
+        if quarantine and engine == 'arrow' and not chunksize:
+            raise ValueError("quarantine não é aceito com engine 'arrow': use engine 'pandas'.")
+        if db_workers and mode != 'full':
+            raise ValueError('db_workers só é aceito no modo full.')
+        if db_workers and chunksize:
+            raise ValueError('db_workers não é aceito com chunksize: no modo streaming os blocos são inseridos à medida que são lidos.')
+
         start_time = datetime.datetime.now()
+        self.rejects = {}
+        self.metrics.reset(run_id)
+
+        if mode == 'full':
+            resume = bool(run_id and self.db_conn.get_checkpoints(run_id))
+            if resume:
+                logger.info(f'Retomando a execução {run_id}: as tabelas sombra não serão recriadas.')
+            watermarks = None
+            blob_suffix = ''
+        else:
+            resume = False
+            self.db_conn.create_tables()
+            watermarks = self.db_conn.get_watermarks()
+            blob_suffix = f'_{start_time:%Y%m%d%H%M%S}'
 
-        self.db_conn.drop_tables()
         files_list = self.get_data()
-        df_dict = self.transform_data(files_list)
-        df_validado = self.validate_data(df_dict)
-        self.load_data(df_validado)
-        self.get_data_from_cloud()
-        self.db_conn.create_tables()
-        self.insert_data_into_db(df_validado)
+
+        if chunksize:
+            self._start_streaming(
+                files_list, mode, watermarks, blob_suffix, chunksize, load_method, validation_engine, quarantine, run_id,
+                deferred_indexes, resume
+            )
+            self.store_rejects()
+        elif max_workers:
+            self._start_parallel(
+                files_list, mode, watermarks, blob_suffix, load_method, max_workers, skip_unchanged, engine,
+                validation_engine, quarantine, run_id, deferred_indexes, resume, db_workers
+            )
+            self.store_rejects()
+        else:
+            df_dict = self.transform_data(
+                files_list, watermarks=watermarks, engine=engine, validation_engine=validation_engine, quarantine=quarantine
+            )
+            df_validado = self.validate_data(df_dict, engine=validation_engine, quarantine=quarantine)
+
+            if not df_validado:
+                logger.warning('Nenhum dado novo para carregar.')
+            else:
+                if use_async:
+                    asyncio.run(self._transfer_async(df_validado, blob_suffix, skip_unchanged))
+                else:
+                    self.load_data(df_validado, blob_suffix=blob_suffix, skip_unchanged=skip_unchanged)
+                    self.get_data_from_cloud()
+
+                if mode == 'full':
+                    self._create_load_tables(deferred_indexes, run_id, resume)
+                    self.insert_data_into_db(df_validado, method=load_method, run_id=run_id, max_workers=db_workers)
+                    self._publish_load_tables(deferred_indexes, run_id)
+                else:
+                    with self.metrics.stage('insert') as sample:
+                        sample['rows'] = sum(self.db_conn.incremental_load(df_validado).values())
+
+                self.db_conn.update_watermarks(df_validado)
+                self.store_rejects()
 
         end_time = datetime.datetime.now()
         pipeline_time = (end_time - start_time).total_seconds()
         formated_time = pipeline_time / 60
 
+        self.metrics.finish()
+        logger.info(f'Pico de memória (RSS): {peak_rss_mb():.1f}MB.')
         logger.info(f'Pipeline concluído em: {formated_time:.2f}min.')
 
+    def _start_streaming(
+            self,
+            files_list: List[Path],
+            mode: str,
+            watermarks: Optional[Dict[str, Dict[str, Any]]],
+            blob_suffix: str,
+            chunksize: int,
+            load_method: str,
+            validation_engine: Optional[str] = 'pandera',
+            quarantine: Optional[bool] = False,
+            run_id: Optional[str] = None,
+            deferred_indexes: Optional[bool] = False,
+            resume: Optional[bool] = False
+        ):
+        """Executa a pipeline em blocos: cada bloco validado segue direto para o Parquet e o Banco.
+
+        No modo 'full' todos os blocos são inseridos em uma única transação (ou um bloco por
+        transação, com checkpoint, quando há `run_id`); no modo
+        'incremental' cada bloco é carregado via anti-join e a watermark avança a cada bloco.
+        """
+        chunks = self.stream_data(
+            files_list,
+            chunksize,
+            watermarks=watermarks,
+            blob_suffix=blob_suffix,
+            validation_engine=validation_engine,
+            quarantine=quarantine
+        )
+
+        if mode == 'full':
+            maxima = {}
+            self._create_load_tables(deferred_indexes, run_id, resume)
+            self._record_insert(
+                self.db_conn.insert_stream(
+                    self._track_maxima(chunks, maxima), method=load_method, run_id=run_id, chunking=f'sequential:{chunksize}'
+                )
+            )
+            self._publish_load_tables(deferred_indexes, run_id)
+            self.db_conn.update_watermarks({name: pd.DataFrame(rows) for name, rows in maxima.items()})
+        else:
+            for name, chunk in chunks:
+                with self.metrics.stage('insert', name) as sample:
+                    sample['rows'] = self.db_conn.incremental_load({name: chunk}).get(name, 0)
+                self.db_conn.update_watermarks({name: chunk})
+
+    def _start_parallel(
+            self,
+            files_list: List[Path],
+            mode: str,
+            watermarks: Optional[Dict[str, Dict[str, Any]]],
+            blob_suffix: str,
+            load_method: str,
+            max_workers: int,
+            skip_unchanged: Optional[bool] = False,
+            engine: Optional[str] = 'pandas',
+            validation_engine: Optional[str] = 'pandera',
+            quarantine: Optional[bool] = False,
+            run_id: Optional[str] = None,
+            deferred_indexes: Optional[bool] = False,
+            resume: Optional[bool] = False,
+            db_workers: Optional[int] = None
+        ):
+        """Executa a pipeline de cada tabela de forma concorrente.
+
+        Leitura e validação (CPU) rodam em um ProcessPoolExecutor, e os seus tempos, devolvidos por
+        `read_and_validate`, são registrados nas métricas aqui; assim que uma tabela fica pronta, o
+        upload e o insert (I/O) seguem em um ThreadPoolExecutor, sem esperar as demais.
+        Cada tabela é carregada em sua própria transação; uma falha não interrompe as outras
+        tabelas e é relançada ao final (no modo 'full', sem trocar as tabelas sombra). Com `db_workers`,
+        o insert de cada tabela no modo 'full' usa `DBConnection.parallel_insert`.
+        """
+        if mode == 'full':
+            self._create_load_tables(deferred_indexes, run_id, resume)
+
+        errors = {}
+        self.pending_validations = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as processes, \
+                ThreadPoolExecutor(max_workers=max_workers) as threads:
+            parsing, loading = {}, {}
+            for file in files_list:
+                name = Path(file).stem
+                start_time, start_cpu = time.perf_counter(), time.thread_time()
+                cached, cache_tag = self._read_validation_cache(
+                    file, name, engine, watermarks, validation_engine, quarantine
+                )
+                if cached is not None:
+                    self.metrics.record(
+                        'read', name, time.perf_counter() - start_time, cached.num_rows, os.path.getsize(file),
+                        time.thread_time() - start_cpu
+                    )
+                    if cached.num_rows == 0:
+                        logger.info(f'{name}: nenhuma linha nova.')
+                        continue
+                    loading[threads.submit(
+                        self._load_table_pipeline, name, cached.to_pandas(), mode, blob_suffix, load_method, skip_unchanged, run_id,
+                        db_workers
+                    )] = name
+                    continue
+
+                if watermarks is None:
+                    self.source_files[name] = file
+                    self.pending_validations[name] = (file, cache_tag)
+                future = processes.submit(
+                    read_and_validate,
+                    file,
+                    self.validation_schema.get(name),
+                    self.db_conn.pk_mapping.get(name),
+                    (watermarks or {}).get(name),
+                    engine,
+                    validation_engine,
+                    self._reject_threshold(name, quarantine)
+                )
+                parsing[future] = name
+
+            for future in as_completed(parsing):
+                name = parsing[future]
+                try:
+                    df, rejects, timings = future.result()
+                except Exception as e:
+                    logger.error(f'Erro ao ler/validar {name}: {str(e)}')
+                    errors[name] = e
+                    continue
+
+                for stage, sample in timings.items():
+                    self.metrics.record(
+                        stage, name, sample['seconds'], sample['rows'], sample['bytes'], sample['cpu_seconds']
+                    )
+
+                if rejects is not None:
+                    self.rejects.setdefault(name, []).append(rejects)
+
+                if df.empty:
+                    logger.info(f'{name}: nenhuma linha nova.')
+                    continue
+
+                logger.info(f'{name} validado: {len(df)} linhas.')
+                self._write_validation_cache(name, df, rejected=rejects is not None)
+                loading[threads.submit(
+                    self._load_table_pipeline, name, df, mode, blob_suffix, load_method, skip_unchanged, run_id, db_workers
+                )] = name
+
+            maxima = {}
+            for future in as_completed(loading):
+                name = loading[future]
+                try:
+                    maxima[name] = future.result()
+                    logger.info(f'{name}: pipeline concluída.')
+                except Exception as e:
+                    logger.error(f'Erro ao carregar {name}: {str(e)}')
+                    errors[name] = e
+
+        if mode == 'full' and not errors:
+            self._publish_load_tables(deferred_indexes, run_id)
+            self.db_conn.update_watermarks(maxima)
+
+        self.get_data_from_cloud()
+
+        if errors:
+            raise next(iter(errors.values()))
+
+    def _create_load_tables(self, deferred_indexes: bool, run_id: Optional[str], resume: Optional[bool] = False):
+        """Cria as tabelas sombra da carga full; sem índices se `deferred_indexes` (ver `DBConnection.build_indexes`).
+
+        Tabelas UNLOGGED são esvaziadas pelo PostgreSQL após uma queda do servidor, o que invalidaria
+        os checkpoints de uma execução com `run_id`; nesse caso as tabelas continuam LOGGED.
+        """
+        self.db_conn.create_shadow_tables(
+            deferred_indexes=deferred_indexes,
+            unlogged=run_id is None,
+            keep_existing=resume
+        )
+
+    def _publish_load_tables(self, deferred_indexes: bool, run_id: Optional[str]):
+        """Cria os índices adiados (se houver) e troca as tabelas sombra pelas tabelas `raw_*`."""
+        if deferred_indexes:
+            self.db_conn.build_indexes()
+        self.db_conn.swap_shadow_tables(run_id=run_id)
+
+    def _load_table_pipeline(
+            self,
+            name: str,
+            df: pd.DataFrame,
+            mode: str,
+            blob_suffix: str,
+            load_method: str,
+            skip_unchanged: bool,
+            run_id: Optional[str] = None,
+            db_workers: Optional[int] = None
+        ) -> Optional[pd.DataFrame]:
+        """Upload, insert e watermark de uma única tabela (executado em thread no modo paralelo).
+
+        No modo 'full' a watermark só pode ser gravada depois da troca das tabelas sombra; nesse
+        caso é retornada uma linha com o maior `created_at` e a maior chave da tabela.
+        """
+        self.load_data({name: df}, blob_suffix=blob_suffix, skip_unchanged=skip_unchanged)
+
+        if mode == 'full':
+            self.insert_data_into_db({name: df}, method=load_method, run_id=run_id, max_workers=db_workers)
+            return df[['created_at', self.db_conn.pk_mapping.get(name)]].max().to_frame().T
+
+        with self.metrics.stage('insert', name) as sample:
+            sample['rows'] = self.db_conn.incremental_load({name: df}).get(name, 0)
+        self.db_conn.update_watermarks({name: df})
+
+    def _record_insert(self, stats: Dict[str, Dict[str, Any]]):
+        """Registra nas métricas as estatísticas por tabela devolvidas pelo insert do Banco."""
+        for name, table_stats in (stats or {}).items():
+            self.metrics.record('insert', name, table_stats['seconds'], rows=table_stats['rows'])
+
+    def _track_maxima(
+            self,
+            chunks: Iterator[Tuple[str, pd.DataFrame]],
+            maxima: Dict[str, List[pd.Series]]
+        ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """Repassa os blocos guardando o maior `created_at` e a maior chave de cada bloco em `maxima`."""
+        for name, chunk in chunks:
+            pk_column = self.db_conn.pk_mapping.get(name)
+            maxima.setdefault(name, []).append(chunk[['created_at', pk_column]].max())
+            yield name, chunk
+
+    def stream_data(
+            self,
+            files_list: List[Path],
+            chunksize: int,
+            watermarks: Optional[Dict[str, Dict[str, Any]]] = None,
+            blob_suffix: Optional[str] = '',
+            validation_engine: Optional[str] = 'pandera',
+            quarantine: Optional[bool] = False
+        ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """Lê, valida e grava em Parquet cada arquivo em blocos, entregando os blocos validados.
+
+        O Parquet de cada arquivo é escrito incrementalmente em disco (um row group por bloco)
+        e enviado para a Azure assim que o arquivo termina. Com o Pandera a unicidade das chaves
+        é garantida apenas dentro de cada bloco (entre blocos, pela chave primária no Banco); com
+        o FastValidator ela também é verificada entre os blocos do arquivo.
+
+        Args:
+            files_list (List[Path]): Lista com os diretórios dos arquivos (ex: 'src/docs/data/orders').
+            chunksize (int): Quantidade de linhas por bloco.
+            watermarks (Optional[Dict[str, Dict[str, Any]]]): Watermark por tabela (carga incremental).
+            blob_suffix (Optional[str]): Sufixo do nome do blob.
+            validation_engine (Optional[str]): 'pandera' ou 'fast'.
+            quarantine (Optional[bool]): Separa as linhas inválidas de cada bloco em `rejects`.
+
+        Returns:
+            Iterator[Tuple[str, DataFrame]]: Iterador com ('nome do arquivo', bloco validado).
+        """
+        logger.info('Iniciando Pipeline em blocos...')
+        self.arrow_tables = {}
+
+        for file in files_list:
+            name = Path(file).stem
+            schema = self.validation_schema.get(name)
+            watermark = (watermarks or {}).get(name)
+            validator = FastValidator(schema) if validation_engine == 'fast' else None
+
+            with tempfile.TemporaryDirectory() as temp_dir:
+                parquet_path = Path(temp_dir) / f'{name}.parquet'
+                total = 0
+
+                try:
+                    profile = self.parquet_profiles[name]
+                    with pq.ParquetWriter(parquet_path, arrow_schema(schema), **writer_options(profile)) as writer:
+                        for chunk in self.metrics.iterate('read', name, pd.read_csv(file, chunksize=chunksize)):
+                            if watermark:
+                                chunk = filter_past_watermark(chunk, self.db_conn.pk_mapping.get(name), watermark)
+                            if chunk.empty:
+                                continue
+
+                            df_validado = self._validate_table(name, chunk, validation_engine, quarantine, validator)
+                            if df_validado.empty:
+                                continue
+
+                            with self.metrics.stage('serialize', name, rows=len(df_validado)):
+                                writer.write_table(
+                                    pa.Table.from_pandas(df_validado, schema=writer.schema, preserve_index=False),
+                                    row_group_size=profile['row_group_size']
+                                )
+                            total += len(df_validado)
+
+                            yield name, df_validado
+
+                except Exception as e:
+                    logger.error(f'Erro ao processar {name} em blocos: {str(e)}')
+                    raise
+
+                if not total:
+                    logger.info(f'{name}: nenhuma linha nova.')
+                    continue
+
+                blob_name = self._blob_name(name, blob_suffix)
+                with open(parquet_path, 'rb') as data, \
+                        self.metrics.stage('upload', name, rows=total, bytes=parquet_path.stat().st_size):
+                    etag = self.azure_cloud.upload_data(blob_name, data)
+                self.parquet_cache.put(blob_name, etag, parquet_path)
+                if not blob_suffix:
+                    self._delete_stale_blobs({blob_name: None})
+
+                logger.info(f'{name}: {total} linhas processadas. Pico de memória (RSS): {peak_rss_mb():.1f}MB.')
+
     def get_data(self)  -> List[Path]:
         """Faz a coleta de arquivos do tipo CSV.
         
@@ -105,11 +778,33 @@ class CSVDataSource(GenericDataSource):
             logger.error(f'Erro ao coletar dados: {str(e)}')
             return []
 
-    def transform_data(self, files_list: List[Path]) -> Dict[str, pd.DataFrame]:
+    def transform_data(
+            self,
+            files_list: List[Path],
+            watermarks: Optional[Dict[str, Dict[str, Any]]] = None,
+            chunksize: Optional[int] = 100000,
+            engine: Optional[str] = 'pandas',
+            validation_engine: Optional[str] = 'pandera',
+            quarantine: Optional[bool] = False
+        ) -> Dict[str, pd.DataFrame]:
         """Transforma os arquivos em um dicionário com {'nome do arquivo': DataFrame}.
+
+        Com engine 'arrow', cada arquivo é lido pelo `pyarrow.csv` já com os tipos do schema
+        (colunas enumeradas como dictionary/category). A tabela Arrow fica em `arrow_tables`
+        e é gravada direto no Parquet, sem nova conversão.
+
+        Arquivos sem mudança desde a última validação (mesmo tamanho/mtime, schema, validador e
+        quarentena) são lidos do `validation_cache`, já tipados, e não passam de novo pela validação;
+        `validation_engine` e `quarantine` devem ser os mesmos passados depois a `validate_data`.
         
         Args:
             files_list: Lista com os diretórios dos arquivos (ex: 'src/docs/data/orders').
+            watermarks (Optional[Dict[str, Dict[str, Any]]]): Watermark por tabela (carga incremental).
+                Quando informado, cada arquivo é lido em blocos e apenas as linhas novas são mantidas.
+            chunksize (Optional[int]): Tamanho dos blocos de leitura na carga incremental.
+            engine (Optional[str]): 'pandas' ou 'arrow'.
+            validation_engine (Optional[str]): Validador usado em seguida ('pandera' ou 'fast'), parte da versão do cache.
+            quarantine (Optional[bool]): Quarentena usada em seguida, parte da versão do cache.
 
         Returns:
             Dict(str, DataFrame): Dicionário com {'nome do arquivo': DataFrame}.
@@ -121,13 +816,65 @@ class CSVDataSource(GenericDataSource):
             return {}
 
         df_dict = {}
+        self.arrow_tables = {}
+        self.cached_validations = set()
+        self.pending_validations = {}
+        self.cached_validation_settings = (validation_engine, quarantine)
         try:
             for file in files_list:
                 file_name = Path(file).stem
-                df = pd.read_csv(file)
-                df_dict[file_name] = df
 
-                logger.info(f'{file_name}: {len(df)} linhas, {len(df.columns)} colunas.')
+                with self.metrics.stage('read', file_name, bytes=os.path.getsize(file)) as sample:
+                    cached, cache_tag = self._read_validation_cache(
+                        file, file_name, engine, watermarks, validation_engine, quarantine
+                    )
+                    if cached is not None:
+                        if cached.num_rows == 0:
+                            logger.info(f'{file_name}: nenhuma linha nova.')
+                            continue
+
+                        self.cached_validations.add(file_name)
+                        if engine == 'arrow':
+                            self.arrow_tables[file_name] = cached
+                        df = cached.to_pandas()
+                    elif engine == 'arrow':
+                        schema = self.validation_schema.get(file_name)
+                        table = read_csv_arrow(file, schema, dictionary_columns(file_name, schema))
+                        if watermarks is None:
+                            self.source_files[file_name] = file
+                        else:
+                            table = filter_table_past_watermark(
+                                table,
+                                self.db_conn.pk_mapping.get(file_name),
+                                watermarks.get(file_name)
+                            )
+                            if table.num_rows == 0:
+                                logger.info(f'{file_name}: nenhuma linha nova.')
+                                continue
+
+                        self.arrow_tables[file_name] = table
+                        df = table.to_pandas()
+                    elif watermarks is None:
+                        df = pd.read_csv(file)
+                        self.source_files[file_name] = file
+                    else:
+                        df = read_csv_past_watermark(
+                            file,
+                            self.db_conn.pk_mapping.get(file_name),
+                            watermarks.get(file_name),
+                            chunksize
+                        )
+                        if df.empty:
+                            logger.info(f'{file_name}: nenhuma linha nova.')
+                            continue
+
+                    if cached is None and watermarks is None:
+                        self.pending_validations[file_name] = (file, cache_tag)
+
+                    sample['rows'] = len(df)
+                    df_dict[file_name] = df
+
+                    logger.info(f'{file_name}: {len(df)} linhas, {len(df.columns)} colunas.')
 
             logger.info(f'{len(df_dict)} arquivo(s) transformado(s) com sucesso.')
             return df_dict
@@ -135,12 +882,22 @@ class CSVDataSource(GenericDataSource):
         except Exception as e:
             logger.error(f'Erro ao transformar arquivos: {str(e)}')
             return {}
-        
-    def validate_data(self, df_dict: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
-        """Faz a validação de Dados com Pandera.
+
+    def validate_data(
+            self,
+            df_dict: Dict[str, pd.DataFrame],
+            engine: Optional[str] = 'pandera',
+            quarantine: Optional[bool] = False
+        ) -> Dict[str, pd.DataFrame]:
+        """Faz a validação de Dados com Pandera ou com o FastValidator (mesmos schemas, máscaras vetorizadas).
+
+        Com `quarantine`, as linhas inválidas são separadas em `rejects` e as válidas seguem; a
+        validação só falha se a taxa de rejeição de alguma tabela passar de `reject_thresholds`.
         
         Args:
             df_dict (Dict[str, DataFrame]): Dicionário com {'nome do arquivo': pd.DataFrame}.
+            engine (Optional[str]): 'pandera' ou 'fast'.
+            quarantine (Optional[bool]): Ativa a quarentena de linhas inválidas.
 
         Returns:
             Dict(str, pd.DataFrame): Dicionário com {'nome do arquivo': DataFrame validado}.
@@ -151,12 +908,22 @@ class CSVDataSource(GenericDataSource):
             logger.warning('Validação cancelada. Nenhum arquivo foi passado.')
             return {}
 
+        if self.cached_validation_settings != (engine, quarantine):
+            # O cache foi consultado por `transform_data` com outro validador/quarentena.
+            self.cached_validations, self.pending_validations = set(), {}
+
         df_validate = {}
         try:
             for name, df in df_dict.items():
-                validate_schema = self.validation_schema.get(name)
-                df_validado = validate_schema.validate(df, lazy=True)
+                if name in self.cached_validations:
+                    df_validate[name] = df
+                    logger.info(f'{name} validado (cache).')
+                    continue
+
+                rejected = len(self.rejects.get(name, []))
+                df_validado = self._validate_table(name, df, engine, quarantine)
                 df_validate[name] = df_validado
+                self._write_validation_cache(name, df_validado, rejected=len(self.rejects.get(name, [])) > rejected)
 
                 logger.info(f'{name} validado.' )
 
@@ -167,11 +934,132 @@ class CSVDataSource(GenericDataSource):
             logger.error(f'Erro ao validar dados: {str(e)}')
             return {}
 
-    def load_data(self, df_dict: Dict[str, pd.DataFrame]) -> str:
+    def _read_validation_cache(
+            self,
+            file: Path,
+            name: str,
+            engine: str,
+            watermarks: Optional[Dict[str, Dict[str, Any]]] = None,
+            validation_engine: Optional[str] = 'pandera',
+            quarantine: Optional[bool] = False
+        ) -> Tuple[Optional[pa.Table], str]:
+        """Busca a validação em cache de um arquivo (filtrada pela watermark na carga incremental).
+
+        Returns:
+            Tuple[Optional[pa.Table], str]: (tabela validada ou None, versão do arquivo calculada antes da leitura).
+        """
+        cache_tag = self.validation_cache.tag(
+            file, self.validation_schema.get(name), engine, validation_engine, self._reject_threshold(name, quarantine)
+        )
+        cached = self.validation_cache.get(file, cache_tag)
+        if cached is None:
+            return None, cache_tag
+
+        logger.info(f'{name}: validação reaproveitada do cache.')
+        if watermarks is None:
+            self.source_files[name] = file
+            return cached, cache_tag
+        return filter_table_past_watermark(cached, self.db_conn.pk_mapping.get(name), watermarks.get(name)), cache_tag
+
+    def _reject_threshold(self, name: str, quarantine: Optional[bool] = False) -> Optional[float]:
+        """Limite de rejeição da tabela no modo quarentena, ou None sem quarentena."""
+        return self.reject_thresholds.get(name, self.REJECT_THRESHOLD) if quarantine else None
+
+    def _write_validation_cache(self, name: str, df: pd.DataFrame, rejected: Optional[bool] = False):
+        """Grava no cache a validação de um arquivo lido por inteiro (ver `pending_validations`).
+
+        Arquivos com linhas em quarentena (`rejected`) não são gravados: um acerto de cache pularia
+        o limite de rejeição e a gravação das linhas rejeitadas.
+        """
+        pending = self.pending_validations.pop(name, None)
+        if pending is None or rejected:
+            return
+
+        file, cache_tag = pending
+        try:
+            self.validation_cache.put(file, cache_tag, df)
+        except Exception as e:
+            logger.warning(f'Erro ao gravar o cache de validação de {name}: {str(e)}')
+
+    def _validate_table(
+            self,
+            name: str,
+            df: pd.DataFrame,
+            engine: Optional[str] = 'pandera',
+            quarantine: Optional[bool] = False,
+            validator: Optional[FastValidator] = None
+        ) -> pd.DataFrame:
+        """Valida um DataFrame (ou bloco) de uma tabela, separando as linhas inválidas se `quarantine`."""
+        schema = self.validation_schema.get(name)
+
+        if engine == 'fast':
+            validate = (validator or FastValidator(schema)).validate
+        else:
+            if name in self.arrow_tables:
+                schema = typed_validation_schema(schema, dictionary_columns(name, schema))
+            validate = functools.partial(schema.validate, lazy=True)
+
+        with self.metrics.stage('validate', name, rows=len(df)):
+            if not quarantine:
+                return validate(df)
+
+            df_validado, rejects = validate_with_quarantine(
+                df, validate, self._reject_threshold(name, quarantine), name
+            )
+            if rejects is not None:
+                self.rejects.setdefault(name, []).append(rejects)
+            return df_validado
+
+    def store_rejects(self) -> Dict[str, int]:
+        """Grava as linhas em quarentena na Azure (`quarantine/{tabela}/`) e nas tabelas `*_rejects`.
+
+        Returns:
+            Dict[str, int]: Quantidade de linhas rejeitadas por tabela.
+        """
+        if not self.rejects:
+            return {}
+
+        rejects = {name: pd.concat(frames, ignore_index=True) for name, frames in self.rejects.items()}
+        self.rejects = {}
+
+        try:
+            timestamp = f'{datetime.datetime.now():%Y%m%d%H%M%S}'
+            uploads = {
+                f'quarantine/{name}/rejects_{timestamp}.parquet': write_parquet(pa.Table.from_pandas(df, preserve_index=False))
+                for name, df in rejects.items()
+            }
+            self.azure_cloud.upload_many(self._upload_streams(uploads))
+
+            self.db_conn.create_tables()
+            counts = self.db_conn.insert_rejects(rejects)
+
+            logger.warning(f'Linhas em quarentena: {counts}.')
+            return counts
+
+        except Exception as e:
+            logger.error(f'Erro ao gravar a quarentena: {str(e)}')
+            raise
+
+    def load_data(
+            self,
+            df_dict: Dict[str, pd.DataFrame],
+            blob_suffix: Optional[str] = '',
+            skip_unchanged: Optional[bool] = False
+        ) -> str:
         """Faz o Upload de Arquivos para a Azure.
+
+        Com `skip_unchanged`, o hash do arquivo de origem (ou do Parquet, se a origem for
+        desconhecida) é comparado com o hash gravado nos metadados do blob; se forem iguais,
+        a tabela não é serializada nem enviada.
+
+        Nas tabelas particionadas o marcador `_SUCCESS` (que guarda o hash) só é enviado depois de
+        todas as partições. Na carga full, os arquivos antigos da tabela que não foram regravados
+        (partições e arquivos incrementais) são removidos antes do marcador.
         
         Args:
             df_dict (Dict[str, DataFrame]): Dicionário com {'nome do arquivo': DataFrame}.
+            blob_suffix (Optional[str]): Sufixo do nome do blob (ex: '_20240101000000' na carga incremental).
+            skip_unchanged (Optional[bool]): Ignora tabelas cujo conteúdo não mudou desde o último upload.
 
         Returns:
             str: Mensagem de sucesso, se erro, mensagem de erro.
@@ -179,47 +1067,57 @@ class CSVDataSource(GenericDataSource):
         logger.info('Preparando arquivos para Upload...')
 
         try:
-            for name, df in df_dict.items():
-                parquet_buffer = io.BytesIO()
-                df.to_parquet(parquet_buffer, engine='pyarrow', index=False)
-                parquet_data = parquet_buffer.getvalue()
-
-                blob_name = f'raw_data/{name}.parquet'
-                self.azure_cloud.upload_data(blob_name, parquet_data)
+            remote_hashes = None
+            if skip_unchanged:
+                remote_hashes = {
+                    name: self.azure_cloud.get_blob_metadata(self._hash_blob_name(name, blob_suffix)).get(self.CONTENT_HASH_KEY)
+                    for name in df_dict
+                }
 
-                logger.info(f'Upload concluído para: {blob_name}')
+            uploads, metadata = self._serialize_parquet(df_dict, blob_suffix, remote_hashes)
+            if uploads:
+                parts, markers = self._split_markers(uploads)
+                stats = self.azure_cloud.upload_many(self._upload_streams(parts), metadata=metadata)
+                if not blob_suffix:
+                    self._delete_stale_blobs(uploads)
+                if markers:
+                    stats.update(self.azure_cloud.upload_many(self._upload_streams(markers), metadata=metadata))
+                self._record_transfers('upload', stats)
+                self._cache_uploads(uploads, stats)
 
-            logger.info(f'{len(df_dict)} arquivo(s) salvo(s) com sucesso.')
+            logger.info(f'{len(uploads)} arquivo(s) salvo(s) com sucesso.')
 
         except Exception as e:
             logger.error(f'Erro ao preparar arquivos: {str(e)}')
             raise
 
     def get_data_from_cloud(self) -> List[Path]:
+        """Faz o Download dos arquivos Parquet da Azure para `download_path`.
+
+        Blobs cujo ETag remoto coincide com o do cache local (ex: recém-enviados por `load_data`)
+        não são baixados novamente; o arquivo é servido direto do cache.
+
+        Returns:
+            List[Path]: Lista com os diretórios dos arquivos baixados.
+        """
         logger.info('Fazendo Download de Dados da Azure...')
 
-        file_path = []
         try:
-            blob_files = self.azure_cloud.list_blobs_file()
-            parquet_files = [blob for blob in blob_files if blob.endswith('.parquet')]
+            blob_files = self.azure_cloud.list_blobs_properties()
+            parquet_files = {blob: etag for blob, etag in blob_files.items() if blob.endswith('.parquet')}
 
             if not parquet_files:
                 logger.warning('Nenhum arquivo parquet encontrado')
                 return []
-            
-            temp_dir = Path(self.download_path)
-            temp_dir.mkdir(exist_ok=True)
 
-            for blob in parquet_files:
-                data = self.azure_cloud.download_data(blob)
-                file_name = Path(blob).name
-                full_path = temp_dir / file_name
+            misses = self._serve_from_cache(parquet_files)
+            if misses:
+                with tempfile.TemporaryDirectory(dir=self.parquet_cache.cache_dir) as staging:
+                    stats = self.azure_cloud.download_many(misses, staging)
+                    self._record_transfers('download', stats)
+                    self._store_downloads(misses, parquet_files, staging)
 
-                with open(full_path, 'wb') as file:
-                    file.write(data)
-
-                logger.info(f'Arquivo: {blob} salvo com sucesso.')
-                file_path.append(full_path)
+            file_path = [self._local_path(blob) for blob in parquet_files]
 
             logger.info(f'{len(parquet_files)} arquivo(s) baixado(s) com sucesso.')
             return file_path
@@ -228,11 +1126,316 @@ class CSVDataSource(GenericDataSource):
             logger.error(f'Erro ao baixar arquivo: {str(e)}')
             return []
         
-    def insert_data_into_db(self, df_dict: Dict[str, pd.DataFrame]):
+    @staticmethod
+    def _split_markers(uploads: Dict[str, pa.Buffer]) -> Tuple[Dict[str, pa.Buffer], Dict[str, pa.Buffer]]:
+        """Separa os marcadores `_SUCCESS` dos arquivos Parquet: ({'blob': buffer}, {'marcador': buffer})."""
+        markers = {
+            blob_name: data for blob_name, data in uploads.items()
+            if PurePosixPath(blob_name).name.startswith(PARTITION_SUCCESS_MARKER)
+        }
+        parts = {blob_name: data for blob_name, data in uploads.items() if blob_name not in markers}
+        return parts, markers
+
+    def _stale_blobs(self, uploads: Dict[str, Any], blob_names: List[str]) -> List[str]:
+        """Arquivos Parquet das tabelas recarregadas (full) que não fazem parte de `uploads`.
+
+        Inclui partições que deixaram de existir e os arquivos (e marcadores) das cargas incrementais, cujas
+        linhas já estão no novo arquivo da carga full e seriam lidas em dobro por `read_from_lake` e `lake_blobs`.
+        """
+        stale = []
+        for name in self.validation_schema:
+            if self._hash_blob_name(name, '') not in uploads:
+                continue
+
+            stale += [blob for blob in lake_blobs(blob_names, name, include_incremental=True) if blob not in uploads]
+            stale += [
+                blob for blob in blob_names
+                if blob.startswith(f'raw_data/{name}/{PARTITION_SUCCESS_MARKER}_') and blob not in uploads
+            ]
+        return stale
+
+    def _delete_stale_blobs(self, uploads: Dict[str, Any]):
+        """Remove do Data Lake os arquivos antigos das tabelas recarregadas (ver `_stale_blobs`)."""
+        stale = self._stale_blobs(uploads, self.azure_cloud.list_blobs_file(prefix='raw_data/'))
+        if stale:
+            self.azure_cloud.delete_blobs(stale)
+
+    @staticmethod
+    def _upload_streams(uploads: Dict[str, pa.Buffer]) -> Dict[str, pa.BufferReader]:
+        """Envolve os buffers Parquet em arquivos somente-leitura, entregues ao uploader sem cópia."""
+        return {blob_name: pa.BufferReader(data) for blob_name, data in uploads.items()}
+
+    def _record_transfers(self, stage: str, stats: Dict[str, Dict[str, Any]]):
+        """Registra nas métricas as transferências de `upload_many`/`download_many`, agrupadas por tabela.
+
+        O tempo de cada tabela é a soma dos tempos de transferência dos seus blobs, que correm em paralelo.
+        """
+        tables = {}
+        for blob_name, blob_stats in stats.items():
+            seconds, size = tables.get(self._blob_table(blob_name), (0.0, 0))
+            tables[self._blob_table(blob_name)] = (seconds + blob_stats['seconds'], size + blob_stats['bytes'])
+
+        for table, (seconds, size) in tables.items():
+            self.metrics.record(stage, table, seconds, bytes=size)
+
+    @staticmethod
+    def _blob_table(blob_name: str) -> str:
+        """Tabela de um blob do Data Lake (ex: 'raw_data/orders/created_date=2012-03-19/part.parquet' -> 'orders')."""
+        parts = PurePosixPath(blob_name).parts
+        if len(parts) < 2:
+            return blob_name
+        return re.sub(rf'{BLOB_SUFFIX_PATTERN}?\.parquet$', '', parts[1])
+
+    def _cache_uploads(self, uploads: Dict[str, pa.Buffer], stats: Dict[str, Dict[str, Any]]):
+        """Guarda no cache local os bytes recém-enviados, com o ETag retornado pelo upload."""
+        for blob_name, data in uploads.items():
+            etag = stats.get(blob_name, {}).get('etag')
+            if etag:
+                self.parquet_cache.put(blob_name, etag, data)
+
+    def _serve_from_cache(self, parquet_files: Dict[str, str]) -> List[str]:
+        """Copia para `download_path` os blobs presentes no cache com o mesmo ETag.
+
+        Args:
+            parquet_files (Dict[str, str]): Dicionário com {'nome do blob': ETag remoto}.
+
+        Returns:
+            List[str]: Blobs que não estão no cache e precisam ser baixados.
+        """
+        misses = []
+        for blob, etag in parquet_files.items():
+            cached = self.parquet_cache.get(blob, etag)
+            if cached is None:
+                misses.append(blob)
+                continue
+
+            clone_or_copy(cached, self._local_path(blob))
+            logger.info(f'{blob} servido do cache local.')
+
+        self.parquet_cache.flush()
+        return misses
+
+    def _store_downloads(self, blobs: List[str], parquet_files: Dict[str, str], staging: str):
+        """Move os blobs baixados para o cache e os disponibiliza em `download_path`."""
+        for blob in blobs:
+            cached = self.parquet_cache.put(blob, parquet_files[blob], Path(staging) / blob)
+            clone_or_copy(cached, self._local_path(blob))
+
+    def _local_path(self, blob: str) -> Path:
+        """Caminho local do blob em `download_path`, sem o prefixo (ex: 'orders/created_date=2012-03-19/part.parquet')."""
+        blob_path = PurePosixPath(blob)
+        path = Path(self.download_path).joinpath(*blob_path.parts[1:] or blob_path.parts)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    @staticmethod
+    def _blob_name(name: str, blob_suffix: str) -> str:
+        """Nome do blob Parquet de uma tabela."""
+        return f'raw_data/{name}{blob_suffix}.parquet'
+
+    def _hash_blob_name(self, name: str, blob_suffix: str) -> str:
+        """Blob cujos metadados guardam o hash do conteúdo (o marcador `_SUCCESS` nas tabelas particionadas)."""
+        if name in self.partitioning:
+            return f'raw_data/{name}/{PARTITION_SUCCESS_MARKER}{blob_suffix}'
+        return self._blob_name(name, blob_suffix)
+
+    def _serialize_parquet(
+            self,
+            df_dict: Dict[str, pd.DataFrame],
+            blob_suffix: str,
+            remote_hashes: Optional[Dict[str, Optional[str]]] = None
+        ) -> Tuple[Dict[str, pa.Buffer], Dict[str, Dict[str, str]]]:
+        """Serializa cada DataFrame em Parquet, pulando as tabelas cujo hash coincide com o remoto.
+
+        Cada tabela é gravada com o seu perfil (`parquet_profiles`) direto no buffer do pyarrow.
+
+        Args:
+            df_dict (Dict[str, DataFrame]): Dicionário com {'nome do arquivo': DataFrame}.
+            blob_suffix (str): Sufixo do nome do blob.
+            remote_hashes (Optional[Dict[str, Optional[str]]]): Hash gravado em cada blob; None desativa o skip.
+
+        Returns:
+            Tuple[Dict[str, pa.Buffer], Dict[str, Dict[str, str]]]: ({'nome do blob': buffer}, {'nome do blob': metadados}).
+        """
+        uploads, metadata = {}, {}
+        for name, df in df_dict.items():
+            blob_name = self._hash_blob_name(name, blob_suffix)
+
+            content_hash = None
+            if remote_hashes is not None and name in self.source_files:
+                content_hash = file_sha256(self.source_files[name])
+                if content_hash == remote_hashes.get(name):
+                    logger.info(f'{blob_name} inalterado, upload ignorado.')
+                    continue
+
+            with self.metrics.stage('serialize', name, rows=len(df)) as sample:
+                if name in self.partitioning:
+                    parquet_blobs = partition_dataframe(
+                        df,
+                        name,
+                        granularity=self.partitioning[name],
+                        schema=arrow_schema(self.validation_schema[name]),
+                        profile=self.parquet_profiles[name],
+                        blob_suffix=blob_suffix
+                    )
+                else:
+                    table = self.arrow_tables.get(name)
+                    if table is None or table.num_rows != len(df):
+                        table = pa.Table.from_pandas(df, schema=arrow_schema(self.validation_schema[name]), preserve_index=False)
+                    parquet_blobs = {blob_name: write_parquet(table, self.parquet_profiles[name])}
+                sample['bytes'] = sum(buffer.size for buffer in parquet_blobs.values())
+
+            if remote_hashes is not None and content_hash is None:
+                digest = hashlib.sha256()
+                for parquet_blob in sorted(parquet_blobs):
+                    digest.update(parquet_blobs[parquet_blob])
+                content_hash = digest.hexdigest()
+                if content_hash == remote_hashes.get(name):
+                    logger.info(f'{blob_name} inalterado, upload ignorado.')
+                    continue
+
+            uploads.update(parquet_blobs)
+            if name in self.partitioning:
+                uploads[blob_name] = pa.py_buffer(b'')
+            if content_hash is not None:
+                metadata[blob_name] = {self.CONTENT_HASH_KEY: content_hash}
+
+        return uploads, metadata
+
+    def read_from_lake(
+            self,
+            name: str,
+            start: datetime.datetime,
+            end: datetime.datetime,
+            columns: Optional[List[str]] = None
+        ) -> pd.DataFrame:
+        """Lê do Data Lake as linhas de uma tabela particionada com `start <= created_at < end`.
+
+        Apenas as partições do intervalo são abertas e, delas, apenas os row groups cujas
+        estatísticas de `created_at` cruzam o intervalo são baixados.
+
+        Args:
+            name (str): Nome da tabela (ex: 'orders').
+            start (datetime): Início do intervalo (inclusivo).
+            end (datetime): Fim do intervalo (exclusivo).
+            columns (Optional[List[str]]): Colunas a serem lidas (todas se None).
+
+        Returns:
+            DataFrame: Linhas do intervalo.
+        """
+        if name not in self.partitioning:
+            raise ValueError(f'Tabela {name} não é particionada. Tabelas particionadas: {list(self.partitioning)}.')
+
+        logger.info(f'Lendo {name} entre {start} e {end} do Data Lake...')
+        return read_partitioned(self.azure_cloud, name, start, end, columns=columns)
+
+    async def _transfer_async(self, df_dict: Dict[str, pd.DataFrame], blob_suffix: str, skip_unchanged: bool):
+        """Executa upload e download no mesmo event loop, fechando as conexões ao final."""
+        from src.cloud.async_cloud_connection import AsyncAzureCloud
+
+        self.async_azure_cloud = self.async_azure_cloud or AsyncAzureCloud()
+
+        async with self.async_azure_cloud:
+            await self.load_data_async(df_dict, blob_suffix=blob_suffix, skip_unchanged=skip_unchanged)
+            await self.get_data_from_cloud_async()
+
+    async def load_data_async(
+            self,
+            df_dict: Dict[str, pd.DataFrame],
+            blob_suffix: Optional[str] = '',
+            skip_unchanged: Optional[bool] = False
+        ):
+        """Faz o Upload de Arquivos para a Azure de forma assíncrona (todos os blobs em paralelo).
+
+        Segue a ordem de `load_data`: partições, remoção dos arquivos antigos (carga full) e marcadores `_SUCCESS`.
+
+        Args:
+            df_dict (Dict[str, DataFrame]): Dicionário com {'nome do arquivo': DataFrame}.
+            blob_suffix (Optional[str]): Sufixo do nome do blob.
+            skip_unchanged (Optional[bool]): Ignora tabelas cujo conteúdo não mudou desde o último upload.
+        """
+        logger.info('Preparando arquivos para Upload...')
+
+        try:
+            remote_hashes = None
+            if skip_unchanged:
+                names = list(df_dict)
+                remote_metadata = await asyncio.gather(*(
+                    self.async_azure_cloud.get_blob_metadata(self._hash_blob_name(name, blob_suffix)) for name in names
+                ))
+                remote_hashes = {
+                    name: metadata.get(self.CONTENT_HASH_KEY) for name, metadata in zip(names, remote_metadata)
+                }
+
+            uploads, metadata = await asyncio.to_thread(self._serialize_parquet, df_dict, blob_suffix, remote_hashes)
+            if uploads:
+                parts, markers = self._split_markers(uploads)
+                stats = await self.async_azure_cloud.upload_many(self._upload_streams(parts), metadata=metadata)
+                if not blob_suffix:
+                    blob_names = await self.async_azure_cloud.list_blobs_file(prefix='raw_data/')
+                    stale = self._stale_blobs(uploads, blob_names)
+                    if stale:
+                        await self.async_azure_cloud.delete_blobs(stale)
+                if markers:
+                    stats.update(
+                        await self.async_azure_cloud.upload_many(self._upload_streams(markers), metadata=metadata)
+                    )
+                self._record_transfers('upload', stats)
+                self._cache_uploads(uploads, stats)
+
+            logger.info(f'{len(uploads)} arquivo(s) salvo(s) com sucesso.')
+
+        except Exception as e:
+            logger.error(f'Erro ao preparar arquivos: {str(e)}')
+            raise
+
+    async def get_data_from_cloud_async(self) -> List[Path]:
+        """Faz o Download dos arquivos Parquet da Azure para `download_path` de forma assíncrona.
+
+        Returns:
+            List[Path]: Lista com os diretórios dos arquivos baixados.
+        """
+        logger.info('Fazendo Download de Dados da Azure...')
+
+        try:
+            blob_files = await self.async_azure_cloud.list_blobs_properties()
+            parquet_files = {blob: etag for blob, etag in blob_files.items() if blob.endswith('.parquet')}
+
+            if not parquet_files:
+                logger.warning('Nenhum arquivo parquet encontrado')
+                return []
+
+            misses = self._serve_from_cache(parquet_files)
+            if misses:
+                with tempfile.TemporaryDirectory(dir=self.parquet_cache.cache_dir) as staging:
+                    stats = await self.async_azure_cloud.download_many(misses, staging)
+                    self._record_transfers('download', stats)
+                    self._store_downloads(misses, parquet_files, staging)
+
+            file_path = [self._local_path(blob) for blob in parquet_files]
+
+            logger.info(f'{len(parquet_files)} arquivo(s) baixado(s) com sucesso.')
+            return file_path
+
+        except Exception as e:
+            logger.error(f'Erro ao baixar arquivo: {str(e)}')
+            return []
+
+    def insert_data_into_db(
+            self,
+            df_dict: Dict[str, pd.DataFrame],
+            method: Optional[str] = 'orm',
+            run_id: Optional[str] = None,
+            max_workers: Optional[int] = None
+        ):
         logger.info('Inserindo Dados...')
 
         try:
-            self.db_conn.insert_data(df_dict)
+            if max_workers:
+                stats = self.db_conn.parallel_insert(df_dict, method=method, max_workers=max_workers, run_id=run_id)
+            else:
+                stats = self.db_conn.insert_data(df_dict, method=method, run_id=run_id)
+            self._record_insert(stats)
             logger.info('Inserção de Dados concluida com sucesso.')
 
         except Exception as e:
@@ -0,0 +1,299 @@
+import re
+import argparse
+import datetime
+import logging
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from typing import TYPE_CHECKING, Optional, List, Dict, Iterator, Tuple
+
+from src.cloud.storage_backend import StorageBackend, storage_backend
+from src.environment import setup_environment
+from src.parquet.profiles import DEFAULT_ROW_GROUP_SIZE
+
+if TYPE_CHECKING:
+    # Importado sob demanda em `db_conn`: o SQLAlchemy só carrega no primeiro acesso ao Banco.
+    from src.database.db_connection import DBConnection
+
+logger = logging.getLogger(__name__)
+
+BLOB_SUFFIX_PATTERN = r'(?:_\d{14})'
+BLOB_SUFFIX_REGEX = re.compile(rf'({BLOB_SUFFIX_PATTERN})\.parquet$')
+
+
+def blob_load_stamp(blob_name: str) -> str:
+    """Sufixo `_YYYYmmddHHMMSS` de um arquivo incremental, ou '' para os arquivos das cargas full."""
+    match = BLOB_SUFFIX_REGEX.search(blob_name)
+    return match.group(1) if match else ''
+
+
+def lake_blobs(
+        blob_names: List[str],
+        name: str,
+        include_incremental: Optional[bool] = False,
+        prefix: Optional[str] = 'raw_data'
+    ) -> List[str]:
+    """Seleciona os arquivos Parquet de uma tabela no Data Lake, na ordem em que foram carregados.
+
+    Reconhece o arquivo único (`raw_data/orders.parquet`) e o layout particionado
+    (`raw_data/orders/created_date=2012-03-19/part.parquet`); os arquivos das cargas
+    incrementais (`_YYYYmmddHHMMSS`) só entram com `include_incremental`, depois dos
+    arquivos da carga full e ordenados pelo sufixo.
+
+    Args:
+        blob_names (List[str]): Blobs do Container (ex: `list_blobs_file(prefix)`).
+        name (str): Nome da tabela (ex: 'orders').
+        include_incremental (Optional[bool]): Inclui os arquivos das cargas incrementais.
+        prefix (Optional[str]): Prefixo dos blobs.
+
+    Returns:
+        List[str]: Blobs da tabela: os da carga full pelo nome, seguidos dos incrementais do mais antigo ao mais novo.
+    """
+    suffix = f'{BLOB_SUFFIX_PATTERN}?' if include_incremental else ''
+    pattern = re.compile(
+        rf'^{re.escape(prefix)}/{re.escape(name)}(?:{suffix}|/[^/]+=[^/]+/part{suffix})\.parquet$'
+    )
+    return sorted((blob for blob in blob_names if pattern.match(blob)), key=lambda blob: (blob_load_stamp(blob), blob))
+
+
+def iter_parquet_batches(
+        storage: StorageBackend,
+        blob_names: List[str],
+        batch_size: Optional[int] = DEFAULT_ROW_GROUP_SIZE,
+        columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+    """Lê os arquivos Parquet direto do Blob, um lote de cada vez (`ParquetFile.iter_batches`).
+
+    Os blobs são lidos por intervalo de bytes (rodapé e row groups), então a memória fica
+    limitada a um lote, e não ao tamanho do arquivo.
+
+    Args:
+        storage (StorageBackend): Armazenamento do Data Lake (ex: AzureCloud ou LocalStorage).
+        blob_names (List[str]): Blobs a serem lidos, em ordem.
+        batch_size (Optional[int]): Linhas por lote (padrão: o tamanho do row group da escrita).
+        columns (Optional[List[str]]): Colunas a serem lidas (todas se None).
+
+    Returns:
+        Iterator[DataFrame]: Lotes em ordem.
+    """
+    for blob_name in blob_names:
+        with storage.open_blob(blob_name) as source:
+            parquet_file = pq.ParquetFile(source)
+            logger.info(
+                f'{blob_name}: {parquet_file.metadata.num_rows} linhas em {parquet_file.metadata.num_row_groups} row group(s).'
+            )
+            for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+                yield batch.to_pandas()
+
+
+class LakeLoader:
+    """Classe responsável por carregar o Banco de Dados a partir dos arquivos Parquet do Data Lake.
+
+    Não depende da ingestão dos CSVs: serve para reprocessamentos, backfills e workers de carga
+    separados, com memória limitada a um lote por vez.
+    """
+
+    LAKE_MODES = ('full', 'incremental')
+
+    def __init__(
+            self,
+            azure_cloud: Optional[StorageBackend] = None,
+            db_conn: Optional['DBConnection'] = None,
+            prefix: Optional[str] = 'raw_data',
+            batch_size: Optional[int] = DEFAULT_ROW_GROUP_SIZE
+        ):
+        """Inicializa a classe LakeLoader.
+
+        Args:
+            azure_cloud (Optional[StorageBackend]): Armazenamento do Data Lake (padrão: `storage_backend()`).
+            db_conn (Optional[DBConnection]): Conexão com o Banco de Dados.
+            prefix (Optional[str]): Prefixo dos blobs do Data Lake.
+            batch_size (Optional[int]): Linhas por lote lido do Parquet.
+        """
+        setup_environment()
+
+        self.azure_cloud = azure_cloud or storage_backend()
+        self._db_conn = db_conn
+        self.prefix = prefix
+        self.batch_size = batch_size
+
+    @property
+    def db_conn(self) -> 'DBConnection':
+        """Conexão com o Banco, criada no primeiro uso (o SQLAlchemy só é importado nesse momento)."""
+        if self._db_conn is None:
+            from src.database.db_connection import DBConnection
+
+            self._db_conn = DBConnection()
+        return self._db_conn
+
+    def start(
+            self,
+            tables: Optional[List[str]] = None,
+            mode: Optional[str] = 'full',
+            load_method: Optional[str] = 'copy_binary',
+            run_id: Optional[str] = None,
+            deferred_indexes: Optional[bool] = False
+        ) -> Dict[str, int]:
+        """Carrega as tabelas no Banco a partir do Data Lake.
+
+        No modo 'full' todos os arquivos são carregados nas tabelas sombra, mantendo de cada chave
+        apenas a versão do arquivo mais recente (ver `iter_latest_batches`), e as tabelas sombra são
+        trocadas pelas tabelas `raw_*` ao final (ver `DBConnection.swap_shadow_tables`); com `run_id`
+        cada lote é gravado com checkpoint e uma nova execução com o mesmo `run_id` retoma a carga.
+        No modo 'incremental' todos os arquivos (inclusive os incrementais) são carregados via
+        anti-join, inserindo apenas chaves novas, o que torna o reprocessamento idempotente.
+
+        Args:
+            tables (Optional[List[str]]): Tabelas a serem carregadas (padrão: todas de `ORM_MAPPING`).
+            mode (Optional[str]): 'full' ou 'incremental'.
+            load_method (Optional[str]): Método de carga do modo 'full' ('orm', 'copy_csv' ou 'copy_binary').
+            run_id (Optional[str]): Identificador da execução, para retomar cargas interrompidas.
+            deferred_indexes (Optional[bool]): No modo 'full', cria chave primária e índices só ao final da carga.
+
+        Returns:
+            Dict[str, int]: Quantidade de linhas lidas do Data Lake por tabela.
+        """
+        if mode not in self.LAKE_MODES:
+            raise ValueError(f'Modo inválido: {mode}. Use um de {self.LAKE_MODES}.')
+
+        start_time = datetime.datetime.now()
+        tables = tables or list(self.db_conn.ORM_MAPPING)
+
+        blob_names = self.azure_cloud.list_blobs_file(f'{self.prefix}/')
+        blobs = {
+            name: lake_blobs(blob_names, name, include_incremental=True, prefix=self.prefix)
+            for name in tables
+        }
+        for name in [name for name, table_blobs in blobs.items() if not table_blobs]:
+            logger.warning(f'{name}: nenhum arquivo encontrado no Data Lake.')
+            del blobs[name]
+
+        if not blobs:
+            logger.warning('Nenhum dado para carregar.')
+            return {}
+
+        rows = {}
+        maxima = {}
+        batches = self._track_batches(self.iter_batches(blobs, latest_only=mode == 'full'), rows, maxima)
+
+        try:
+            if mode == 'full':
+                resume = bool(run_id and self.db_conn.get_checkpoints(run_id))
+                self.db_conn.create_shadow_tables(
+                    deferred_indexes=deferred_indexes,
+                    unlogged=run_id is None,
+                    keep_existing=resume,
+                    tables=list(blobs)
+                )
+                self.db_conn.insert_stream(
+                    batches, method=load_method, run_id=run_id, chunking=f'sequential:{self.batch_size}'
+                )
+                if deferred_indexes:
+                    self.db_conn.build_indexes()
+                self.db_conn.swap_shadow_tables(run_id=run_id)
+                self.db_conn.update_watermarks({name: pd.DataFrame(values) for name, values in maxima.items()})
+            else:
+                self.db_conn.create_tables()
+                for name, batch in batches:
+                    self.db_conn.incremental_load({name: batch})
+                    self.db_conn.update_watermarks({name: batch})
+
+        except Exception as e:
+            logger.error(f'Erro ao carregar o Data Lake no Banco de Dados: {str(e)}')
+            raise
+
+        pipeline_time = (datetime.datetime.now() - start_time).total_seconds()
+        logger.info(f'Carga do Data Lake concluída em: {pipeline_time / 60:.2f}min ({sum(rows.values())} linhas).')
+        return rows
+
+    def iter_batches(
+            self,
+            blobs: Dict[str, List[str]],
+            latest_only: Optional[bool] = False
+        ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """Entrega ('nome da tabela', lote) de cada tabela, no formato esperado por `insert_stream`.
+
+        Args:
+            blobs (Dict[str, List[str]]): Dicionário com {'nome da tabela': blobs a serem lidos}.
+            latest_only (Optional[bool]): Mantém só a versão mais recente de cada chave (ver `iter_latest_batches`).
+
+        Returns:
+            Iterator[Tuple[str, DataFrame]]: Lotes de cada tabela, em ordem.
+        """
+        for name, table_blobs in blobs.items():
+            if latest_only:
+                table_batches = self.iter_latest_batches(name, table_blobs)
+            else:
+                table_batches = iter_parquet_batches(self.azure_cloud, table_blobs, self.batch_size)
+            for batch in table_batches:
+                yield name, batch
+
+    def iter_latest_batches(self, name: str, blob_names: List[str]) -> Iterator[pd.DataFrame]:
+        """Lê os arquivos de uma tabela mantendo só a versão mais recente de cada chave (o último arquivo vence).
+
+        Os arquivos incrementais são lidos do mais novo para o mais antigo e os da carga full por
+        último; as chaves entregues pelos incrementais são guardadas (um índice com hash) e
+        descartadas dos arquivos seguintes, então cada lote custa O(lote) e a memória fica
+        limitada às chaves dos arquivos incrementais.
+
+        Args:
+            name (str): Nome da tabela.
+            blob_names (List[str]): Blobs da tabela, na ordem de `lake_blobs`.
+
+        Returns:
+            Iterator[DataFrame]: Lotes sem chaves repetidas.
+        """
+        pk_column = self.db_conn.pk_mapping.get(name)
+        incremental = [blob for blob in blob_names if blob_load_stamp(blob)]
+        full = [blob for blob in blob_names if not blob_load_stamp(blob)]
+
+        seen = pd.Index([])
+        for blob_name in incremental[::-1] + full:
+            keys = []
+            for batch in iter_parquet_batches(self.azure_cloud, [blob_name], self.batch_size):
+                if len(seen):
+                    batch = batch[seen.get_indexer(batch[pk_column]) < 0]
+                if batch.empty:
+                    continue
+                if blob_load_stamp(blob_name):
+                    keys.append(batch[pk_column].to_numpy())
+                yield batch
+
+            if keys:
+                seen = pd.Index(np.concatenate([seen.to_numpy(), *keys]))
+
+    def _track_batches(
+            self,
+            batches: Iterator[Tuple[str, pd.DataFrame]],
+            rows: Dict[str, int],
+            maxima: Dict[str, List[pd.Series]]
+        ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """Repassa os lotes contando as linhas e guardando o maior `created_at` e a maior chave de cada lote."""
+        for name, batch in batches:
+            rows[name] = rows.get(name, 0) + len(batch)
+            if not batch.empty:
+                pk_column = self.db_conn.pk_mapping.get(name)
+                maxima.setdefault(name, []).append(batch[['created_at', pk_column]].max())
+            yield name, batch
+
+
+if __name__ == '__main__':
+    from src.database.db_connection import DBConnection
+
+    parser = argparse.ArgumentParser(description='Carrega o Banco de Dados a partir dos arquivos Parquet do Data Lake.')
+    parser.add_argument('--tables', nargs='*', help='Tabelas a serem carregadas (padrão: todas).')
+    parser.add_argument('--mode', choices=LakeLoader.LAKE_MODES, default='full')
+    parser.add_argument('--load-method', choices=DBConnection.LOAD_METHODS, default='copy_binary')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_ROW_GROUP_SIZE, help='Linhas por lote.')
+    parser.add_argument('--run-id', help='Identificador da execução, para retomar uma carga interrompida.')
+    parser.add_argument('--deferred-indexes', action='store_true', help='Cria chave primária e índices ao final.')
+    args = parser.parse_args()
+
+    LakeLoader(batch_size=args.batch_size).start(
+        tables=args.tables,
+        mode=args.mode,
+        load_method=args.load_method,
+        run_id=args.run_id,
+        deferred_indexes=args.deferred_indexes
+    )
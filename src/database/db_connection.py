@@ -1,11 +1,16 @@
 import os
+import math
+import time
 import logging
+import threading
 import pandas as pd
 
-from dotenv import load_dotenv
-from typing import Optional, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, Any, Iterator, Tuple, Set, Callable, List
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text, func, literal_column, select, any_, bindparam, MetaData, Table
+from sqlalchemy.exc import DBAPIError, OperationalError, InterfaceError
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.orm import sessionmaker
 
 from src.database.db_model import (
@@ -15,22 +20,45 @@ from src.database.db_model import (
     OrderItemRefundTable,
     ProductsTable,
     WebSiteSessionsTable,
-    WebSitePageViewsTable
+    WebSitePageViewsTable,
+    PipelineWatermarkTable,
+    PipelineCheckpointTable,
+    REJECTS_TABLES
 )
+from src.database.pg_copy import copy_dataframe, copy_columns
+from src.environment import setup_environment
 
 logger = logging.getLogger(__name__)
 
 class DBConnection:
     """Classe responsável por fazer as conexões com o Banco de Dados."""
 
-    def __init__(self):
-        """Inicializa a classe DBConnection."""
-        load_dotenv()
+    LOAD_METHODS = ('orm', 'copy_csv', 'copy_binary')
+    UPSERT_METHODS = ('orm', 'on_conflict', 'copy_merge')
+    INCREMENTAL_METHODS = ('pushdown', 'vectorized')
 
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+    def __init__(
+            self,
+            pool_size: Optional[int] = 5,
+            max_overflow: Optional[int] = 10,
+            pool_pre_ping: Optional[bool] = True,
+            pool_recycle: Optional[int] = 1800,
+            max_retries: Optional[int] = 3,
+            retry_backoff: Optional[float] = 1.0,
+            url: Optional[str] = None
+        ):
+        """Inicializa a classe DBConnection.
+
+        Args:
+            pool_size (Optional[int]): Conexões mantidas abertas no pool.
+            max_overflow (Optional[int]): Conexões extras permitidas acima de `pool_size` em picos (ex: modo paralelo).
+            pool_pre_ping (Optional[bool]): Testa a conexão antes de usá-la, descartando conexões mortas (ex: após failover).
+            pool_recycle (Optional[int]): Idade máxima, em segundos, de uma conexão do pool.
+            max_retries (Optional[int]): Novas tentativas de um bloco após queda de conexão (cargas com `run_id`).
+            retry_backoff (Optional[float]): Espera inicial entre tentativas, em segundos (dobra a cada tentativa).
+            url (Optional[str]): URL do Banco (ex: um Postgres em container nos benchmarks); padrão: montada a partir de DB_*.
+        """
+        setup_environment()
         
         self.db_user = os.getenv('DB_USER')
         self.db_pass = os.getenv('DB_PASS')
@@ -38,18 +66,18 @@ class DBConnection:
         self.db_port = os.getenv('DB_PORT')
         self.db_name = os.getenv('DB_NAME')
 
-        try:
-            self.engine = create_engine(
-                f'postgresql://{self.db_user}:{self.db_pass}@{self.db_host}:{self.db_port}/{self.db_name}',
-                echo=False
-            )
-
-            self._Session = sessionmaker(bind=self.engine)
-            self.Base = Base
+        self.url = url or f'postgresql://{self.db_user}:{self.db_pass}@{self.db_host}:{self.db_port}/{self.db_name}'
+        self.engine_options = {
+            'pool_size': pool_size,
+            'max_overflow': max_overflow,
+            'pool_pre_ping': pool_pre_ping,
+            'pool_recycle': pool_recycle
+        }
+        self.Base = Base
 
-        except Exception as e:
-            logger.error(f'Erro ao se conectar ao Banco de Dados: {str(e)}')
-            raise
+        self._engine = None
+        self._session_factory = None
+        self._engine_lock = threading.Lock()
 
         self.ORM_MAPPING = {
             'orders': OrderTable,
@@ -60,6 +88,14 @@ class DBConnection:
             'website_pageviews': WebSitePageViewsTable
         }
 
+        self.shadow_metadata = MetaData()
+        self.shadow_tables = {}
+
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
         self.pk_mapping = {
             'orders': 'order_id',
             'order_items': 'order_item_id',
@@ -69,58 +105,311 @@ class DBConnection:
             'website_pageviews': 'website_pageview_id'
         }
 
-    def create_tables(self):
-        """Cria as Tabelas do Banco de Dados."""
+    @property
+    def engine(self):
+        """Engine do SQLAlchemy, criado no primeiro uso (o driver do Banco só é carregado nesse momento)."""
+        return self._connect()
+
+    @property
+    def _Session(self):
+        """Fábrica de sessões ligada ao `engine`."""
+        self._connect()
+        return self._session_factory
+
+    def _connect(self):
+        """Cria o engine e a fábrica de sessões, se ainda não existirem."""
+        # Cargas paralelas (`parallel_insert`) podem fazer o primeiro acesso ao mesmo tempo.
+        with self._engine_lock:
+            if self._engine is None:
+                try:
+                    self._engine = create_engine(self.url, echo=False, **self.engine_options)
+                    self._session_factory = sessionmaker(bind=self._engine)
+
+                except Exception as e:
+                    logger.error(f'Erro ao se conectar ao Banco de Dados: {str(e)}')
+                    raise
+        return self._engine
+
+    def create_tables(self, deferred_indexes: Optional[bool] = False, unlogged: Optional[bool] = True):
+        """Cria as Tabelas do Banco de Dados.
+
+        Com `deferred_indexes` (carga full), as tabelas de carga (ver `create_shadow_tables`) ficam
+        sem chave primária e sem índices, e como UNLOGGED, para a carga em massa não manter índices
+        nem gravar WAL linha a linha; `build_indexes` recria tudo de uma vez ao final da carga.
+
+        Args:
+            deferred_indexes (Optional[bool]): Cria as tabelas de dados sem chave primária e índices.
+            unlogged (Optional[bool]): Com `deferred_indexes`, cria as tabelas de dados como UNLOGGED.
+        """
         logger.info('Criando Tabelas....')
 
         try:
             self.Base.metadata.create_all(self.engine)
+
+            if deferred_indexes:
+                self._defer_indexes(unlogged)
+
             logger.info('Tabelas criadas com sucesso.')
 
         except Exception as e:
             logger.error(f'Erro ao criar as tabelas: {str(e)}')
             raise
 
+    def _defer_indexes(self, unlogged: bool):
+        """Remove chave primária e índices das tabelas de carga (e as torna UNLOGGED)."""
+        with self.engine.begin() as connection:
+            for name in self._load_targets():
+                table = self._target_table(name)
+                connection.execute(text(
+                    f'ALTER TABLE "{table.name}" DROP CONSTRAINT IF EXISTS "{self._pk_constraint_name(table)}"'
+                ))
+                for index in table.indexes:
+                    connection.execute(text(f'DROP INDEX IF EXISTS "{index.name}"'))
+                if unlogged:
+                    connection.execute(text(f'ALTER TABLE "{table.name}" SET UNLOGGED'))
+        logger.info('Tabelas de dados criadas sem índices para a carga em massa.')
+
+    def create_shadow_tables(
+            self,
+            deferred_indexes: Optional[bool] = False,
+            unlogged: Optional[bool] = True,
+            keep_existing: Optional[bool] = False,
+            tables: Optional[List[str]] = None
+        ):
+        """Cria as tabelas sombra (`{tabela}__next`) que recebem a carga full.
+
+        Enquanto a carga roda, as tabelas `raw_*` continuam com os dados anteriores e disponíveis
+        para leitura; `swap_shadow_tables` as substitui de uma vez. As demais tabelas (watermarks,
+        checkpoints, quarentena) são criadas normalmente.
+
+        Args:
+            deferred_indexes (Optional[bool]): Cria as tabelas sombra sem chave primária e índices.
+            unlogged (Optional[bool]): Com `deferred_indexes`, cria as tabelas sombra como UNLOGGED.
+            keep_existing (Optional[bool]): Mantém as tabelas sombra já existentes (retomada de uma execução
+                com `run_id`); caso contrário, sobras de execuções anteriores são descartadas.
+            tables (Optional[List[str]]): Tabelas recarregadas (padrão: todas de `ORM_MAPPING`); as demais
+                continuam recebendo carga direto e não são trocadas.
+        """
+        logger.info('Criando tabelas sombra...')
+
+        try:
+            self.Base.metadata.create_all(self.engine)
+
+            self.shadow_metadata = MetaData()
+            self.shadow_tables = {
+                name: model.__table__.to_metadata(self.shadow_metadata, name=f'{model.__tablename__}__next')
+                for name, model in self.ORM_MAPPING.items()
+                if tables is None or name in tables
+            }
+            if not keep_existing:
+                self.shadow_metadata.drop_all(self.engine)
+            self.shadow_metadata.create_all(self.engine)
+
+            if deferred_indexes:
+                self._defer_indexes(unlogged)
+
+            logger.info(f'{len(self.shadow_tables)} tabela(s) sombra criada(s).')
+
+        except Exception as e:
+            logger.error(f'Erro ao criar as tabelas sombra: {str(e)}')
+            self.shadow_tables = {}
+            raise
+
+    def swap_shadow_tables(self, run_id: Optional[str] = None):
+        """Substitui as tabelas `raw_*` pelas tabelas sombra em uma única transação.
+
+        Cada tabela antiga é descartada e a sombra renomeada para o seu nome, junto com a chave
+        primária e a sequência; as watermarks das tabelas trocadas são zeradas (a carga full as
+        recalcula) e os checkpoints de `run_id` são apagados. Leitores veem os dados antigos até
+        o commit e os novos logo depois, sem janela com tabelas vazias.
+
+        Args:
+            run_id (Optional[str]): Execução concluída, cujos checkpoints são removidos.
+        """
+        if not self.shadow_tables:
+            raise ValueError('Nenhuma tabela sombra para trocar; chame create_shadow_tables antes.')
+
+        logger.info('Trocando as tabelas sombra pelas tabelas de dados...')
+
+        try:
+            with self.engine.begin() as connection:
+                for name, shadow in self.shadow_tables.items():
+                    table = self.ORM_MAPPING[name].__table__
+                    connection.execute(text(f'DROP TABLE IF EXISTS "{table.name}"'))
+                    connection.execute(text(f'ALTER TABLE "{shadow.name}" RENAME TO "{table.name}"'))
+                    connection.execute(text(
+                        f'ALTER INDEX IF EXISTS "{self._pk_constraint_name(shadow)}" RENAME TO "{self._pk_constraint_name(table)}"'
+                    ))
+                    for column in table.primary_key.columns:
+                        connection.execute(text(
+                            f'ALTER SEQUENCE IF EXISTS "{shadow.name}_{column.name}_seq" RENAME TO "{table.name}_{column.name}_seq"'
+                        ))
+
+                watermarks = PipelineWatermarkTable.__table__
+                connection.execute(watermarks.delete().where(watermarks.c.table_name.in_(list(self.shadow_tables))))
+                if run_id is not None:
+                    checkpoints = PipelineCheckpointTable.__table__
+                    connection.execute(checkpoints.delete().where(checkpoints.c.run_id == run_id))
+
+            logger.info(f'{len(self.shadow_tables)} tabela(s) trocada(s) com sucesso.')
+            self.shadow_tables = {}
+
+        except Exception as e:
+            logger.error(f'Erro ao trocar as tabelas sombra: {str(e)}')
+            raise
+
+    def _load_targets(self) -> List[str]:
+        """Tabelas da carga em andamento: as que têm sombra ou, sem sombras, todas de `ORM_MAPPING`."""
+        return list(self.shadow_tables) or list(self.ORM_MAPPING)
+
+    def _target_table(self, name: str) -> Table:
+        """Tabela que recebe a carga: a sombra, durante uma carga full, ou a própria tabela."""
+        return self.shadow_tables.get(name, self.ORM_MAPPING[name].__table__)
+
+    def build_indexes(self) -> Dict[str, float]:
+        """Recria chave primária e índices das tabelas de dados após a carga em massa (ver `create_tables`).
+
+        Cada tabela de carga (a sombra, se houver) ganha a chave primária (um único sort, em vez da
+        manutenção linha a linha durante a carga) e os índices do modelo, volta a ser LOGGED e tem
+        as estatísticas atualizadas com ANALYZE. Tabelas que já têm chave primária são apenas analisadas.
+
+        Returns:
+            Dict[str, float]: Tempo, em segundos, gasto em cada tabela.
+        """
+        logger.info('Criando chaves primárias e índices...')
+
+        timings = {}
+        try:
+            for name in self._load_targets():
+                table = self._target_table(name)
+                start_time = time.perf_counter()
+
+                with self.engine.begin() as connection:
+                    has_pk = connection.execute(text(
+                        "SELECT 1 FROM pg_constraint WHERE conrelid = CAST(:table AS regclass) AND contype = 'p'"
+                    ), {'table': f'"{table.name}"'}).first()
+
+                    if not has_pk:
+                        pk_list = ', '.join(f'"{column.name}"' for column in table.primary_key.columns)
+                        connection.execute(text(
+                            f'ALTER TABLE "{table.name}" ADD CONSTRAINT "{self._pk_constraint_name(table)}" PRIMARY KEY ({pk_list})'
+                        ))
+                    for index in table.indexes:
+                        index.create(connection, checkfirst=True)
+
+                    connection.execute(text(f'ALTER TABLE "{table.name}" SET LOGGED'))
+                    connection.execute(text(f'ANALYZE "{table.name}"'))
+
+                timings[table.name] = time.perf_counter() - start_time
+                logger.info(f'{table.name}: índices criados em {timings[table.name]:.2f}s.')
+
+            return timings
+
+        except Exception as e:
+            logger.error(f'Erro ao criar os índices: {str(e)}')
+            raise
+
+    @staticmethod
+    def _pk_constraint_name(table) -> str:
+        """Nome da constraint de chave primária (padrão do PostgreSQL: `{tabela}_pkey`)."""
+        return table.primary_key.name or f'{table.name}_pkey'
+
     def drop_tables(self):
-        """Deleta TODAS as Tabelas do Banco de Dados."""
+        """Deleta TODAS as Tabelas do Banco de Dados (exceto os checkpoints de carga)."""
         logger.warning('Deletando TODAS as Tabelas do Banco de Dados...')
 
         try:
-            self.Base.metadata.drop_all(self.engine)
+            tables = [
+                table for table in self.Base.metadata.sorted_tables
+                if table is not PipelineCheckpointTable.__table__
+            ]
+            self.Base.metadata.drop_all(self.engine, tables=tables)
             logger.info('Tabelas deletadas com sucesso.')
 
         except Exception as e:
             logger.error(f'Erro ao deletar as tabelas: {str(e)}')
             raise
 
-    def insert_data(self, df_dict: Dict[str, pd.DataFrame], batch_size: Optional[int] = 1000) -> str:
+    def insert_data(
+            self,
+            df_dict: Dict[str, pd.DataFrame],
+            batch_size: Optional[int] = 1000,
+            method: Optional[str] = 'orm',
+            run_id: Optional[str] = None,
+            chunking: Optional[str] = 'sequential'
+        ) -> Dict[str, Dict[str, float]]:
         """Insere Dados no Banco de Dados.
+
+        Todas as tabelas são carregadas em uma única transação (tudo ou nada); com `run_id`,
+        cada tabela é uma transação com checkpoint (ver `insert_stream`).
         
         Args:
             df_dict (Dict[str, DataFrame]): Dicionário com {'nome do arquivo': pd.DataFrame}.
             batch_size (Optional[int]): Tamanho do lote a ser inserido.
+            method (Optional[str]): 'orm' (bulk_insert_mappings), 'copy_csv' ou 'copy_binary' (COPY FROM STDIN).
+            run_id (Optional[str]): Identificador da execução, para retomar cargas interrompidas.
+            chunking (Optional[str]): Esquema de divisão em blocos gravado nos checkpoints (ver `insert_stream`).
 
         Returns:
-            str: Mensagem de sucesso, se erro, mensagem de erro.
+            Dict[str, Dict[str, float]]: Estatísticas por tabela ({'rows', 'seconds', 'rows_per_sec'}).
+        """
+        return self.insert_stream(
+            iter(df_dict.items()), batch_size=batch_size, method=method, run_id=run_id, chunking=chunking
+        )
+
+    def insert_stream(
+            self,
+            chunks: Iterator[Tuple[str, pd.DataFrame]],
+            batch_size: Optional[int] = 1000,
+            method: Optional[str] = 'orm',
+            run_id: Optional[str] = None,
+            chunking: Optional[str] = 'sequential'
+        ) -> Dict[str, Dict[str, float]]:
+        """Insere blocos de Dados no Banco de Dados à medida que são produzidos.
+
+        Os blocos são consumidos um a um (memória limitada ao bloco corrente) e todos são
+        carregados em uma única transação (tudo ou nada).
+
+        Com `run_id`, cada bloco é carregado em sua própria transação junto com o seu checkpoint
+        (`etl_load_checkpoints`): um bloco que falha por queda de conexão é repetido com backoff
+        exponencial (até `max_retries`), e uma nova chamada com o mesmo `run_id` pula os blocos
+        já gravados. Os blocos são identificados pela ordem em que chegam de cada tabela, então o
+        índice só identifica o mesmo bloco se a divisão for a mesma: `chunking` descreve essa divisão
+        (ex: 'sequential:100000' para blocos de 100 mil linhas), é gravado com cada checkpoint e uma
+        retomada com outro esquema é rejeitada (ver `get_checkpoints`).
+
+        Args:
+            chunks (Iterator[Tuple[str, DataFrame]]): Iterador com ('nome do arquivo', DataFrame).
+            batch_size (Optional[int]): Tamanho do lote a ser inserido.
+            method (Optional[str]): 'orm' (bulk_insert_mappings), 'copy_csv' ou 'copy_binary' (COPY FROM STDIN).
+            run_id (Optional[str]): Identificador da execução, para retomar cargas interrompidas.
+            chunking (Optional[str]): Esquema de divisão em blocos (padrão: 'sequential', um bloco por DataFrame recebido).
+
+        Returns:
+            Dict[str, Dict[str, float]]: Estatísticas por tabela ({'rows', 'seconds', 'rows_per_sec'}).
         """
         logger.info('Inserindo Dados no Banco de Dados...')
 
+        if method not in self.LOAD_METHODS:
+            raise ValueError(f'Método de carga inválido: {method}. Use um de {self.LOAD_METHODS}.')
+
+        if run_id is not None:
+            return self._insert_checkpointed(chunks, batch_size, method, run_id, chunking)
+
         session = self._Session()
 
+        stats = {}
         try:
-            for name, df in df_dict.items():
-                model = self.ORM_MAPPING.get(name)
-                records = df.to_dict(orient='records')
-                total = len(records)
+            for name, df in chunks:
+                start_time = time.perf_counter()
+                total = self._load_table(session, name, df, method, batch_size)
+                self._add_stats(stats, name, total, time.perf_counter() - start_time)
 
-                for i in range(0, total, batch_size):
-                    batch = records[i:i + batch_size]
-                    session.bulk_insert_mappings(model, batch)
-                    
-                logger.info(f'{total} linhas inseridas em: {name}')
+            self._log_stats(stats)
 
             session.commit()
             logger.info('Valores inseridos com sucesso.')
+            return stats
 
         except Exception as e:
             logger.error(f'Erro ao inserir dados: {str(e)}')
@@ -130,6 +419,322 @@ class DBConnection:
         finally:
             session.close()
 
+    def _insert_checkpointed(
+            self,
+            chunks: Iterator[Tuple[str, pd.DataFrame]],
+            batch_size: int,
+            method: str,
+            run_id: str,
+            chunking: str
+        ) -> Dict[str, Dict[str, float]]:
+        """Carrega cada bloco em sua própria transação, com checkpoint e novas tentativas (ver `insert_stream`)."""
+        loaded = self.get_checkpoints(run_id, chunking=chunking)
+        if loaded:
+            logger.info(f'Retomando a execução {run_id}: {sum(map(len, loaded.values()))} bloco(s) já carregado(s).')
+
+        stats, positions = {}, {}
+        try:
+            for name, df in chunks:
+                chunk_index = positions.get(name, 0)
+                positions[name] = chunk_index + 1
+
+                if chunk_index in loaded.get(name, ()):
+                    logger.info(f'{name}: bloco {chunk_index} já carregado, pulando.')
+                    continue
+
+                start_time = time.perf_counter()
+                total = self._with_retry(
+                    lambda: self._load_chunk(run_id, name, chunk_index, df, method, batch_size, chunking),
+                    f'{name} (bloco {chunk_index})'
+                )
+                self._add_stats(stats, name, total, time.perf_counter() - start_time)
+
+            self._log_stats(stats)
+            logger.info('Valores inseridos com sucesso.')
+            return stats
+
+        except Exception as e:
+            logger.error(f'Erro ao inserir dados (execução {run_id}): {str(e)}')
+            raise
+
+    def parallel_insert(
+            self,
+            df_dict: Dict[str, pd.DataFrame],
+            method: Optional[str] = 'copy_csv',
+            max_workers: Optional[int] = 4,
+            chunk_rows: Optional[int] = 500000,
+            batch_size: Optional[int] = 1000,
+            run_id: Optional[str] = None,
+            raise_errors: Optional[bool] = True
+        ) -> Dict[str, Dict[str, Any]]:
+        """Insere Dados no Banco de Dados usando várias conexões do pool ao mesmo tempo.
+
+        Cada tabela é dividida em faixas disjuntas da chave primária (blocos de até `chunk_rows`
+        linhas) e todos os blocos, de todas as tabelas, são carregados concorrentemente, cada um
+        em sua própria conexão e transação, com novas tentativas em quedas de conexão. Com
+        `run_id` cada bloco grava o seu checkpoint (com o esquema 'key_range:{chunk_rows}') e uma
+        nova chamada pula os já carregados; retomar com outro `chunk_rows`, ou com `insert_data`, é rejeitado.
+
+        Ao contrário de `insert_data`, a carga não é tudo ou nada: o relatório indica, por tabela,
+        se todos os blocos foram carregados.
+
+        Args:
+            df_dict (Dict[str, DataFrame]): Dicionário com {'nome do arquivo': pd.DataFrame}.
+            method (Optional[str]): 'orm', 'copy_csv' ou 'copy_binary'.
+            max_workers (Optional[int]): Quantidade de conexões usadas ao mesmo tempo.
+            chunk_rows (Optional[int]): Tamanho máximo de cada faixa de chaves.
+            batch_size (Optional[int]): Tamanho do lote (somente para 'orm').
+            run_id (Optional[str]): Identificador da execução, para retomar cargas interrompidas.
+            raise_errors (Optional[bool]): Relança o primeiro erro depois de carregar as demais tabelas.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Relatório por tabela ({'status', 'rows', 'chunks', 'failed_chunks',
+                'seconds', 'rows_per_sec', 'error'}), com status 'success' ou 'failed'.
+        """
+        logger.info(f'Inserindo Dados no Banco de Dados com {max_workers} conexões...')
+
+        if method not in self.LOAD_METHODS:
+            raise ValueError(f'Método de carga inválido: {method}. Use um de {self.LOAD_METHODS}.')
+
+        pool_capacity = self.pool_size + max(self.max_overflow, 0)
+        if max_workers > pool_capacity:
+            logger.warning(f'max_workers ({max_workers}) maior que a capacidade do pool ({pool_capacity}): workers vão esperar por conexões.')
+
+        chunking = f'key_range:{chunk_rows}'
+        loaded = self.get_checkpoints(run_id, chunking=chunking) if run_id is not None else {}
+
+        report = {
+            name: {'status': 'success', 'rows': 0, 'chunks': 0, 'failed_chunks': 0, 'seconds': 0.0, 'rows_per_sec': 0.0, 'error': None}
+            for name in df_dict
+        }
+        errors = {}
+        start_time = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as threads:
+            futures = {}
+            for name, df in df_dict.items():
+                for chunk_index, chunk in enumerate(self._key_range_chunks(df, self.pk_mapping.get(name), chunk_rows)):
+                    report[name]['chunks'] += 1
+                    if chunk_index in loaded.get(name, ()):
+                        logger.info(f'{name}: bloco {chunk_index} já carregado, pulando.')
+                        continue
+
+                    future = threads.submit(
+                        self._with_retry,
+                        lambda name=name, chunk_index=chunk_index, chunk=chunk:
+                            self._load_chunk(run_id, name, chunk_index, chunk, method, batch_size, chunking),
+                        f'{name} (bloco {chunk_index})'
+                    )
+                    futures[future] = name
+
+            for future in as_completed(futures):
+                name = futures[future]
+                table_report = report[name]
+                try:
+                    table_report['rows'] += future.result()
+                except Exception as e:
+                    logger.error(f'Erro ao inserir um bloco de {name}: {str(e)}')
+                    table_report['status'] = 'failed'
+                    table_report['failed_chunks'] += 1
+                    table_report['error'] = table_report['error'] or str(e)
+                    errors.setdefault(name, e)
+                table_report['seconds'] = time.perf_counter() - start_time
+
+        for name, table_report in report.items():
+            seconds = table_report['seconds']
+            table_report['rows_per_sec'] = table_report['rows'] / seconds if seconds > 0 else 0.0
+            if table_report['status'] == 'success':
+                logger.info(f'{table_report["rows"]} linhas inseridas em: {name} ({table_report["rows_per_sec"]:.0f} linhas/s)')
+            else:
+                logger.error(f'{name}: {table_report["failed_chunks"]} de {table_report["chunks"]} bloco(s) falharam.')
+
+        if errors and raise_errors:
+            raise next(iter(errors.values()))
+
+        return report
+
+    @staticmethod
+    def _key_range_chunks(df: pd.DataFrame, pk_column: Optional[str], chunk_rows: int) -> List[pd.DataFrame]:
+        """Divide o DataFrame em faixas disjuntas e ordenadas da chave primária (até `chunk_rows` linhas cada)."""
+        if pk_column in df.columns and not df[pk_column].is_monotonic_increasing:
+            df = df.sort_values(pk_column, kind='stable')
+
+        parts = max(1, math.ceil(len(df) / chunk_rows))
+        size = math.ceil(len(df) / parts)
+        return [df.iloc[start:start + size] for start in range(0, max(len(df), 1), size or 1)]
+
+    def _load_chunk(
+            self,
+            run_id: Optional[str],
+            name: str,
+            chunk_index: int,
+            df: pd.DataFrame,
+            method: str,
+            batch_size: int,
+            chunking: Optional[str] = 'sequential'
+        ) -> int:
+        """Carrega um bloco em sua própria transação, gravando o seu checkpoint quando há `run_id`."""
+        session = self._Session()
+
+        try:
+            total = self._load_table(session, name, df, method, batch_size)
+            if run_id is not None:
+                session.add(PipelineCheckpointTable(
+                    run_id=run_id, table_name=name, chunk_index=chunk_index, chunking=chunking, rows=total
+                ))
+            session.commit()
+            return total
+
+        except Exception:
+            session.rollback()
+            raise
+
+        finally:
+            session.close()
+
+    def _with_retry(self, operation: Callable[[], Any], description: str) -> Any:
+        """Executa a operação, repetindo-a com backoff exponencial quando a conexão cai.
+
+        Apenas erros de conexão (OperationalError, InterfaceError ou conexão invalidada) são
+        repetidos; erros de dados (ex: violação de chave) são relançados imediatamente.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return operation()
+
+            except DBAPIError as e:
+                retryable = e.connection_invalidated or isinstance(e, (OperationalError, InterfaceError))
+                if not retryable or attempt == self.max_retries:
+                    raise
+
+                wait = self.retry_backoff * 2 ** attempt
+                logger.warning(
+                    f'Falha de conexão em {description} (tentativa {attempt + 1}/{self.max_retries + 1}), '
+                    f'nova tentativa em {wait:.1f}s: {str(e)}'
+                )
+                time.sleep(wait)
+
+    @staticmethod
+    def _add_stats(stats: Dict[str, Dict[str, float]], name: str, rows: int, seconds: float):
+        """Acumula as linhas e o tempo de carga de um bloco nas estatísticas da tabela."""
+        table_stats = stats.setdefault(name, {'rows': 0, 'seconds': 0.0, 'rows_per_sec': 0.0})
+        table_stats['rows'] += rows
+        table_stats['seconds'] += seconds
+
+    @staticmethod
+    def _log_stats(stats: Dict[str, Dict[str, float]]):
+        """Calcula e registra a vazão de cada tabela."""
+        for name, table_stats in stats.items():
+            seconds = table_stats['seconds']
+            table_stats['rows_per_sec'] = table_stats['rows'] / seconds if seconds > 0 else 0.0
+            logger.info(f'{table_stats["rows"]} linhas inseridas em: {name} ({table_stats["rows_per_sec"]:.0f} linhas/s)')
+
+    def get_checkpoints(self, run_id: str, chunking: Optional[str] = None) -> Dict[str, Set[int]]:
+        """Retorna os blocos já carregados de uma execução.
+
+        Args:
+            run_id (str): Identificador da execução.
+            chunking (Optional[str]): Esquema de divisão da carga que vai retomar a execução (None para não verificar).
+
+        Returns:
+            Dict[str, Set[int]]: Dicionário com {'nome do arquivo': índices dos blocos carregados}.
+
+        Raises:
+            ValueError: Se algum checkpoint foi gravado com um esquema diferente de `chunking`
+                (os índices apontariam para outros blocos).
+        """
+        session = self._Session()
+
+        try:
+            PipelineCheckpointTable.__table__.create(self.engine, checkfirst=True)
+
+            checkpoints, schemes = {}, set()
+            rows = session.query(PipelineCheckpointTable).filter(PipelineCheckpointTable.run_id == run_id)
+            for row in rows:
+                checkpoints.setdefault(row.table_name, set()).add(row.chunk_index)
+                schemes.add(row.chunking)
+
+            if chunking is not None and schemes - {chunking}:
+                raise ValueError(
+                    f'A execução {run_id} foi gravada com blocos {sorted(schemes)} e não pode ser retomada com '
+                    f'{chunking!r}; use a mesma configuração de carga (chunksize, db_workers) ou outro run_id.'
+                )
+            return checkpoints
+
+        except Exception as e:
+            logger.error(f'Erro ao consultar checkpoints: {str(e)}')
+            raise
+
+        finally:
+            session.close()
+
+    def _load_table(self, session, name: str, df: pd.DataFrame, method: str, batch_size: int) -> int:
+        """Carrega um DataFrame na tabela correspondente (ou na sua sombra) dentro da sessão informada.
+
+        Args:
+            session (Session): Sessão com a transação corrente.
+            name (str): Nome do arquivo (chave de ORM_MAPPING).
+            df (DataFrame): DataFrame a ser carregado.
+            method (str): 'orm', 'copy_csv' ou 'copy_binary'.
+            batch_size (int): Tamanho do lote (somente para 'orm').
+
+        Returns:
+            int: Quantidade de linhas carregadas.
+        """
+        model = self.ORM_MAPPING.get(name)
+        table = self._target_table(name)
+
+        if method == 'orm':
+            records = df.to_dict(orient='records')
+            for i in range(0, len(records), batch_size):
+                batch = records[i:i + batch_size]
+                if table is model.__table__:
+                    session.bulk_insert_mappings(model, batch)
+                else:
+                    session.execute(table.insert(), batch)
+            return len(records)
+
+        copy_format = 'binary' if method == 'copy_binary' else 'csv'
+        cursor = session.connection().connection.cursor()
+        try:
+            return copy_dataframe(cursor, table, df, copy_format)
+        finally:
+            cursor.close()
+
+    def insert_rejects(self, rejects_dict: Dict[str, pd.DataFrame]) -> Dict[str, int]:
+        """Insere as linhas rejeitadas na validação nas tabelas `{tabela}_rejects` (COPY CSV).
+
+        Args:
+            rejects_dict (Dict[str, DataFrame]): Dicionário com {'nome do arquivo': linhas rejeitadas}.
+
+        Returns:
+            Dict[str, int]: Quantidade de linhas inseridas por tabela.
+        """
+        logger.info('Inserindo linhas rejeitadas...')
+
+        session = self._Session()
+
+        counts = {}
+        try:
+            cursor = session.connection().connection.cursor()
+            try:
+                for name, df in rejects_dict.items():
+                    counts[name] = copy_dataframe(cursor, REJECTS_TABLES[name], df, 'csv')
+                    logger.info(f'{counts[name]} linhas inseridas em: {REJECTS_TABLES[name].name}')
+            finally:
+                cursor.close()
+
+            session.commit()
+            return counts
+
+        except Exception as e:
+            logger.error(f'Erro ao inserir linhas rejeitadas: {str(e)}')
+            session.rollback()
+            raise
+
+        finally:
+            session.close()
+
     def update_data(self, df_dict: Dict[str, pd.DataFrame], batch_size: Optional[int] = 500) -> str:
         """Atualiza Dados no Banco de Dados.
         
@@ -167,40 +772,53 @@ class DBConnection:
         finally:
             session.close()
 
-    def upsert_data(self, df_dict: Dict[str, pd.DataFrame]) -> str:
+    def upsert_data(
+            self,
+            df_dict: Dict[str, pd.DataFrame],
+            batch_size: Optional[int] = 1000,
+            method: Optional[str] = 'on_conflict'
+        ) -> Dict[str, Dict[str, int]]:
         """Faz Upsert de Dados no Banco de Dados (Atualiza e Insere Novos).
+
+        O método 'on_conflict' envia cada lote como um único `INSERT ... ON CONFLICT (pk) DO UPDATE`;
+        'copy_merge' carrega cada lote em uma tabela temporária via COPY e faz o merge com um único
+        comando. 'orm' mantém o comportamento linha a linha (SELECT + setattr/add).
         
         Args:
             df_dict (Dict[str, DataFrame]): Dicionário com {'nome do arquivo': pd.DataFrame}.
+            batch_size (Optional[int]): Tamanho do lote enviado por comando.
+            method (Optional[str]): 'on_conflict', 'copy_merge' ou 'orm'.
 
         Returns:
-            str: Mensagem de sucesso, se erro, mensagem de erro.
+            Dict[str, Dict[str, int]]: Linhas inseridas e atualizadas por tabela ({'inserted', 'updated'}).
         """
         logger.info('Iniciando Upsert de Dados...')
 
+        if method not in self.UPSERT_METHODS:
+            raise ValueError(f'Método de upsert inválido: {method}. Use um de {self.UPSERT_METHODS}.')
+
         session = self._Session()
 
+        counts = {}
         try:
             for name, df in df_dict.items():
                 model = self.ORM_MAPPING.get(name)
                 pk_column = self.pk_mapping.get(name)
+                df = df.drop_duplicates(subset=pk_column, keep='last')
 
-                records = df.to_dict(orient='records')
-                for record in records:
-                    pk_value = record.get(pk_column)
-                    existing = session.query(model).filter(
-                        getattr(model, pk_column) == pk_value
-                    ).first()
-
-                    if existing:
-                        for key, value in record.items():
-                            setattr(existing, key, value)
-                    else:
-                        obj = model(**record)
-                        session.add(obj)
+                if method == 'orm':
+                    inserted, updated = self._upsert_orm(session, model, pk_column, df)
+                elif method == 'on_conflict':
+                    inserted, updated = self._upsert_on_conflict(session, model, pk_column, df, batch_size)
+                else:
+                    inserted, updated = self._upsert_copy_merge(session, model, pk_column, df, batch_size)
+
+                counts[name] = {'inserted': inserted, 'updated': updated}
+                logger.info(f'{name}: {inserted} linhas inseridas, {updated} linhas atualizadas.')
 
             session.commit()
-            logger.info('Upsert concluíd com sucesso.')
+            logger.info('Upsert concluído com sucesso.')
+            return counts
 
         except Exception as e:
             logger.error(f'Erro ao fazer o upsert de dados: {str(e)}')
@@ -210,49 +828,153 @@ class DBConnection:
         finally:
             session.close()
 
+    def _upsert_orm(self, session, model, pk_column: str, df: pd.DataFrame):
+        """Upsert linha a linha via ORM (uma consulta por registro)."""
+        inserted, updated = 0, 0
+        for record in df.to_dict(orient='records'):
+            pk_value = record.get(pk_column)
+            existing = session.query(model).filter(
+                getattr(model, pk_column) == pk_value
+            ).first()
+
+            if existing:
+                for key, value in record.items():
+                    setattr(existing, key, value)
+                updated += 1
+            else:
+                session.add(model(**record))
+                inserted += 1
+
+        return inserted, updated
+
+    def _upsert_on_conflict(self, session, model, pk_column: str, df: pd.DataFrame, batch_size: int):
+        """Upsert em lotes com `INSERT ... ON CONFLICT (pk) DO UPDATE`."""
+        table = model.__table__
+        columns = copy_columns(table, df)
+
+        inserted, updated = 0, 0
+        for i in range(0, len(df), batch_size):
+            batch = df.iloc[i:i + batch_size][columns]
+            records = batch.astype(object).where(batch.notna(), None).to_dict(orient='records')
+
+            stmt = pg_insert(table).values(records)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[pk_column],
+                set_=self._upsert_set_clause(table, columns, pk_column, stmt.excluded)
+            ).returning(literal_column('(xmax = 0)'))
+
+            flags = session.execute(stmt).scalars().all()
+            batch_inserted = sum(1 for flag in flags if flag)
+            inserted += batch_inserted
+            updated += len(flags) - batch_inserted
+
+        return inserted, updated
+
+    def _upsert_copy_merge(self, session, model, pk_column: str, df: pd.DataFrame, batch_size: int):
+        """Upsert em lotes via COPY para uma tabela temporária seguida de merge."""
+        table = model.__table__
+        columns = copy_columns(table, df)
+        staging = self._create_staging_table(session, table)
+
+        column_list = ', '.join(f'"{name}"' for name in columns)
+        assignments = ', '.join(
+            f'"{name}" = EXCLUDED."{name}"' for name in columns if name != pk_column
+        )
+        if 'inserted_at' in table.columns and 'inserted_at' not in columns:
+            assignments += ', "inserted_at" = now()'
+
+        merge_sql = text(
+            f'WITH merged AS ('
+            f'INSERT INTO "{table.name}" ({column_list}) SELECT {column_list} FROM "{staging}" '
+            f'ON CONFLICT ("{pk_column}") DO UPDATE SET {assignments} '
+            f'RETURNING (xmax = 0) AS inserted) '
+            f'SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM merged'
+        )
+
+        inserted, updated = 0, 0
+        cursor = session.connection().connection.cursor()
+        try:
+            for i in range(0, len(df), batch_size):
+                session.execute(text(f'TRUNCATE "{staging}"'))
+                copy_dataframe(cursor, table, df.iloc[i:i + batch_size], table_name=staging)
+
+                batch_inserted, batch_updated = session.execute(merge_sql).one()
+                inserted += batch_inserted
+                updated += batch_updated
+        finally:
+            cursor.close()
+
+        return inserted, updated
+
+    @staticmethod
+    def _create_staging_table(session, table) -> str:
+        """Cria (se necessário) uma tabela temporária com a estrutura da tabela, descartada no commit.
+
+        Returns:
+            str: Nome da tabela temporária.
+        """
+        staging = f'{table.name}__staging'
+        session.execute(text(
+            f'CREATE TEMP TABLE IF NOT EXISTS "{staging}" (LIKE "{table.name}" INCLUDING DEFAULTS) ON COMMIT DROP'
+        ))
+        return staging
+
+    @staticmethod
+    def _upsert_set_clause(table, columns, pk_column: str, excluded) -> Dict:
+        """Monta o SET do ON CONFLICT, atualizando `inserted_at` como faria o onupdate do ORM."""
+        set_clause = {name: excluded[name] for name in columns if name != pk_column}
+        if 'inserted_at' in table.columns and 'inserted_at' not in columns:
+            set_clause['inserted_at'] = func.now()
+        return set_clause
 
-    def incremental_load(self, df_dict: Dict[str, pd.DataFrame], batch_size: Optional[int] = 1000):
-        """Faz atualização Incremental dos Dados na Tabela.
+
+    def incremental_load(
+            self,
+            df_dict: Dict[str, pd.DataFrame],
+            batch_size: Optional[int] = 50000,
+            method: Optional[str] = 'pushdown'
+        ) -> Dict[str, int]:
+        """Faz atualização Incremental dos Dados na Tabela (insere apenas chaves novas).
+
+        'pushdown' carrega os dados via COPY em uma tabela temporária e insere com um único
+        `INSERT ... SELECT ... WHERE NOT EXISTS` (anti-join no Banco). 'vectorized' consulta as
+        chaves existentes lote a lote (`pk = ANY(:keys)`, com as chaves em um único parâmetro array)
+        e filtra com `isin`. Em ambos os casos a memória fica limitada ao tamanho do lote,
+        independente do tamanho da tabela.
         
         Args:
             df_dict (Dict[str, DataFrame]): Dicionário com {'nome do arquivo': pd.DataFrame}.
-            batch_size (Optional[int]): Tamanho do lote a ser inserido.
+            batch_size (Optional[int]): Tamanho do lote enviado ao Banco.
+            method (Optional[str]): 'pushdown' ou 'vectorized'.
 
         Returns:
-            str: Mensagem de sucesso, se erro, mensagem de erro.
+            Dict[str, int]: Quantidade de linhas adicionadas por tabela.
         """
         logger.info('Iniciando Carga Incremental...')
 
+        if method not in self.INCREMENTAL_METHODS:
+            raise ValueError(f'Método incremental inválido: {method}. Use um de {self.INCREMENTAL_METHODS}.')
+
         session = self._Session()
 
+        counts = {}
         try:
             for name, df in df_dict.items():
                 model = self.ORM_MAPPING.get(name)
                 pk_column = self.pk_mapping.get(name)
+                df = df.drop_duplicates(subset=pk_column, keep='first')
 
-                existing_ids = set(
-                    row[0] for row in session.query(getattr(model, pk_column)).all()
-                )
-                records = df.to_dict(orient='records')
-
-                new_records = []
-                for record in records:
-                    pk_value = record.get(pk_column)
-
-                    if pk_value in existing_ids:
-                        pass
-                    if pk_value not in existing_ids:
-                        new_records.append(record)
+                if method == 'pushdown':
+                    added = self._incremental_pushdown(session, model, pk_column, df, batch_size)
+                else:
+                    added = self._incremental_vectorized(session, model, pk_column, df, batch_size)
 
-                    if new_records:
-                        for i in range(0, len(new_records), batch_size):
-                            batch = new_records[i:i + batch_size]
-                            session.bulk_insert_mappings(model, batch)
-
-                logger.info(f'{len(new_records)} adicionados em: {name}')
+                counts[name] = added
+                logger.info(f'{added} adicionados em: {name}')
 
             session.commit()
             logger.info('Atualização incremental concluída com sucesso.')
+            return counts
 
         except Exception as e:
             logger.error(f'Erro ao fazer a atualização incremental: {str(e)}')
@@ -260,4 +982,118 @@ class DBConnection:
             raise
         
         finally:
-            session.close()
\ No newline at end of file
+            session.close()
+
+    def _incremental_pushdown(self, session, model, pk_column: str, df: pd.DataFrame, batch_size: int) -> int:
+        """Anti-join no Banco: COPY para tabela temporária + INSERT ... WHERE NOT EXISTS."""
+        table = model.__table__
+        columns = copy_columns(table, df)
+        staging = self._create_staging_table(session, table)
+        session.execute(text(f'TRUNCATE "{staging}"'))
+
+        cursor = session.connection().connection.cursor()
+        try:
+            copy_dataframe(cursor, table, df, chunk_size=batch_size, table_name=staging)
+        finally:
+            cursor.close()
+
+        column_list = ', '.join(f'"{name}"' for name in columns)
+        source_list = ', '.join(f's."{name}"' for name in columns)
+        result = session.execute(text(
+            f'INSERT INTO "{table.name}" ({column_list}) '
+            f'SELECT {source_list} FROM "{staging}" s '
+            f'WHERE NOT EXISTS (SELECT 1 FROM "{table.name}" t WHERE t."{pk_column}" = s."{pk_column}")'
+        ))
+        return result.rowcount
+
+    def _incremental_vectorized(self, session, model, pk_column: str, df: pd.DataFrame, batch_size: int) -> int:
+        """Anti-join vetorizado: busca as chaves existentes de cada lote e filtra com `isin`."""
+        table = model.__table__
+        pk = table.columns[pk_column]
+
+        added = 0
+        cursor = session.connection().connection.cursor()
+        try:
+            for i in range(0, len(df), batch_size):
+                batch = df.iloc[i:i + batch_size]
+                keys = batch[pk_column].tolist()
+
+                existing = session.execute(
+                    select(pk).where(pk == any_(bindparam('keys', keys, type_=ARRAY(pk.type))))
+                ).scalars().all()
+
+                new_records = batch[~batch[pk_column].isin(existing)]
+                if not new_records.empty:
+                    added += copy_dataframe(cursor, table, new_records)
+        finally:
+            cursor.close()
+
+        return added
+
+    def get_watermarks(self) -> Dict[str, Dict[str, Any]]:
+        """Retorna a watermark (maior `created_at` e maior chave primária) já carregada de cada tabela.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Dicionário com {'nome do arquivo': {'max_created_at', 'max_pk'}}.
+        """
+        logger.info('Consultando watermarks...')
+
+        session = self._Session()
+
+        try:
+            watermarks = {
+                row.table_name: {'max_created_at': row.max_created_at, 'max_pk': row.max_pk}
+                for row in session.query(PipelineWatermarkTable).all()
+            }
+            logger.info(f'{len(watermarks)} watermark(s) encontrada(s).')
+            return watermarks
+
+        except Exception as e:
+            logger.error(f'Erro ao consultar watermarks: {str(e)}')
+            raise
+
+        finally:
+            session.close()
+
+    def update_watermarks(self, df_dict: Dict[str, pd.DataFrame]):
+        """Avança a watermark de cada tabela com base nos dados carregados (nunca retrocede).
+        
+        Args:
+            df_dict (Dict[str, DataFrame]): Dicionário com {'nome do arquivo': pd.DataFrame}.
+        """
+        logger.info('Atualizando watermarks...')
+
+        session = self._Session()
+
+        try:
+            table = PipelineWatermarkTable.__table__
+            for name, df in df_dict.items():
+                if df.empty:
+                    continue
+
+                pk_column = self.pk_mapping.get(name)
+                stmt = pg_insert(table).values(
+                    table_name=name,
+                    max_created_at=pd.to_datetime(df['created_at']).max().to_pydatetime(),
+                    max_pk=int(df[pk_column].max())
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['table_name'],
+                    set_={
+                        'max_created_at': func.greatest(table.c.max_created_at, stmt.excluded.max_created_at),
+                        'max_pk': func.greatest(table.c.max_pk, stmt.excluded.max_pk),
+                        'updated_at': func.now()
+                    }
+                )
+                session.execute(stmt)
+
+            session.commit()
+            logger.info('Watermarks atualizadas com sucesso.')
+
+        except Exception as e:
+            logger.error(f'Erro ao atualizar watermarks: {str(e)}')
+            session.rollback()
+            raise
+
+        finally:
+            session.close()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, String, DateTime
+from sqlalchemy import Column, Integer, BigInteger, Float, String, Text, DateTime, Table
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
 
@@ -7,7 +7,7 @@ Base = declarative_base()
 class OrderTable(Base):
     __tablename__ = 'raw_orders'
 
-    order_id = Column(Integer, nullable=False, unique=True, index=True, primary_key=True)
+    order_id = Column(Integer, nullable=False, primary_key=True)
     created_at = Column(DateTime, nullable=False)
     website_session_id = Column(Integer, nullable=False)
     user_id = Column(Integer, nullable=False)
@@ -23,7 +23,7 @@ class OrderTable(Base):
 class OrderItemTable(Base):
     __tablename__ = 'raw_order_items'
 
-    order_item_id = Column(Integer, nullable=False, unique=True, index=True, primary_key=True)
+    order_item_id = Column(Integer, nullable=False, primary_key=True)
     created_at = Column(DateTime, nullable=False)
     order_id = Column(Integer, nullable=False)
     product_id = Column(Integer, nullable=False)
@@ -39,7 +39,7 @@ class OrderItemTable(Base):
 class OrderItemRefundTable(Base):
     __tablename__ = 'raw_order_item_refund'
 
-    order_item_refund_id = Column(Integer, nullable=False, unique=True, index=True, primary_key=True)
+    order_item_refund_id = Column(Integer, nullable=False, primary_key=True)
     created_at = Column(DateTime, nullable=False)
     order_item_id = Column(Integer, nullable=False)
     order_id = Column(Integer, nullable=False)
@@ -52,7 +52,7 @@ class OrderItemRefundTable(Base):
 class ProductsTable(Base):
     __tablename__ = 'raw_products'
 
-    product_id = Column(Integer, nullable=False, unique=True, index=True, primary_key=True)
+    product_id = Column(Integer, nullable=False, primary_key=True)
     created_at = Column(DateTime, nullable=False)
     product_name = Column(String(250), nullable=False)
     inserted_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -63,7 +63,7 @@ class ProductsTable(Base):
 class WebSiteSessionsTable(Base):
     __tablename__ = 'raw_website_sessions'
 
-    website_session_id = Column(Integer, nullable=False, unique=True, index=True, primary_key=True)
+    website_session_id = Column(Integer, nullable=False, primary_key=True)
     created_at = Column(DateTime, nullable=False)
     user_id = Column(Integer, nullable=False)
     is_repeat_session = Column(Integer, nullable=False)
@@ -80,11 +80,66 @@ class WebSiteSessionsTable(Base):
 class WebSitePageViewsTable(Base):
     __tablename__ = 'raw_website_pageviews'
 
-    website_pageview_id = Column(Integer, nullable=False, unique=True, index=True, primary_key=True)
+    website_pageview_id = Column(Integer, nullable=False, primary_key=True)
     created_at = Column(DateTime, nullable=False)
     website_session_id = Column(Integer, nullable=False)
     pageview_url = Column(String(250), nullable=False)
     inserted_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     def __repr__(self):
-        return f'<website_pageview_id={self.website_pageview_id}>'
\ No newline at end of file
+        return f'<website_pageview_id={self.website_pageview_id}>'
+
+
+class PipelineWatermarkTable(Base):
+    __tablename__ = 'etl_watermarks'
+
+    table_name = Column(String(100), nullable=False, primary_key=True)
+    max_created_at = Column(DateTime, nullable=True)
+    max_pk = Column(Integer, nullable=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f'<table_name={self.table_name} | max_created_at={self.max_created_at} | max_pk={self.max_pk}>'
+
+
+class PipelineCheckpointTable(Base):
+    __tablename__ = 'etl_load_checkpoints'
+
+    run_id = Column(String(100), nullable=False, primary_key=True)
+    table_name = Column(String(100), nullable=False, primary_key=True)
+    chunk_index = Column(Integer, nullable=False, primary_key=True)
+    chunking = Column(String(100), nullable=False, server_default='sequential')
+    rows = Column(BigInteger, nullable=False)
+    loaded_at = Column(DateTime, server_default=func.now())
+
+    def __repr__(self):
+        return f'<run_id={self.run_id} | table_name={self.table_name} | chunk_index={self.chunk_index}>'
+
+
+def build_rejects_table(model) -> Table:
+    """Cria a tabela de quarentena `{tabela}_rejects` de um modelo.
+
+    Todas as colunas do modelo viram texto anulável, para aceitar qualquer valor rejeitado,
+    acrescidas do motivo da rejeição e da data de entrada na quarentena.
+    """
+    columns = [Column('reject_id', BigInteger, primary_key=True, autoincrement=True)]
+    columns += [
+        Column(column.name, Text, nullable=True)
+        for column in model.__table__.columns
+        if column.name != 'inserted_at'
+    ]
+    columns += [
+        Column('failure_reasons', Text, nullable=False),
+        Column('rejected_at', DateTime, server_default=func.now())
+    ]
+    return Table(f'{model.__tablename__}_rejects', Base.metadata, *columns)
+
+
+REJECTS_TABLES = {
+    'orders': build_rejects_table(OrderTable),
+    'order_items': build_rejects_table(OrderItemTable),
+    'order_item_refunds': build_rejects_table(OrderItemRefundTable),
+    'products': build_rejects_table(ProductsTable),
+    'website_sessions': build_rejects_table(WebSiteSessionsTable),
+    'website_pageviews': build_rejects_table(WebSitePageViewsTable)
+}
@@ -0,0 +1,267 @@
+import io
+import struct
+import numpy as np
+import pandas as pd
+
+from typing import Iterator, List, Optional
+
+from sqlalchemy import Table, BigInteger, Integer, Float, DateTime
+
+COPY_FORMATS = ('csv', 'binary')
+
+PG_COPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+PG_COPY_TRAILER = struct.pack('>h', -1)
+PG_EPOCH = np.datetime64('2000-01-01T00:00:00', 'us')
+
+
+class DataFrameCopyStream(io.RawIOBase):
+    """Arquivo somente-leitura que entrega os blocos gerados sob demanda para o `copy_expert`."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        """Inicializa a classe DataFrameCopyStream.
+
+        Args:
+            chunks (Iterator[bytes]): Gerador com os blocos já codificados.
+        """
+        self._chunks = chunks
+        self._buffer = memoryview(b'')
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def copy_columns(table: Table, df: pd.DataFrame) -> List[str]:
+    """Retorna as colunas da tabela presentes no DataFrame, na ordem da tabela.
+
+    Args:
+        table (Table): Tabela de destino.
+        df (DataFrame): DataFrame a ser carregado.
+
+    Returns:
+        List[str]: Lista com o nome das colunas.
+    """
+    return [column.name for column in table.columns if column.name in df.columns]
+
+
+def iter_csv_chunks(df: pd.DataFrame, columns: List[str], chunk_size: int) -> Iterator[bytes]:
+    """Codifica o DataFrame em blocos CSV (sem cabeçalho).
+
+    Args:
+        df (DataFrame): DataFrame a ser codificado.
+        columns (List[str]): Colunas, na ordem do COPY.
+        chunk_size (int): Quantidade de linhas por bloco.
+
+    Returns:
+        Iterator[bytes]: Blocos CSV em UTF-8.
+    """
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size]
+        yield chunk.to_csv(
+            columns=columns,
+            index=False,
+            header=False,
+            date_format='%Y-%m-%d %H:%M:%S.%f'
+        ).encode('utf-8')
+
+
+def _binary_field_format(table: Table, column_name: str) -> Optional[str]:
+    """Retorna o formato numpy big-endian da coluna, ou None para texto."""
+    column_type = table.columns[column_name].type
+
+    if isinstance(column_type, BigInteger):
+        return '>i8'
+    if isinstance(column_type, Integer):
+        return '>i4'
+    if isinstance(column_type, Float):
+        return '>f8'
+    if isinstance(column_type, DateTime):
+        return '>i8'
+    return None
+
+
+def _binary_values(series: pd.Series, field_format: str) -> np.ndarray:
+    """Converte a Series para os valores binários esperados pelo PostgreSQL.
+
+    Datas com fuso horário são normalizadas para UTC, e inteiros fora do
+    intervalo da coluna geram erro em vez de serem truncados silenciosamente.
+
+    Raises:
+        ValueError: Se algum inteiro não couber no tipo da coluna.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        if isinstance(series.dtype, pd.DatetimeTZDtype):
+            series = series.dt.tz_convert('UTC').dt.tz_localize(None)
+        micros = series.to_numpy(dtype='datetime64[us]') - PG_EPOCH
+        return micros.astype('int64').astype(field_format)
+
+    values = series.to_numpy()
+    target = np.dtype(field_format)
+    if target.kind == 'i' and len(values) and np.issubdtype(values.dtype, np.integer):
+        limits = np.iinfo(target)
+        if values.min() < limits.min or values.max() > limits.max:
+            raise ValueError(
+                f'Valores da coluna {series.name} fora do intervalo de {target.itemsize * 8} bits: '
+                f'[{values.min()}, {values.max()}].'
+            )
+    return values.astype(field_format)
+
+
+def iter_binary_chunks(df: pd.DataFrame, table: Table, columns: List[str], chunk_size: int) -> Iterator[bytes]:
+    """Codifica o DataFrame no formato binário do COPY do PostgreSQL.
+
+    As colunas de tamanho fixo e sem nulos são codificadas de forma vetorizada
+    em um array estruturado; apenas as colunas de texto (ou com nulos) são
+    montadas linha a linha.
+
+    Args:
+        df (DataFrame): DataFrame a ser codificado.
+        table (Table): Tabela de destino.
+        columns (List[str]): Colunas, na ordem retornada por `binary_column_order`.
+        chunk_size (int): Quantidade de linhas por bloco.
+
+    Returns:
+        Iterator[bytes]: Cabeçalho, blocos de linhas e trailer do COPY binário.
+    """
+    fixed, variable = _split_binary_columns(df, table, columns)
+
+    row_dtype = [('field_count', '>i2')]
+    for name, field_format in fixed:
+        row_dtype += [(f'{name}__len', '>i4'), (name, field_format)]
+
+    yield PG_COPY_HEADER
+
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size]
+
+        rows = np.empty(len(chunk), dtype=row_dtype)
+        rows['field_count'] = len(columns)
+        for name, field_format in fixed:
+            rows[f'{name}__len'] = np.dtype(field_format).itemsize
+            rows[name] = _binary_values(chunk[name], field_format)
+
+        if not variable:
+            yield rows.tobytes()
+            continue
+
+        fixed_bytes = rows.tobytes()
+        row_size = rows.dtype.itemsize
+        encoded = [
+            _encode_variable_column(chunk[name], _binary_field_format(table, name))
+            for name in variable
+        ]
+
+        yield b''.join(
+            fixed_bytes[i * row_size:(i + 1) * row_size] + b''.join(column[i] for column in encoded)
+            for i in range(len(chunk))
+        )
+
+    yield PG_COPY_TRAILER
+
+
+def binary_column_order(df: pd.DataFrame, table: Table, columns: List[str]) -> List[str]:
+    """Reordena as colunas para o COPY binário: tamanho fixo primeiro, texto por último.
+
+    Args:
+        df (DataFrame): DataFrame a ser codificado.
+        table (Table): Tabela de destino.
+        columns (List[str]): Colunas presentes no DataFrame.
+
+    Returns:
+        List[str]: Colunas na ordem em que serão codificadas.
+    """
+    fixed, variable = _split_binary_columns(df, table, columns)
+    return [name for name, _ in fixed] + variable
+
+
+def _split_binary_columns(df: pd.DataFrame, table: Table, columns: List[str]):
+    """Separa as colunas de tamanho fixo (sem nulos) das de tamanho variável."""
+    fixed, variable = [], []
+    for name in columns:
+        field_format = _binary_field_format(table, name)
+        if field_format is None or df[name].isna().any():
+            variable.append(name)
+        else:
+            fixed.append((name, field_format))
+    return fixed, variable
+
+
+def _encode_variable_column(series: pd.Series, field_format: Optional[str]) -> List[bytes]:
+    """Codifica cada valor como campo do COPY binário (tamanho + conteúdo), com -1 para nulos."""
+    null_field = struct.pack('>i', -1)
+    is_null = series.isna().to_numpy()
+
+    if field_format is None:
+        values = series.tolist()
+        encoded = []
+        for value, null in zip(values, is_null):
+            if null:
+                encoded.append(null_field)
+                continue
+            data = str(value).encode('utf-8')
+            encoded.append(struct.pack('>i', len(data)) + data)
+        return encoded
+
+    itemsize = np.dtype(field_format).itemsize
+    prefix = struct.pack('>i', itemsize)
+    values = _binary_values(series[~is_null], field_format).tobytes()
+
+    encoded = []
+    position = 0
+    for null in is_null:
+        if null:
+            encoded.append(null_field)
+            continue
+        encoded.append(prefix + values[position:position + itemsize])
+        position += itemsize
+    return encoded
+
+
+def copy_dataframe(
+        cursor,
+        table: Table,
+        df: pd.DataFrame,
+        copy_format: Optional[str] = 'csv',
+        chunk_size: Optional[int] = 50000,
+        table_name: Optional[str] = None
+    ) -> int:
+    """Carrega um DataFrame na tabela via `COPY ... FROM STDIN`.
+
+    Args:
+        cursor: Cursor psycopg2 da transação corrente.
+        table (Table): Tabela de destino.
+        df (DataFrame): DataFrame a ser carregado.
+        copy_format (Optional[str]): 'csv' ou 'binary'.
+        chunk_size (Optional[int]): Quantidade de linhas codificadas por bloco.
+        table_name (Optional[str]): Nome da tabela física, se diferente de `table.name` (ex: staging).
+
+    Returns:
+        int: Quantidade de linhas carregadas.
+    """
+    if copy_format not in COPY_FORMATS:
+        raise ValueError(f'Formato de COPY inválido: {copy_format}. Use um de {COPY_FORMATS}.')
+
+    columns = copy_columns(table, df)
+
+    if copy_format == 'binary':
+        columns = binary_column_order(df, table, columns)
+        chunks = iter_binary_chunks(df, table, columns, chunk_size)
+    else:
+        chunks = iter_csv_chunks(df, columns, chunk_size)
+
+    column_list = ', '.join(f'"{name}"' for name in columns)
+    sql = f'COPY "{table_name or table.name}" ({column_list}) FROM STDIN WITH (FORMAT {copy_format})'
+
+    cursor.copy_expert(sql, DataFrameCopyStream(chunks))
+    return len(df)
@@ -0,0 +1,19 @@
+import functools
+import logging
+
+from dotenv import load_dotenv
+
+
+@functools.lru_cache(maxsize=None)
+def setup_environment():
+    """Carrega o `.env` e configura o logging, uma única vez por processo.
+
+    Chamado pelos construtores das classes (conexões e fontes de dados), que antes repetiam
+    `load_dotenv()` (que procura e relê o `.env`) e `logging.basicConfig` a cada instância.
+    """
+    load_dotenv()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
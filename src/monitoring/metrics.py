@@ -0,0 +1,313 @@
+import sys
+import json
+import time
+import pstats
+import cProfile
+import datetime
+import resource
+import threading
+import contextlib
+import logging
+
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, Iterator, Union
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_STAGES = ('read', 'validate', 'serialize', 'upload', 'download', 'insert')
+PROFILERS = ('cprofile', 'pyinstrument')
+
+OPENMETRICS_FIELDS = {
+    'seconds': ('pipeline_stage_seconds', 'Tempo de relógio gasto no estágio.'),
+    'cpu_seconds': ('pipeline_stage_cpu_seconds', 'Tempo de CPU da thread que executou o estágio.'),
+    'rows': ('pipeline_stage_rows', 'Linhas processadas no estágio.'),
+    'bytes': ('pipeline_stage_bytes', 'Bytes processados no estágio.'),
+    'rows_per_sec': ('pipeline_stage_rows_per_second', 'Vazão do estágio (linhas por segundo).'),
+    'rss_delta_mb': ('pipeline_stage_rss_delta_megabytes', 'Maior crescimento da memória residente do processo durante o estágio.'),
+    'calls': ('pipeline_stage_calls', 'Execuções do estágio (ex: blocos no modo streaming).')
+}
+
+
+def peak_rss_mb() -> float:
+    """Retorna o pico de memória residente (RSS) do processo, em MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss é em bytes no macOS e em KB no Linux.
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+def current_rss_mb() -> float:
+    """Retorna a memória residente (RSS) atual do processo, em MB.
+
+    Lida de `/proc/self/statm` no Linux; nos demais sistemas, retorna o pico (`peak_rss_mb`).
+    """
+    try:
+        with open('/proc/self/statm') as file:
+            pages = int(file.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return peak_rss_mb()
+    return pages * resource.getpagesize() / 1024 ** 2
+
+
+class PipelineMetrics:
+    """Coleta métricas por estágio e por tabela de uma execução da pipeline.
+
+    Cada estágio registra tempo de relógio, tempo de CPU (da thread corrente), linhas, bytes,
+    vazão e o crescimento da memória residente do processo entre a entrada e a saída (o maior
+    entre as execuções; com estágios concorrentes, inclui a memória alocada pelos demais);
+    execuções repetidas do mesmo estágio e tabela (ex: blocos) são somadas. O relatório sai em JSON (`report`/`to_json`) e no formato texto do
+    Prometheus/OpenMetrics (`to_openmetrics`). É seguro para uso entre threads.
+    """
+
+    def __init__(
+            self,
+            report_dir: Optional[Union[str, Path]] = None,
+            profile_stages: Optional[Union[bool, Iterable[str]]] = None,
+            profiler: Optional[str] = 'cprofile'
+        ):
+        """Inicializa a classe PipelineMetrics.
+
+        Args:
+            report_dir (Optional[Union[str, Path]]): Diretório onde `finish` grava os relatórios (None para não gravar).
+            profile_stages (Optional[Union[bool, Iterable[str]]]): Estágios executados sob o profiler
+                (ex: {'validate'}); True para todos. O resultado vai para `report_dir/profiles`.
+            profiler (Optional[str]): 'cprofile' ou 'pyinstrument' (dependência opcional).
+        """
+        if profiler not in PROFILERS:
+            raise ValueError(f'Profiler inválido: {profiler}. Use um de {PROFILERS}.')
+
+        self.report_dir = Path(report_dir) if report_dir else None
+        self.profile_stages = profile_stages
+        self.profiler = profiler
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self, run_id: Optional[str] = None):
+        """Inicia uma nova execução, descartando as métricas anteriores."""
+        self.started_at = datetime.datetime.now()
+        self.finished_at = None
+        self.run_id = run_id or f'{self.started_at:%Y%m%d%H%M%S}'
+        self.stages = {}
+
+    @contextlib.contextmanager
+    def stage(self, stage: str, table: Optional[str] = None, rows: Optional[int] = 0, bytes: Optional[int] = 0) -> Iterator[Dict[str, int]]:
+        """Mede um estágio: `with metrics.stage('validate', 'orders') as sample: sample['rows'] = len(df)`.
+
+        Linhas e bytes podem ser informados na chamada ou preenchidos no dicionário entregue
+        pelo `with`, quando só são conhecidos ao fim do estágio. Falhas também são registradas.
+
+        Args:
+            stage (str): Nome do estágio (ex: um de PIPELINE_STAGES).
+            table (Optional[str]): Tabela processada (None para o estágio como um todo).
+            rows (Optional[int]): Linhas processadas.
+            bytes (Optional[int]): Bytes processados.
+        """
+        sample = {'rows': rows or 0, 'bytes': bytes or 0}
+        profiler = self._start_profiler(stage)
+
+        start_rss = current_rss_mb()
+        start_time = time.perf_counter()
+        start_cpu = time.thread_time()
+        try:
+            yield sample
+        finally:
+            seconds = time.perf_counter() - start_time
+            cpu_seconds = time.thread_time() - start_cpu
+            self._stop_profiler(profiler, stage, table)
+            self.record(
+                stage, table, seconds, sample['rows'], sample['bytes'], cpu_seconds, current_rss_mb() - start_rss
+            )
+
+    def iterate(self, stage: str, table: Optional[str], iterable: Iterable) -> Iterator:
+        """Repassa os itens de um iterador registrando o tempo de produção de cada um (ex: leitura em blocos).
+
+        Args:
+            stage (str): Nome do estágio.
+            table (Optional[str]): Tabela processada.
+            iterable (Iterable): Iterador cujos itens têm `len` (ex: `pd.read_csv(..., chunksize=...)`).
+
+        Returns:
+            Iterator: Os mesmos itens, na mesma ordem.
+        """
+        iterator = iter(iterable)
+        while True:
+            start_rss = current_rss_mb()
+            start_time = time.perf_counter()
+            start_cpu = time.thread_time()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            self.record(
+                stage, table, time.perf_counter() - start_time, len(item),
+                cpu_seconds=time.thread_time() - start_cpu, rss_delta_mb=current_rss_mb() - start_rss
+            )
+            yield item
+
+    def record(
+            self,
+            stage: str,
+            table: Optional[str],
+            seconds: float,
+            rows: Optional[int] = 0,
+            bytes: Optional[int] = 0,
+            cpu_seconds: Optional[float] = None,
+            rss_delta_mb: Optional[float] = None
+        ):
+        """Registra um estágio medido externamente (ex: estatísticas devolvidas pelo `insert_data`).
+
+        Args:
+            stage (str): Nome do estágio.
+            table (Optional[str]): Tabela processada.
+            seconds (float): Tempo de relógio.
+            rows (Optional[int]): Linhas processadas.
+            bytes (Optional[int]): Bytes processados.
+            cpu_seconds (Optional[float]): Tempo de CPU, se conhecido.
+            rss_delta_mb (Optional[float]): Crescimento da memória residente durante o estágio, se conhecido.
+        """
+        with self._lock:
+            metrics = self.stages.setdefault((stage, table), {
+                'seconds': 0.0, 'cpu_seconds': 0.0, 'rows': 0, 'bytes': 0, 'calls': 0, 'rss_delta_mb': 0.0
+            })
+            metrics['seconds'] += seconds
+            metrics['cpu_seconds'] += cpu_seconds or 0.0
+            metrics['rows'] += int(rows or 0)
+            metrics['bytes'] += int(bytes or 0)
+            metrics['calls'] += 1
+            metrics['rss_delta_mb'] = max(metrics['rss_delta_mb'], rss_delta_mb or 0.0)
+
+    def report(self) -> Dict[str, Any]:
+        """Relatório da execução: métricas por estágio e tabela, e os totais por estágio.
+
+        Returns:
+            Dict[str, Any]: {'run_id', 'started_at', 'finished_at', 'peak_rss_mb', 'stages', 'totals'}.
+        """
+        with self._lock:
+            stages = [
+                {'stage': stage, 'table': table, **metrics, 'rows_per_sec': self._rate(metrics)}
+                for (stage, table), metrics in self.stages.items()
+            ]
+
+        totals = {}
+        for entry in stages:
+            total = totals.setdefault(entry['stage'], {'seconds': 0.0, 'cpu_seconds': 0.0, 'rows': 0, 'bytes': 0})
+            for key in total:
+                total[key] += entry[key]
+        for total in totals.values():
+            total['rows_per_sec'] = self._rate(total)
+
+        return {
+            'run_id': self.run_id,
+            'started_at': self.started_at.isoformat(),
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'peak_rss_mb': peak_rss_mb(),
+            'stages': stages,
+            'totals': totals
+        }
+
+    def to_json(self, path: Optional[Union[str, Path]] = None) -> str:
+        """Serializa o relatório em JSON, gravando-o em `path` se informado."""
+        content = json.dumps(self.report(), indent=2, ensure_ascii=False)
+        if path:
+            Path(path).write_text(content, encoding='utf-8')
+        return content
+
+    def to_openmetrics(self, path: Optional[Union[str, Path]] = None) -> str:
+        """Serializa as métricas no formato texto do Prometheus/OpenMetrics, gravando-as em `path` se informado."""
+        stages = self.report()['stages']
+
+        lines = []
+        for field, (metric, description) in OPENMETRICS_FIELDS.items():
+            lines.append(f'# HELP {metric} {description}')
+            lines.append(f'# TYPE {metric} gauge')
+            for entry in stages:
+                labels = f'run_id="{self.run_id}",stage="{entry["stage"]}",table="{entry["table"] or ""}"'
+                lines.append(f'{metric}{{{labels}}} {entry[field]}')
+        lines.append('# EOF')
+
+        content = '\n'.join(lines) + '\n'
+        if path:
+            Path(path).write_text(content, encoding='utf-8')
+        return content
+
+    def finish(self) -> Dict[str, Any]:
+        """Encerra a execução: registra o resumo por estágio e grava os relatórios em `report_dir`.
+
+        Returns:
+            Dict[str, Any]: Relatório da execução (ver `report`).
+        """
+        self.finished_at = datetime.datetime.now()
+        report = self.report()
+
+        for stage, total in report['totals'].items():
+            logger.info(
+                f'Estágio {stage}: {total["seconds"]:.2f}s, {total["rows"]} linhas, '
+                f'{total["bytes"] / 1024 ** 2:.1f}MB ({total["rows_per_sec"]:.0f} linhas/s).'
+            )
+
+        if self.report_dir:
+            try:
+                self.report_dir.mkdir(parents=True, exist_ok=True)
+                self.to_json(self.report_dir / f'run_{self.run_id}.json')
+                self.to_openmetrics(self.report_dir / f'run_{self.run_id}.prom')
+                logger.info(f'Relatório de métricas salvo em: {self.report_dir}')
+            except OSError as e:
+                logger.warning(f'Erro ao salvar o relatório de métricas: {str(e)}')
+
+        return report
+
+    @staticmethod
+    def _rate(metrics: Dict[str, Any]) -> float:
+        return metrics['rows'] / metrics['seconds'] if metrics['seconds'] > 0 else 0.0
+
+    def _profiled(self, stage: str) -> bool:
+        if self.profile_stages is True:
+            return True
+        return bool(self.profile_stages) and stage in self.profile_stages
+
+    def _start_profiler(self, stage: str):
+        """Inicia o profiler do estágio, se habilitado.
+
+        Apenas um profiler pode estar ativo por vez no interpretador; estágios concorrentes ou
+        aninhados a um estágio já perfilado rodam sem profiler.
+        """
+        if not self._profiled(stage):
+            return None
+
+        if self.profiler == 'pyinstrument':
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                logger.warning('pyinstrument não instalado; usando cProfile.')
+            else:
+                profiler = Profiler()
+                profiler.start()
+                return profiler
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:
+            logger.warning(f'Profile de {stage} ignorado: {str(e)}')
+            return None
+        return profiler
+
+    def _stop_profiler(self, profiler, stage: str, table: Optional[str]):
+        """Encerra o profiler e grava o resultado (`.prof` do cProfile ou `.html` do pyinstrument)."""
+        if profiler is None:
+            return
+
+        profile_dir = (self.report_dir or Path('.')) / 'profiles'
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        base_name = f'{self.run_id}_{stage}_{table or "all"}_{threading.get_ident()}'
+
+        if isinstance(profiler, cProfile.Profile):
+            profiler.disable()
+            path = profile_dir / f'{base_name}.prof'
+            profiler.dump_stats(path)
+            top = pstats.Stats(profiler).sort_stats('cumulative')
+            logger.info(f'Profile de {stage} ({table or "todas"}) salvo em {path} ({top.total_tt:.2f}s perfilados).')
+        else:
+            profiler.stop()
+            path = profile_dir / f'{base_name}.html'
+            path.write_text(profiler.output_html(), encoding='utf-8')
+            logger.info(f'Profile de {stage} ({table or "todas"}) salvo em {path}.')
@@ -0,0 +1,149 @@
+import datetime
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from pathlib import PurePosixPath
+from typing import Any, Dict, List, Optional
+
+from src.parquet.profiles import parquet_profile, write_parquet
+
+PARTITION_GRANULARITIES = {
+    'day': ('created_date', 'D'),
+    'month': ('created_month', 'M')
+}
+
+PARTITION_SUCCESS_MARKER = '_SUCCESS'
+
+
+def partition_dataframe(
+        df: pd.DataFrame,
+        name: str,
+        granularity: Optional[str] = 'day',
+        schema: Optional[pa.Schema] = None,
+        profile: Optional[Dict[str, Any]] = None,
+        blob_suffix: Optional[str] = '',
+        prefix: Optional[str] = 'raw_data'
+    ) -> Dict[str, pa.Buffer]:
+    """Divide um DataFrame em um dataset Parquet particionado por `created_at` (layout Hive).
+
+    As linhas são ordenadas por `created_at` antes da escrita, de modo que as estatísticas
+    (min/max) de cada row group fiquem estreitas e permitam descartar row groups na leitura.
+
+    Args:
+        df (DataFrame): DataFrame validado.
+        name (str): Nome da tabela (ex: 'orders').
+        granularity (Optional[str]): 'day' ou 'month'.
+        schema (Optional[pa.Schema]): Schema Arrow explícito (mantém os tipos entre partições).
+        profile (Optional[Dict[str, Any]]): Perfil de escrita Parquet (padrão: `parquet_profile(name)`).
+        blob_suffix (Optional[str]): Sufixo do arquivo de cada partição (ex: carga incremental).
+        prefix (Optional[str]): Prefixo dos blobs.
+
+    Returns:
+        Dict[str, pa.Buffer]: Dicionário com {'raw_data/orders/created_date=2012-03-19/part.parquet': buffer}.
+    """
+    key, freq = PARTITION_GRANULARITIES[granularity]
+    profile = profile or parquet_profile(name)
+
+    df = df.sort_values('created_at', kind='stable')
+    periods = pd.to_datetime(df['created_at']).dt.to_period(freq)
+
+    partitions = {}
+    for period, part in df.groupby(periods, sort=True):
+        table = pa.Table.from_pandas(part, schema=schema, preserve_index=False)
+        partitions[f'{prefix}/{name}/{key}={period}/part{blob_suffix}.parquet'] = write_parquet(table, profile)
+
+    return partitions
+
+
+def partition_period(blob_name: str) -> Optional[pd.Period]:
+    """Extrai o período da partição a partir do caminho do blob (ex: 'created_date=2012-03-19').
+
+    Returns:
+        Optional[pd.Period]: Período da partição, ou None se o caminho não for particionado.
+    """
+    for part in PurePosixPath(blob_name).parts:
+        if '=' not in part:
+            continue
+
+        key, value = part.split('=', 1)
+        for granularity_key, freq in PARTITION_GRANULARITIES.values():
+            if key == granularity_key:
+                return pd.Period(value, freq=freq)
+    return None
+
+
+def select_row_groups(metadata: pq.FileMetaData, column: str, start: datetime.datetime, end: datetime.datetime) -> List[int]:
+    """Seleciona os row groups cujas estatísticas (min/max) de `column` cruzam o intervalo [start, end).
+
+    Row groups sem estatísticas são sempre selecionados.
+    """
+    column_index = metadata.schema.names.index(column)
+
+    selected = []
+    for i in range(metadata.num_row_groups):
+        statistics = metadata.row_group(i).column(column_index).statistics
+        if statistics is None or not statistics.has_min_max:
+            selected.append(i)
+            continue
+
+        if pd.Timestamp(statistics.min) < pd.Timestamp(end) and pd.Timestamp(statistics.max) >= pd.Timestamp(start):
+            selected.append(i)
+    return selected
+
+
+def read_partitioned(
+        storage,
+        name: str,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        columns: Optional[List[str]] = None,
+        prefix: Optional[str] = 'raw_data'
+    ) -> pd.DataFrame:
+    """Lê de um dataset particionado apenas as partições e row groups do intervalo [start, end).
+
+    Partições fora do intervalo não são baixadas; das partições selecionadas são lidos somente
+    o rodapé e os row groups cujas estatísticas de `created_at` cruzam o intervalo.
+
+    Args:
+        storage: Cliente de armazenamento com `list_blobs_file(prefix)` e `open_blob(blob_name)` (ex: AzureCloud).
+        name (str): Nome da tabela (ex: 'orders').
+        start (datetime): Início do intervalo (inclusivo).
+        end (datetime): Fim do intervalo (exclusivo).
+        columns (Optional[List[str]]): Colunas a serem lidas (todas se None).
+        prefix (Optional[str]): Prefixo dos blobs.
+
+    Returns:
+        DataFrame: Linhas com `start <= created_at < end`.
+    """
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    read_columns = None if columns is None else list(dict.fromkeys([*columns, 'created_at']))
+
+    tables = []
+    for blob_name in storage.list_blobs_file(prefix=f'{prefix}/{name}/'):
+        if not blob_name.endswith('.parquet'):
+            continue
+
+        period = partition_period(blob_name)
+        if period is not None and (period.start_time >= end or period.end_time < start):
+            continue
+
+        with storage.open_blob(blob_name) as source, pq.ParquetFile(source) as parquet_file:
+            row_groups = select_row_groups(parquet_file.metadata, 'created_at', start, end)
+            if not row_groups:
+                continue
+
+            table = parquet_file.read_row_groups(row_groups, columns=read_columns)
+        created_at = table.column('created_at')
+        mask = pc.and_(
+            pc.greater_equal(created_at, pa.scalar(start.to_pydatetime(), type=created_at.type)),
+            pc.less(created_at, pa.scalar(end.to_pydatetime(), type=created_at.type))
+        )
+        tables.append(table.filter(mask))
+
+    if not tables:
+        return pd.DataFrame(columns=columns)
+
+    df = pa.concat_tables(tables).to_pandas()
+    return df if columns is None else df[columns]
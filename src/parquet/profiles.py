@@ -0,0 +1,76 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from typing import Any, Dict, Optional
+
+PARQUET_CODECS = {
+    'none': {'compression': 'none', 'compression_level': None},
+    'snappy': {'compression': 'snappy', 'compression_level': None},
+    'zstd': {'compression': 'zstd', 'compression_level': 3},
+    'zstd_max': {'compression': 'zstd', 'compression_level': 19}
+}
+
+DICTIONARY_COLUMNS = {
+    'orders': ['primary_product_id', 'items_purchased', 'price_usd', 'cogs_usd'],
+    'order_items': ['product_id', 'is_primary_item', 'price_usd', 'cogs_usd'],
+    'order_item_refunds': [],
+    'products': ['product_name'],
+    'website_sessions': ['is_repeat_session', 'utm_source', 'utm_campaign', 'utm_content', 'device_type', 'http_referer'],
+    'website_pageviews': ['pageview_url']
+}
+
+DEFAULT_CODEC = 'zstd'
+DEFAULT_ROW_GROUP_SIZE = 128 * 1024
+
+
+def parquet_profile(
+        name: str,
+        codec: Optional[str] = DEFAULT_CODEC,
+        row_group_size: Optional[int] = DEFAULT_ROW_GROUP_SIZE,
+        dictionary: Optional[bool] = True
+    ) -> Dict[str, Any]:
+    """Monta o perfil de escrita Parquet de uma tabela (argumentos de `pq.write_table`).
+
+    Apenas as colunas de baixa cardinalidade listadas em DICTIONARY_COLUMNS usam dictionary
+    encoding; nas demais (chaves, timestamps) o dicionário só aumentaria o arquivo.
+
+    Args:
+        name (str): Nome da tabela (ex: 'website_sessions').
+        codec (Optional[str]): Chave de PARQUET_CODECS ('none', 'snappy', 'zstd' ou 'zstd_max').
+        row_group_size (Optional[int]): Quantidade máxima de linhas por row group.
+        dictionary (Optional[bool]): Se False, desativa o dictionary encoding em todas as colunas.
+
+    Returns:
+        Dict[str, Any]: Dicionário com {'compression', 'compression_level', 'use_dictionary', 'row_group_size'}.
+    """
+    if codec not in PARQUET_CODECS:
+        raise ValueError(f'Codec inválido: {codec}. Use um de {tuple(PARQUET_CODECS)}.')
+
+    return {
+        **PARQUET_CODECS[codec],
+        'use_dictionary': DICTIONARY_COLUMNS.get(name, True) if dictionary else False,
+        'row_group_size': row_group_size
+    }
+
+
+def writer_options(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Opções do perfil aceitas pelo `pq.ParquetWriter` (o tamanho do row group vai em cada `write_table`)."""
+    return {key: value for key, value in profile.items() if key != 'row_group_size'}
+
+
+def write_parquet(table: pa.Table, profile: Optional[Dict[str, Any]] = None) -> pa.Buffer:
+    """Serializa uma tabela Arrow em Parquet direto no buffer do pyarrow, sem cópia para `bytes`.
+
+    O buffer retornado pode ser enviado como arquivo (`pa.BufferReader(buffer)`), gravado em
+    disco ou usado com `hashlib`, pois implementa o buffer protocol.
+
+    Args:
+        table (pa.Table): Tabela a ser gravada.
+        profile (Optional[Dict[str, Any]]): Perfil de escrita (ver `parquet_profile`); padrões do pyarrow se None.
+
+    Returns:
+        pa.Buffer: Conteúdo do arquivo Parquet.
+    """
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, **(profile or {}))
+    return sink.getvalue()
@@ -0,0 +1,78 @@
+import copy
+import pyarrow as pa
+import pandera.pandas as pa_schema
+
+from typing import Iterable, List, Optional, Type
+
+ARROW_TYPES = {
+    'int64': pa.int64(),
+    'float64': pa.float64(),
+    'datetime64[ns]': pa.timestamp('ns'),
+    'str': pa.string()
+}
+
+DICTIONARY_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+
+def arrow_schema(model: Type[pa_schema.DataFrameModel], dictionary_columns: Optional[Iterable[str]] = None) -> pa.Schema:
+    """Gera o schema Arrow equivalente a um DataFrameModel do Pandera.
+
+    Um schema explícito garante que todos os blocos de um mesmo arquivo sejam
+    gravados com os mesmos tipos (ex: uma coluna de texto toda nula em um bloco).
+
+    Args:
+        model (Type[DataFrameModel]): Schema de validação (ex: OrderSchema).
+        dictionary_columns (Optional[Iterable[str]]): Colunas de texto com tipo dictionary
+            (category no pandas); colunas que não são de texto são ignoradas.
+
+    Returns:
+        pa.Schema: Schema Arrow com os tipos e a nulabilidade de cada coluna.
+    """
+    dictionary_columns = set(dictionary_columns or [])
+
+    fields = []
+    for name, column in model.to_schema().columns.items():
+        arrow_type = ARROW_TYPES[str(column.dtype)]
+        if name in dictionary_columns and arrow_type == pa.string():
+            arrow_type = DICTIONARY_TYPE
+        fields.append(pa.field(name, arrow_type, nullable=column.nullable))
+    return pa.schema(fields)
+
+
+def enumerated_columns(model: Type[pa_schema.DataFrameModel]) -> List[str]:
+    """Retorna as colunas de texto com domínio fechado (check `isin`), candidatas a dictionary/category."""
+    return [
+        name
+        for name, column in model.to_schema().columns.items()
+        if str(column.dtype) == 'str' and any(check.name == 'isin' for check in column.checks)
+    ]
+
+
+def typed_validation_schema(
+        model: Type[pa_schema.DataFrameModel],
+        dictionary_columns: Optional[Iterable[str]] = None
+    ) -> pa_schema.DataFrameSchema:
+    """Schema de validação para DataFrames já tipados pelo Arrow (ver `arrow_schema`).
+
+    Os tipos já chegam corretos da leitura, então a coerção é desativada e as colunas
+    dictionary são validadas como `category`; os checks do modelo são mantidos.
+
+    Args:
+        model (Type[DataFrameModel]): Schema de validação (ex: OrderSchema).
+        dictionary_columns (Optional[Iterable[str]]): Colunas lidas como dictionary.
+
+    Returns:
+        DataFrameSchema: Schema sem coerção.
+    """
+    # `to_schema()` devolve o schema em cache do modelo: a cópia evita alterar o modo pandas.
+    schema = copy.deepcopy(model.to_schema())
+    categorical = {
+        name: {'dtype': 'category'}
+        for name in dictionary_columns or []
+        if name in schema.columns and str(schema.columns[name].dtype) == 'str'
+    }
+    if categorical:
+        schema = schema.update_columns(categorical)
+
+    schema.coerce = False
+    return schema
@@ -0,0 +1,242 @@
+import numpy as np
+import pandas as pd
+import pandera.pandas as pa
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+FAILURE_CASE_COLUMNS = ['schema_context', 'column', 'check', 'check_number', 'failure_case', 'index']
+
+CHECK_MASKS: Dict[str, Callable[[pd.Series, Dict[str, Any]], np.ndarray]] = {
+    'greater_than': lambda values, stats: values > stats['min_value'],
+    'greater_than_or_equal_to': lambda values, stats: values >= stats['min_value'],
+    'less_than': lambda values, stats: values < stats['max_value'],
+    'less_than_or_equal_to': lambda values, stats: values <= stats['max_value'],
+    'equal_to': lambda values, stats: values == stats['value'],
+    'not_equal_to': lambda values, stats: values != stats['value'],
+    'in_range': lambda values, stats: (
+        (values >= stats['min_value'] if stats.get('include_min', True) else values > stats['min_value'])
+        & (values <= stats['max_value'] if stats.get('include_max', True) else values < stats['max_value'])
+    ),
+    'isin': lambda values, stats: values.isin(stats['allowed_values']),
+    'notin': lambda values, stats: ~values.isin(stats['forbidden_values'])
+}
+
+
+class FastValidationError(ValueError):
+    """Falha de validação do FastValidator.
+
+    `failure_cases` tem as mesmas colunas do `SchemaErrors.failure_cases` do Pandera.
+    """
+
+    def __init__(self, schema_name: str, failure_cases: pd.DataFrame):
+        self.schema_name = schema_name
+        self.failure_cases = failure_cases
+
+        summary = failure_cases.groupby(['column', 'check'], sort=False).size()
+        details = '\n'.join(f'  {column} - {check}: {count}' for (column, check), count in summary.items())
+        super().__init__(f'{schema_name}: {len(failure_cases)} falha(s) de validação.\n{details}')
+
+
+class FastValidator:
+    """Validador vetorizado compilado a partir de um DataFrameModel do Pandera.
+
+    Cada coluna vira uma sequência de operações de máscara NumPy/pandas (coerção, nulos,
+    checks de intervalo e domínio, unicidade por hash). O validador guarda as chaves já
+    vistas das colunas `unique=True`, então pode validar um arquivo bloco a bloco; as chaves
+    de um bloco só são registradas se o bloco inteiro for válido.
+    """
+
+    def __init__(self, model: Type[pa.DataFrameModel]):
+        """Inicializa a classe FastValidator.
+
+        Args:
+            model (Type[DataFrameModel]): Schema de validação (ex: OrderSchema).
+
+        Raises:
+            NotImplementedError: Se o modelo usar um check sem equivalente vetorizado.
+        """
+        schema = model.to_schema()
+
+        self.name = schema.name
+        self.strict = schema.strict
+        self.coerce = schema.coerce
+        self.columns = {}
+
+        for name, column in schema.columns.items():
+            checks = []
+            for number, check in enumerate(column.checks):
+                if check.name not in CHECK_MASKS:
+                    raise NotImplementedError(f'Check {check.name} de {self.name}.{name} não suportado pelo FastValidator.')
+                checks.append((number, check.error or check.name, CHECK_MASKS[check.name], check.statistics))
+
+            self.columns[name] = {
+                'dtype': str(column.dtype),
+                'nullable': column.nullable,
+                'unique': column.unique,
+                'checks': checks
+            }
+
+        self._seen = {name: [] for name, column in self.columns.items() if column['unique']}
+
+    def reset(self):
+        """Esquece as chaves vistas nos blocos anteriores."""
+        self._seen = {name: [] for name in self._seen}
+
+    def validate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Valida (e converte os tipos de) um DataFrame ou bloco.
+
+        Args:
+            df (DataFrame): DataFrame a ser validado.
+
+        Returns:
+            DataFrame: DataFrame com os tipos do schema.
+
+        Raises:
+            FastValidationError: Com todas as falhas encontradas (equivalente ao `lazy=True`).
+        """
+        failures = []
+
+        missing = [name for name in self.columns if name not in df.columns]
+        extra = [name for name in df.columns if name not in self.columns] if self.strict else []
+        for name in missing:
+            failures.append(self._schema_failure('column_in_dataframe', name))
+        for name in extra:
+            failures.append(self._schema_failure('column_in_schema', name))
+
+        coerced, seen = {}, {}
+        for name, column in self.columns.items():
+            if name not in df.columns:
+                continue
+
+            series, failed_coercion = self._coerce(df[name], column['dtype'])
+            if series is not df[name]:
+                coerced[name] = series
+            if failed_coercion is not None and failed_coercion.any():
+                failures.append(self._failures(name, f"coerce_dtype('{column['dtype']}')", None, df[name], failed_coercion))
+
+            # Colunas anuláveis, sem checks e sem unicidade não precisam da máscara de nulos.
+            if column['nullable'] and not column['checks'] and not column['unique']:
+                continue
+
+            is_null = series.isna().to_numpy()
+            valid = ~is_null
+            if failed_coercion is not None:
+                is_null &= ~failed_coercion
+            if not column['nullable'] and is_null.any():
+                failures.append(self._failures(name, 'not_nullable', None, series, is_null))
+
+            values = series[valid] if not valid.all() else series
+            for number, check_name, mask, statistics in column['checks']:
+                passed = np.asarray(mask(values, statistics), dtype=bool)
+                if not passed.all():
+                    failed = np.zeros(len(series), dtype=bool)
+                    failed[np.flatnonzero(valid)[~passed]] = True
+                    failures.append(self._failures(name, check_name, number, series, failed))
+
+            if column['unique']:
+                duplicated, seen[name] = self._duplicated(name, series, valid)
+                if duplicated.any():
+                    failures.append(self._failures(name, 'field_uniqueness', None, series, duplicated))
+
+        if failures:
+            raise FastValidationError(self.name, pd.concat(failures, ignore_index=True))
+
+        self._seen.update(seen)
+        return df.assign(**coerced) if coerced else df
+
+    def _coerce(self, series: pd.Series, dtype: str):
+        """Converte a coluna para o tipo do schema; retorna a coluna e a máscara de valores não convertidos."""
+        if not self.coerce or str(series.dtype) == dtype or isinstance(series.dtype, pd.CategoricalDtype):
+            return series, None
+
+        if dtype == 'str':
+            if pd.api.types.infer_dtype(series, skipna=True) in ('string', 'empty'):
+                return series, None
+            return series.where(series.isna(), series.astype(str)), None
+
+        if dtype == 'datetime64[ns]':
+            converted = pd.to_datetime(series, errors='coerce')
+        else:
+            converted = pd.to_numeric(series, errors='coerce')
+        failed = (converted.isna() & series.notna()).to_numpy()
+
+        if dtype == 'int64' and not converted.isna().any():
+            fractional = (converted % 1 != 0).to_numpy()
+            if fractional.any():
+                return series, fractional
+            converted = converted.astype('int64')
+        elif dtype == 'float64':
+            converted = converted.astype('float64')
+        return converted, failed
+
+    def _duplicated(self, name: str, series: pd.Series, valid: np.ndarray) -> Tuple[np.ndarray, List[np.ndarray]]:
+        """Marca as chaves repetidas no bloco ou já vistas em blocos anteriores.
+
+        Returns:
+            Tuple[np.ndarray, List[np.ndarray]]: (máscara de duplicadas, sequências de chaves vistas incluindo as do bloco).
+        """
+        duplicated = series.duplicated(keep=False).to_numpy() & valid
+
+        keys = series[valid].to_numpy()
+        if len(keys):
+            positions = np.flatnonzero(valid)
+            for run in self._seen[name]:
+                found = np.searchsorted(run, keys).clip(max=len(run) - 1)
+                duplicated[positions[run[found] == keys]] = True
+
+        # Chaves em ordem crescente (o caso comum) dispensam a ordenação.
+        if len(keys) < 2 or not np.all(keys[1:] > keys[:-1]):
+            keys = np.unique(keys)
+        return duplicated, self._push_run(self._seen[name], keys)
+
+    @staticmethod
+    def _push_run(runs: List[np.ndarray], keys: np.ndarray) -> List[np.ndarray]:
+        """Acrescenta as chaves (ordenadas) de um bloco às sequências de chaves vistas.
+
+        As sequências são intercaladas como um contador binário: uma sequência só é intercalada
+        com a anterior quando fica do mesmo tamanho ou maior, então há no máximo log2(N)
+        sequências e cada chave é copiada O(log N) vezes, em vez de a cada bloco.
+        """
+        runs = list(runs)
+        if not len(keys):
+            return runs
+
+        while runs and len(runs[-1]) <= len(keys):
+            previous = runs.pop()
+            keys = np.concatenate([previous, keys])
+            if previous[-1] > keys[len(previous)]:
+                keys = np.sort(keys, kind='mergesort')
+        runs.append(keys)
+        return runs
+
+    def _schema_failure(self, check: str, column: str) -> pd.DataFrame:
+        return pd.DataFrame([{
+            'schema_context': 'DataFrameSchema',
+            'column': self.name,
+            'check': check,
+            'check_number': None,
+            'failure_case': column,
+            'index': None
+        }], columns=FAILURE_CASE_COLUMNS, dtype=object)
+
+    @staticmethod
+    def _failures(
+            column: str,
+            check: str,
+            check_number: Optional[int],
+            series: pd.Series,
+            failed: np.ndarray
+        ) -> pd.DataFrame:
+        return pd.DataFrame({
+            'schema_context': 'Column',
+            'column': column,
+            'check': check,
+            'check_number': check_number,
+            'failure_case': series[failed].astype(object).to_numpy(),
+            'index': series.index[failed].to_numpy()
+        }, columns=FAILURE_CASE_COLUMNS, dtype=object)
+
+
+def compile_validators(models: Dict[str, Type[pa.DataFrameModel]]) -> Dict[str, FastValidator]:
+    """Compila um FastValidator por tabela (ex: `compile_validators(CSVDataSource().validation_schema)`)."""
+    return {name: FastValidator(model) for name, model in models.items()}
@@ -0,0 +1,86 @@
+import logging
+import pandas as pd
+
+from typing import Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FAILURE_REASONS_COLUMN = 'failure_reasons'
+
+
+class RejectThresholdError(ValueError):
+    """A taxa de linhas rejeitadas de uma tabela passou do limite configurado."""
+
+
+def split_rejects(df: pd.DataFrame, failure_cases: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Separa as linhas apontadas no relatório de falhas (`failure_cases` do Pandera ou do FastValidator).
+
+    Falhas sem índice (ex: coluna ausente) não apontam linhas e não são separadas.
+
+    Args:
+        df (DataFrame): DataFrame validado.
+        failure_cases (DataFrame): Relatório com as colunas 'column', 'check' e 'index'.
+
+    Returns:
+        Tuple[DataFrame, DataFrame]: (linhas restantes, linhas rejeitadas como texto + 'failure_reasons').
+    """
+    row_failures = failure_cases[failure_cases['index'].notna()]
+    reasons = (
+        (row_failures['column'].astype(str) + ': ' + row_failures['check'].astype(str))
+        .groupby(row_failures['index'].to_numpy())
+        .agg(lambda values: '; '.join(dict.fromkeys(values)))
+    )
+
+    rejected = df.index.isin(reasons.index)
+    rejects = df[rejected].astype(object)
+    rejects = rejects.apply(lambda column: column.map(lambda value: None if pd.isna(value) else str(value)))
+    rejects[FAILURE_REASONS_COLUMN] = reasons.reindex(rejects.index).to_numpy()
+
+    return df[~rejected], rejects.reset_index(drop=True)
+
+
+def validate_with_quarantine(
+        df: pd.DataFrame,
+        validate: Callable[[pd.DataFrame], pd.DataFrame],
+        max_reject_rate: Optional[float] = 0.0,
+        name: Optional[str] = ''
+    ) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+    """Valida um DataFrame separando as linhas inválidas em vez de rejeitar a tabela inteira.
+
+    Se a validação falhar, as linhas apontadas no relatório são separadas e o restante é
+    validado novamente (o que também devolve os tipos convertidos). Falhas que não apontam
+    linhas, ou que persistem após a separação, são relançadas.
+
+    Args:
+        df (DataFrame): DataFrame a ser validado.
+        validate (Callable[[DataFrame], DataFrame]): Função de validação (ex: `schema.validate`).
+        max_reject_rate (Optional[float]): Fração máxima de linhas rejeitadas (ex: 0.01 = 1%).
+        name (Optional[str]): Nome da tabela, para os logs.
+
+    Returns:
+        Tuple[DataFrame, Optional[DataFrame]]: (linhas válidas, linhas rejeitadas ou None).
+
+    Raises:
+        RejectThresholdError: Se a fração de linhas rejeitadas passar de `max_reject_rate`.
+    """
+    try:
+        return validate(df), None
+
+    except Exception as e:
+        failure_cases = getattr(e, 'failure_cases', None)
+        if failure_cases is None:
+            raise
+
+        remaining, rejects = split_rejects(df, failure_cases)
+        if rejects.empty:
+            raise
+
+        reject_rate = len(rejects) / len(df)
+        if reject_rate > max_reject_rate:
+            raise RejectThresholdError(
+                f'{name}: {len(rejects)} de {len(df)} linhas rejeitadas ({reject_rate:.3%}), '
+                f'acima do limite de {max_reject_rate:.3%}.'
+            ) from e
+
+        logger.warning(f'{name}: {len(rejects)} linha(s) em quarentena ({reject_rate:.3%}).')
+        return validate(remaining), rejects
@@ -0,0 +1,92 @@
+import pandas as pd
+import pandera.pandas as pa
+import pytest
+
+from src.schema.fast_validation import FastValidator, FastValidationError
+from src.schema.schema_validation import OrderSchema
+
+
+def orders(**overrides) -> pd.DataFrame:
+    df = pd.DataFrame({
+        'order_id': [1, 2, 3, 4, 5],
+        'created_at': ['2012-03-19 10:00:00'] * 5,
+        'website_session_id': [1, 2, 3, 4, 5],
+        'user_id': [1, 2, 3, 4, 5],
+        'primary_product_id': [1, 2, 3, 4, 1],
+        'items_purchased': [1, 1, 2, 1, 3],
+        'price_usd': [49.99, 29.99, 79.98, 59.99, 149.97],
+        'cogs_usd': [19.49, 9.49, 28.98, 22.49, 58.47]
+    })
+    for column, values in overrides.items():
+        df[column] = values
+    return df
+
+
+def pandera_failures(df: pd.DataFrame) -> pd.DataFrame:
+    with pytest.raises(pa.errors.SchemaErrors) as error:
+        OrderSchema.validate(df, lazy=True)
+    return error.value.failure_cases
+
+
+def fast_failures(df: pd.DataFrame) -> pd.DataFrame:
+    with pytest.raises(FastValidationError) as error:
+        FastValidator(OrderSchema).validate(df)
+    return error.value.failure_cases
+
+
+def row_failures(failure_cases: pd.DataFrame):
+    rows = failure_cases[failure_cases['index'].notna()]
+    return set(zip(rows['column'], rows['check'], rows['index'].astype(int)))
+
+
+def test_valid_frame_matches_pandera():
+    df = orders()
+
+    expected = OrderSchema.validate(df)
+    result = FastValidator(OrderSchema).validate(df)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('overrides', [
+    {'order_id': [1, 2, 2, -4, 5]},
+    {'website_session_id': [1, 0, 3, 4, 5], 'primary_product_id': [1, 2, 9, 4, 1]},
+    {'price_usd': [49.99, 0.0, 79.98, -1.0, 149.97]},
+    {'created_at': ['2012-03-19 10:00:00', 'x', '2012-03-19 10:00:00', '2012-03-19 10:00:00', None]},
+    {'user_id': [1, None, 3, 4, 5]}
+])
+def test_invalid_frame_flags_the_same_rows_as_pandera(overrides):
+    df = orders(**overrides)
+
+    expected = row_failures(pandera_failures(df))
+    result = row_failures(fast_failures(df))
+
+    assert {index for *_, index in result} == {index for *_, index in expected}
+    assert result <= expected
+
+
+def test_missing_and_extra_columns_are_schema_failures():
+    df = orders().drop(columns='cogs_usd').assign(extra=1)
+
+    failures = fast_failures(df)
+
+    assert set(zip(failures['check'], failures['failure_case'])) == {
+        ('column_in_dataframe', 'cogs_usd'),
+        ('column_in_schema', 'extra')
+    }
+    assert failures['index'].isna().all()
+
+
+def test_unique_keys_are_checked_across_chunks():
+    validator = FastValidator(OrderSchema)
+    validator.validate(orders())
+
+    with pytest.raises(FastValidationError) as error:
+        validator.validate(orders(order_id=[6, 7, 3, 8, 9]))
+    assert row_failures(error.value.failure_cases) == {('order_id', 'field_uniqueness', 2)}
+
+    # O bloco rejeitado não registra as suas chaves.
+    validator.validate(orders(order_id=[6, 7, 10, 8, 9]))
+
+    validator.reset()
+    validator.validate(orders())
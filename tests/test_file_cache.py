@@ -0,0 +1,63 @@
+import os
+
+from src.cache.file_cache import FileCache, clone_or_copy
+
+
+def test_get_requires_matching_tag(tmp_path):
+    cache = FileCache(tmp_path)
+    path = cache.put('raw_data/orders.parquet', '"etag-1"', b'v1')
+
+    assert cache.get('raw_data/orders.parquet', '"etag-1"') == path
+    assert path.read_bytes() == b'v1'
+    assert cache.get('raw_data/orders.parquet', '"etag-2"') is None
+    assert cache.get('raw_data/products.parquet', '"etag-1"') is None
+
+
+def test_put_with_new_tag_replaces_entry(tmp_path):
+    cache = FileCache(tmp_path)
+    cache.put('raw_data/orders.parquet', '"etag-1"', b'v1')
+    cache.put('raw_data/orders.parquet', '"etag-2"', b'v2')
+
+    assert cache.get('raw_data/orders.parquet', '"etag-1"') is None
+    assert cache.get('raw_data/orders.parquet', '"etag-2"').read_bytes() == b'v2'
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = FileCache(tmp_path, max_bytes=10)
+    cache.put('a', 't', b'aaaa')
+    cache.put('b', 't', b'bbbb')
+    cache.get('a', 't')
+
+    cache.put('c', 't', b'cccc')
+
+    assert cache.get('a', 't') is not None
+    assert cache.get('b', 't') is None
+    assert cache.get('c', 't') is not None
+    assert len(list(tmp_path.glob('*.tmp'))) == 0
+
+
+def test_manifest_survives_reopen_with_flushed_accesses(tmp_path):
+    cache = FileCache(tmp_path, max_bytes=10)
+    cache.put('a', 't', b'aaaa')
+    cache.put('b', 't', b'bbbb')
+    cache.get('a', 't')
+    cache.flush()
+
+    reopened = FileCache(tmp_path, max_bytes=10)
+    reopened.put('c', 't', b'cccc')
+
+    assert reopened.get('a', 't') is not None
+    assert reopened.get('b', 't') is None
+
+
+def test_clone_or_copy_does_not_share_the_cached_file(tmp_path):
+    cache = FileCache(tmp_path / 'cache')
+    cached = cache.put('raw_data/orders.parquet', 't', b'cached')
+    target = tmp_path / 'orders.parquet'
+
+    clone_or_copy(cached, target)
+    with open(target, 'ab') as file:
+        file.write(b' + local edit')
+
+    assert cached.read_bytes() == b'cached'
+    assert os.stat(cached).st_ino != os.stat(target).st_ino
@@ -0,0 +1,81 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.cloud.memory_storage import MemoryStorage
+from src.data_source.lake_loader import LakeLoader, blob_load_stamp, lake_blobs
+from src.database.db_connection import DBConnection
+from src.parquet.profiles import write_parquet
+
+BLOB_NAMES = [
+    'raw_data/orders.parquet',
+    'raw_data/orders_20240201000000.parquet',
+    'raw_data/orders_20240101000000.parquet',
+    'raw_data/order_items.parquet',
+    'raw_data/orders/created_date=2012-03-20/part.parquet',
+    'raw_data/orders/created_date=2012-03-19/part.parquet',
+    'raw_data/orders/created_date=2012-03-19/part_20240101000000.parquet',
+    'raw_data/orders/_SUCCESS',
+    'raw_data/orders/_SUCCESS_20240101000000',
+    'raw_data/orders_backup.parquet',
+    'quarantine/orders/rejects_20240101000000.parquet'
+]
+
+
+def test_lake_blobs_selects_full_load_files():
+    assert lake_blobs(BLOB_NAMES, 'orders') == [
+        'raw_data/orders.parquet',
+        'raw_data/orders/created_date=2012-03-19/part.parquet',
+        'raw_data/orders/created_date=2012-03-20/part.parquet'
+    ]
+    assert lake_blobs(BLOB_NAMES, 'order_items') == ['raw_data/order_items.parquet']
+
+
+def test_lake_blobs_orders_incremental_files_by_load_time():
+    assert lake_blobs(BLOB_NAMES, 'orders', include_incremental=True) == [
+        'raw_data/orders.parquet',
+        'raw_data/orders/created_date=2012-03-19/part.parquet',
+        'raw_data/orders/created_date=2012-03-20/part.parquet',
+        'raw_data/orders/created_date=2012-03-19/part_20240101000000.parquet',
+        'raw_data/orders_20240101000000.parquet',
+        'raw_data/orders_20240201000000.parquet'
+    ]
+
+
+def test_lake_blobs_respects_prefix():
+    assert lake_blobs(BLOB_NAMES, 'orders', prefix='quarantine') == []
+    assert lake_blobs(['lake/products.parquet'], 'products', prefix='lake') == ['lake/products.parquet']
+
+
+def test_blob_load_stamp():
+    assert blob_load_stamp('raw_data/orders_20240101000000.parquet') == '_20240101000000'
+    assert blob_load_stamp('raw_data/orders/created_date=2012-03-19/part.parquet') == ''
+
+
+@pytest.fixture
+def loader():
+    storage = MemoryStorage()
+    blobs = {
+        'raw_data/orders.parquet': {'order_id': [1, 2, 3], 'price_usd': [10.0, 10.0, 10.0]},
+        'raw_data/orders_20240101000000.parquet': {'order_id': [3, 4], 'price_usd': [20.0, 20.0]},
+        'raw_data/orders_20240201000000.parquet': {'order_id': [4, 5], 'price_usd': [30.0, 30.0]}
+    }
+    for blob_name, data in blobs.items():
+        storage.upload_data(blob_name, write_parquet(pa.Table.from_pandas(pd.DataFrame(data))).to_pybytes())
+    return LakeLoader(azure_cloud=storage, db_conn=DBConnection(url='sqlite://'), batch_size=2)
+
+
+def test_latest_batches_keep_the_last_version_of_each_key(loader):
+    blob_names = lake_blobs(loader.azure_cloud.list_blobs_file('raw_data/'), 'orders', include_incremental=True)
+
+    df = pd.concat(batch for _, batch in loader.iter_batches({'orders': blob_names}, latest_only=True))
+
+    assert df.sort_values('order_id').values.tolist() == [[1, 10.0], [2, 10.0], [3, 20.0], [4, 30.0], [5, 30.0]]
+
+
+def test_batches_without_dedup_return_every_row(loader):
+    blob_names = lake_blobs(loader.azure_cloud.list_blobs_file('raw_data/'), 'orders', include_incremental=True)
+
+    df = pd.concat(batch for _, batch in loader.iter_batches({'orders': blob_names}))
+
+    assert df['order_id'].tolist() == [1, 2, 3, 3, 4, 4, 5]
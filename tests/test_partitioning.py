@@ -0,0 +1,75 @@
+import io
+import datetime
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.cloud.memory_storage import MemoryStorage
+from src.parquet.partitioning import (
+    partition_dataframe,
+    partition_period,
+    read_partitioned,
+    select_row_groups
+)
+
+
+def orders(days: int, rows_per_day: int = 4) -> pd.DataFrame:
+    created_at = pd.date_range('2012-03-19', periods=days * rows_per_day, freq=f'{24 // rows_per_day}h')
+    return pd.DataFrame({'order_id': range(1, len(created_at) + 1), 'created_at': created_at})
+
+
+def parquet_metadata(df: pd.DataFrame, row_group_size: int) -> pq.FileMetaData:
+    buffer = io.BytesIO()
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), buffer, row_group_size=row_group_size)
+    return pq.ParquetFile(io.BytesIO(buffer.getvalue())).metadata
+
+
+def test_select_row_groups_prunes_by_statistics():
+    metadata = parquet_metadata(orders(days=5), row_group_size=4)
+
+    assert metadata.num_row_groups == 5
+    assert select_row_groups(
+        metadata, 'created_at', datetime.datetime(2012, 3, 20), datetime.datetime(2012, 3, 22)
+    ) == [1, 2]
+    assert select_row_groups(
+        metadata, 'created_at', datetime.datetime(2012, 3, 20, 12), datetime.datetime(2012, 3, 20, 13)
+    ) == [1]
+    assert select_row_groups(
+        metadata, 'created_at', datetime.datetime(2013, 1, 1), datetime.datetime(2013, 2, 1)
+    ) == []
+
+
+def test_select_row_groups_end_is_exclusive():
+    metadata = parquet_metadata(orders(days=2), row_group_size=4)
+
+    assert select_row_groups(
+        metadata, 'created_at', datetime.datetime(2012, 3, 19), datetime.datetime(2012, 3, 20)
+    ) == [0]
+
+
+def test_partition_dataframe_writes_one_blob_per_period():
+    partitions = partition_dataframe(orders(days=3).sample(frac=1, random_state=0), 'orders', granularity='day')
+
+    assert sorted(partitions) == [
+        'raw_data/orders/created_date=2012-03-19/part.parquet',
+        'raw_data/orders/created_date=2012-03-20/part.parquet',
+        'raw_data/orders/created_date=2012-03-21/part.parquet'
+    ]
+    assert partition_period('raw_data/orders/created_date=2012-03-20/part.parquet') == pd.Period('2012-03-20', 'D')
+    assert partition_period('raw_data/orders.parquet') is None
+
+    first_day = pq.read_table(pa.BufferReader(partitions['raw_data/orders/created_date=2012-03-19/part.parquet']))
+    assert first_day.column('created_at').to_pandas().is_monotonic_increasing
+
+
+def test_read_partitioned_returns_only_the_interval():
+    storage = MemoryStorage()
+    for blob_name, data in partition_dataframe(orders(days=3), 'orders', granularity='day').items():
+        storage.upload_data(blob_name, data.to_pybytes())
+
+    df = read_partitioned(
+        storage, 'orders', datetime.datetime(2012, 3, 20, 6), datetime.datetime(2012, 3, 21, 6), columns=['order_id']
+    )
+
+    assert df.columns.tolist() == ['order_id']
+    assert df['order_id'].tolist() == [6, 7, 8, 9]
@@ -0,0 +1,110 @@
+import struct
+import datetime
+import numpy as np
+import pandas as pd
+import pytest
+
+from sqlalchemy import MetaData, Table, Column, BigInteger, Integer, Float, DateTime, String
+
+from src.database.pg_copy import (
+    PG_COPY_HEADER,
+    binary_column_order,
+    copy_columns,
+    iter_binary_chunks
+)
+
+PG_EPOCH = datetime.datetime(2000, 1, 1)
+
+
+@pytest.fixture
+def table():
+    return Table(
+        'raw_test',
+        MetaData(),
+        Column('id', BigInteger, primary_key=True),
+        Column('quantity', Integer),
+        Column('price', Float),
+        Column('created_at', DateTime),
+        Column('name', String(50))
+    )
+
+
+def decode_binary_copy(data: bytes, formats):
+    """Decodifica um COPY binário do PostgreSQL em uma lista de linhas (bytes brutos por campo)."""
+    assert data.startswith(PG_COPY_HEADER)
+    position = len(PG_COPY_HEADER)
+
+    rows = []
+    while True:
+        (field_count,) = struct.unpack_from('>h', data, position)
+        position += 2
+        if field_count == -1:
+            break
+
+        row = []
+        for field_format in formats[:field_count]:
+            (length,) = struct.unpack_from('>i', data, position)
+            position += 4
+            if length == -1:
+                row.append(None)
+                continue
+            raw = data[position:position + length]
+            position += length
+            row.append(raw.decode('utf-8') if field_format is None else struct.unpack(field_format, raw)[0])
+        rows.append(row)
+
+    assert position == len(data)
+    return rows
+
+
+def encode(df, table, chunk_size=2):
+    columns = binary_column_order(df, table, copy_columns(table, df))
+    return columns, b''.join(iter_binary_chunks(df, table, columns, chunk_size))
+
+
+def micros(value: str) -> int:
+    return (datetime.datetime.fromisoformat(value) - PG_EPOCH) // datetime.timedelta(microseconds=1)
+
+
+def test_binary_copy_decodes_to_original_values(table):
+    df = pd.DataFrame({
+        'id': [1, 2, 3],
+        'quantity': [10, -20, 30],
+        'price': [1.5, 2.25, 3.0],
+        'created_at': pd.to_datetime(['2012-03-19 10:00:00', '1999-12-31 23:59:59.500000', '2024-01-01 00:00:00'], format='ISO8601'),
+        'name': ['a', None, 'ç']
+    })
+
+    columns, data = encode(df, table)
+
+    assert columns == ['id', 'quantity', 'price', 'created_at', 'name']
+    assert decode_binary_copy(data, ['>q', '>i', '>d', '>q', None]) == [
+        [1, 10, 1.5, micros('2012-03-19T10:00:00'), 'a'],
+        [2, -20, 2.25, micros('1999-12-31T23:59:59.500000'), None],
+        [3, 30, 3.0, micros('2024-01-01T00:00:00'), 'ç']
+    ]
+
+
+def test_binary_copy_encodes_nulls_in_fixed_width_columns(table):
+    df = pd.DataFrame({'id': [1, 2], 'price': [np.nan, 4.5]})
+
+    columns, data = encode(df, table)
+
+    assert columns == ['id', 'price']
+    assert decode_binary_copy(data, ['>q', '>d']) == [[1, None], [2, 4.5]]
+
+
+def test_binary_copy_normalises_tz_aware_datetimes_to_utc(table):
+    created_at = pd.Series(pd.to_datetime(['2012-03-19 07:00:00'])).dt.tz_localize('America/Sao_Paulo')
+    df = pd.DataFrame({'id': [1], 'created_at': created_at})
+
+    _, data = encode(df, table)
+
+    assert decode_binary_copy(data, ['>q', '>q']) == [[1, micros('2012-03-19T10:00:00')]]
+
+
+def test_binary_copy_rejects_integers_out_of_range(table):
+    df = pd.DataFrame({'id': [1, 2], 'quantity': [1, 2 ** 31]})
+
+    with pytest.raises(ValueError, match='quantity'):
+        encode(df, table)
@@ -0,0 +1,81 @@
+import functools
+import pandas as pd
+import pytest
+
+from src.schema.fast_validation import FastValidator
+from src.schema.quarantine import FAILURE_REASONS_COLUMN, RejectThresholdError, split_rejects, validate_with_quarantine
+from src.schema.schema_validation import OrderItemRefundSchema
+
+
+def refunds(**overrides) -> pd.DataFrame:
+    df = pd.DataFrame({
+        'order_item_refund_id': [1, 2, 3, 4],
+        'created_at': ['2012-04-06 11:32:43'] * 4,
+        'order_item_id': [57, 82, 106, 140],
+        'order_id': [57, 82, 106, 140],
+        'refund_amount_usd': [49.99, 49.99, 49.99, 49.99]
+    })
+    for column, values in overrides.items():
+        df[column] = values
+    return df
+
+
+VALIDATORS = {
+    'pandera': lambda: functools.partial(OrderItemRefundSchema.validate, lazy=True),
+    'fast': lambda: FastValidator(OrderItemRefundSchema).validate
+}
+
+
+def test_split_rejects_separates_rows_with_reasons():
+    df = refunds()
+    failure_cases = pd.DataFrame({
+        'column': ['order_id', 'refund_amount_usd', 'order_id', 'refunds'],
+        'check': ['greater_than_or_equal_to(0)', 'greater_than(0)', 'greater_than_or_equal_to(0)', 'column_in_schema'],
+        'index': [1, 1, 3, None]
+    })
+
+    remaining, rejects = split_rejects(df, failure_cases)
+
+    assert remaining['order_item_refund_id'].tolist() == [1, 3]
+    assert rejects['order_item_refund_id'].tolist() == ['2', '4']
+    assert rejects[FAILURE_REASONS_COLUMN].tolist() == [
+        'order_id: greater_than_or_equal_to(0); refund_amount_usd: greater_than(0)',
+        'order_id: greater_than_or_equal_to(0)'
+    ]
+
+
+@pytest.mark.parametrize('engine', VALIDATORS)
+def test_quarantine_keeps_valid_rows(engine):
+    df = refunds(refund_amount_usd=[49.99, -1.0, 49.99, 49.99])
+
+    valid, rejects = validate_with_quarantine(df, VALIDATORS[engine](), max_reject_rate=0.5, name='refunds')
+
+    assert valid['order_item_refund_id'].tolist() == [1, 3, 4]
+    assert str(valid['created_at'].dtype) == 'datetime64[ns]'
+    assert rejects['order_item_refund_id'].tolist() == ['2']
+    assert rejects[FAILURE_REASONS_COLUMN].str.startswith('refund_amount_usd').all()
+
+
+@pytest.mark.parametrize('engine', VALIDATORS)
+def test_quarantine_returns_no_rejects_for_valid_frame(engine):
+    valid, rejects = validate_with_quarantine(refunds(), VALIDATORS[engine]())
+
+    assert len(valid) == 4
+    assert rejects is None
+
+
+@pytest.mark.parametrize('engine', VALIDATORS)
+def test_quarantine_raises_above_threshold(engine):
+    df = refunds(refund_amount_usd=[49.99, -1.0, 0.0, 49.99])
+
+    with pytest.raises(RejectThresholdError, match='2 de 4 linhas'):
+        validate_with_quarantine(df, VALIDATORS[engine](), max_reject_rate=0.25, name='refunds')
+
+
+@pytest.mark.parametrize('engine', VALIDATORS)
+def test_quarantine_reraises_failures_without_rows(engine):
+    df = refunds().drop(columns='order_id')
+
+    with pytest.raises(Exception) as error:
+        validate_with_quarantine(df, VALIDATORS[engine](), max_reject_rate=1.0)
+    assert not isinstance(error.value, RejectThresholdError)
@@ -0,0 +1,76 @@
+import io
+import pytest
+
+from src.cloud.local_storage import LocalStorage
+from src.cloud.memory_storage import MemoryStorage
+
+
+@pytest.fixture(params=['memory', 'local'])
+def storage(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryStorage()
+    return LocalStorage(root=tmp_path / 'lake')
+
+
+def test_round_trip(storage, tmp_path):
+    etag = storage.upload_data('raw_data/orders.parquet', b'parquet bytes', metadata={'source_sha256': 'abc'})
+
+    assert storage.download_data('raw_data/orders.parquet') == b'parquet bytes'
+    assert storage.get_blob_metadata('raw_data/orders.parquet') == {'source_sha256': 'abc'}
+    assert storage.list_blobs_properties('raw_data/') == {'raw_data/orders.parquet': etag}
+    assert storage.list_blobs_file('raw_data/') == ['raw_data/orders.parquet']
+
+    with storage.open_blob('raw_data/orders.parquet') as blob:
+        blob.seek(8)
+        assert blob.read() == b'bytes'
+
+    sink = tmp_path / 'download.parquet'
+    assert storage.download_to_file('raw_data/orders.parquet', sink) == len(b'parquet bytes')
+    assert sink.read_bytes() == b'parquet bytes'
+
+
+def test_upload_from_stream(storage):
+    storage.upload_data('raw_data/products.parquet', io.BytesIO(b'streamed'))
+
+    assert storage.download_data('raw_data/products.parquet') == b'streamed'
+
+
+def test_etag_changes_on_every_write(storage):
+    first = storage.upload_data('raw_data/orders.parquet', b'same content')
+    second = storage.upload_data('raw_data/orders.parquet', b'same content')
+
+    assert first != second
+    assert storage.list_blobs_properties('raw_data/')['raw_data/orders.parquet'] == second
+
+
+def test_delete_blob_ignores_missing(storage):
+    storage.upload_data('raw_data/orders.parquet', b'x', metadata={'k': 'v'})
+
+    storage.delete_blob('raw_data/orders.parquet')
+    storage.delete_blob('raw_data/orders.parquet')
+
+    assert storage.list_blobs_file('raw_data/') == []
+    assert storage.get_blob_metadata('raw_data/orders.parquet') == {}
+    with pytest.raises(FileNotFoundError):
+        storage.download_data('raw_data/orders.parquet')
+
+
+def test_upload_many_and_download_many_report_stats(storage, tmp_path):
+    items = {
+        'raw_data/orders.parquet': b'o' * 100,
+        'raw_data/products.parquet': io.BytesIO(b'p' * 50)
+    }
+
+    uploaded = storage.upload_many(items)
+    downloaded = storage.download_many(list(items), tmp_path / 'downloads')
+
+    assert {name: stats['bytes'] for name, stats in uploaded.items()} == {
+        'raw_data/orders.parquet': 100,
+        'raw_data/products.parquet': 50
+    }
+    assert all(stats['etag'] for stats in uploaded.values())
+    assert {name: stats['bytes'] for name, stats in downloaded.items()} == {
+        'raw_data/orders.parquet': 100,
+        'raw_data/products.parquet': 50
+    }
+    assert (tmp_path / 'downloads' / 'raw_data' / 'products.parquet').read_bytes() == b'p' * 50
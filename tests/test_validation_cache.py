@@ -0,0 +1,25 @@
+import pandas as pd
+
+from src.cache.validation_cache import ValidationCache
+from src.schema.schema_validation import ProductSchema
+
+
+def test_validation_cache_tag_changes_with_file_and_settings(tmp_path):
+    source = tmp_path / 'products.csv'
+    source.write_text('product_id,created_at,product_name\n1,2012-03-19 08:00:00,Mr. Fuzzy\n')
+    cache = ValidationCache(tmp_path / 'cache', content_hash=True)
+
+    tag = cache.tag(source, ProductSchema)
+    assert cache.tag(source, ProductSchema) == tag
+    assert cache.tag(source, ProductSchema, engine='arrow') != tag
+    assert cache.tag(source, ProductSchema, validation_engine='fast') != tag
+    assert cache.tag(source, ProductSchema, reject_threshold=0.01) != tag
+
+    df = ProductSchema.validate(pd.read_csv(source))
+    cache.put(source, tag, df)
+    pd.testing.assert_frame_equal(cache.get(source, tag).to_pandas(), df)
+
+    source.write_text('product_id,created_at,product_name\n2,2012-03-19 08:00:00,Mr. Fuzzy\n')
+    new_tag = cache.tag(source, ProductSchema)
+    assert new_tag != tag
+    assert cache.get(source, new_tag) is None